@@ -0,0 +1,81 @@
+// Moves days and records embedded in `db.users` documents into their own
+// `db.days` and `db.records` collections.
+//
+// The script can be run while the service is up and is safe to rerun:
+// existing documents in the new collections are never overwritten, and each
+// user is migrated in its own transaction.
+
+const batchSize = 100;
+
+const aquaDB = db.getSiblingDB("db");
+
+const createIndexes = () => {
+    aquaDB.days.createIndex({user_id: 1, date: 1}, {unique: true});
+    aquaDB.records.createIndex({user_id: 1, recording_time: -1});
+}
+
+const dayUpsertOf = (user, day) => ({
+    updateOne: {
+        filter: {user_id: user._id, date: day.date},
+        update: {$setOnInsert: {...day, user_id: user._id}},
+        upsert: true,
+    },
+});
+
+const recordUpsertOf = (user, record) => ({
+    updateOne: {
+        filter: {_id: record._id},
+        update: {$setOnInsert: {...record, user_id: user._id}},
+        upsert: true,
+    },
+});
+
+const migrateUser = user => {
+    const session = db.getMongo().startSession();
+
+    try {
+        session.withTransaction(() => {
+            const sessionDB = session.getDatabase("db");
+            const days = user.days ?? [];
+            const records = user.records ?? [];
+
+            if (days.length !== 0)
+                sessionDB.days.bulkWrite(days.map(day => dayUpsertOf(user, day)));
+
+            if (records.length !== 0)
+                sessionDB.records.bulkWrite(
+                    records.map(record => recordUpsertOf(user, record))
+                );
+
+            sessionDB.users.updateOne(
+                {_id: user._id},
+                {$unset: {days: "", records: ""}},
+            );
+        });
+    } finally {
+        session.endSession();
+    }
+}
+
+const migrateUsers = () => {
+    const embeddingFilter = {
+        $or: [{days: {$exists: true}}, {records: {$exists: true}}],
+    };
+    let migratedUserCount = 0;
+
+    while (true) {
+        const users = aquaDB.users
+            .find(embeddingFilter, {days: 1, records: 1})
+            .limit(batchSize)
+            .toArray();
+
+        if (users.length === 0)
+            return migratedUserCount;
+
+        users.forEach(migrateUser);
+        migratedUserCount += users.length;
+    }
+}
+
+createIndexes();
+console.log(`migrated users: ${migrateUsers()}`);
@@ -53,29 +53,32 @@ async def cancel_record[UsersT: repos.Users, ViewT](
     ]
 ]:
     async with transaction_for(users):
-        user = await users.user_with_id(user_id)
+        user = await users.user_with_id_and_record(user_id, record_id=record_id)
 
-        if not user:
-            yield Err(NoUserError())
-            return
+        if user:
+            effect = SearchableEffect()
+            result = user.cancel_record(record_id=record_id, effect=effect)
 
-        effect = SearchableEffect()
-        result = user.cancel_record(record_id=record_id, effect=effect)
+            match result:
+                case Err(
+                    Env(RecordContext(record), NoRecordDayToCancelError())
+                ):
+                    await logger.log_record_without_day(record)
 
-        match result:
-            case Err(Env(RecordContext(record), NoRecordDayToCancelError())):
-                await logger.log_record_without_day(record)
-
-        await result.map_async(
-            lambda _: output_effect(
-                effect,
-                user_mapper=user_mapper_to(users),
-                day_mapper=day_mapper_to(users),
-                record_mapper=record_mapper_to(users),
-                logger=logger,
+            await result.map_async(
+                lambda _: output_effect(
+                    effect,
+                    user_mapper=user_mapper_to(users),
+                    day_mapper=day_mapper_to(users),
+                    record_mapper=record_mapper_to(users),
+                    logger=logger,
+                )
             )
-        )
 
-        yield result.map(
-            lambda output: view_of(user=user, output=output)
-        ).map_err(lambda env: env.value)
+    if not user:
+        yield Err(NoUserError())
+        return
+
+    yield result.map(lambda output: view_of(user=user, output=output)).map_err(
+        lambda env: env.value
+    )
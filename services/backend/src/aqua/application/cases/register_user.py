@@ -117,7 +117,7 @@ async def register_user[UsersT: repos.Users, ViewT](
             return
 
         user_result = User.translated_from(
-            AccessUser(id=user_id, events=list()),
+            AccessUser(id=user_id),
             weight=weight,
             glass=glass,
             target=target,
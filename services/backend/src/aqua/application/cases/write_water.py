@@ -1,6 +1,7 @@
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import partial
 from typing import AsyncIterator
 from uuid import UUID
 
@@ -13,8 +14,12 @@ from aqua.application.ports.mappers import (
     RecordMapperTo,
     UserMapperTo,
 )
-from aqua.application.ports.transactions import TransactionFor
+from aqua.application.ports.transactions import (
+    TransactionConflictError,
+    TransactionFor,
+)
 from aqua.domain.framework.effects.searchable import SearchableEffect
+from aqua.domain.model.core.aggregates.user.root import User, WritingOutput
 from aqua.domain.model.primitives.vos.time import Time
 from aqua.domain.model.primitives.vos.water import (
     NegativeWaterAmountError,
@@ -26,6 +31,9 @@ from aqua.domain.model.primitives.vos.water import (
 class NoUserError: ...
 
 
+_max_attempt_count = 3
+
+
 @asynccontextmanager
 async def write_water[UsersT: repos.Users, ViewT](
     user_id: UUID,
@@ -51,12 +59,53 @@ async def write_water[UsersT: repos.Users, ViewT](
                 yield result
                 return
 
+    write = partial(
+        _write_water,
+        water,
+        user_id=user_id,
+        current_time=current_time,
+        users=users,
+        transaction_for=transaction_for,
+        logger=logger,
+        user_mapper_to=user_mapper_to,
+        day_mapper_to=day_mapper_to,
+        record_mapper_to=record_mapper_to,
+    )
+
+    for _ in range(_max_attempt_count - 1):
+        with suppress(TransactionConflictError):
+            writing = await write()
+            break
+    else:
+        writing = await write()
+
+    if writing is None:
+        yield Err(NoUserError())
+        return
+
+    user, output = writing
+    yield Ok(view_of(user=user, output=output))
+
+
+async def _write_water[UsersT: repos.Users](
+    water: Water | None,
+    *,
+    user_id: UUID,
+    current_time: Time,
+    users: UsersT,
+    transaction_for: TransactionFor[UsersT],
+    logger: loggers.Logger,
+    user_mapper_to: UserMapperTo[UsersT],
+    day_mapper_to: DayMapperTo[UsersT],
+    record_mapper_to: RecordMapperTo[UsersT],
+) -> tuple[User, WritingOutput] | None:
     async with transaction_for(users):
-        user = await users.user_with_id(user_id)
+        user = await users.user_with_id_and_day(
+            user_id, date_=current_time.datetime_.date()
+        )
 
         if user is None:
-            yield Err(NoUserError())
-            return
+            return None
 
         effect = SearchableEffect()
         output = user.write_water(
@@ -71,4 +120,4 @@ async def write_water[UsersT: repos.Users, ViewT](
             logger=logger,
         )
 
-        yield Ok(view_of(user=user, output=output))
+    return user, output
@@ -1,3 +1,4 @@
+from aqua.application.output import changes as changes
 from aqua.application.output import log_effect as log_effect
 from aqua.application.output import map_effect as map_effect
 from aqua.application.output import output_effect as output_effect
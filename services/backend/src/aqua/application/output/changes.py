@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+from aqua.domain.framework.effects.searchable import ChangeSet, SearchableEffect
+from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
+from aqua.domain.model.core.aggregates.user.internal.entities.record import (
+    Record,
+)
+from aqua.domain.model.core.aggregates.user.root import User
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Changes:
+    users: ChangeSet[User]
+    days: ChangeSet[Day]
+    records: ChangeSet[Record]
+
+
+def changes_of(effect: SearchableEffect) -> Changes:
+    return Changes(
+        users=effect.change_set_of(User),
+        days=effect.change_set_of(Day),
+        records=effect.change_set_of(Record),
+    )
@@ -1,40 +1,23 @@
+from aqua.application.output.changes import Changes
 from aqua.application.ports.loggers import Logger
-from aqua.domain.framework.effects.searchable import SearchableEffect
-from aqua.domain.framework.entity import Created, Mutated
-from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
     Cancelled,
-    Record,
 )
-from aqua.domain.model.core.aggregates.user.root import (
-    TranslatedFromAccess,
-    User,
-)
-
-
-async def log_effect(effect: SearchableEffect, logger: Logger) -> None:
-    translated_users = effect.entities_that(User).with_event(
-        TranslatedFromAccess
-    )
 
-    days = effect.entities_that(Day)
-    created_days = days.with_event(Created)
-    mutated_days = days.with_event(Mutated).without_event(Created)
 
-    records = effect.entities_that(Record)
-    created_records = records.with_event(Created)
-    cancelled_records = records.with_event(Cancelled).without_event(Created)
+async def log_effect(changes: Changes, logger: Logger) -> None:
+    cancelled_records = changes.records.mutated.with_event(Cancelled)
 
-    for translated_user in translated_users:
+    for translated_user in changes.users.translated:
         await logger.log_registered_user(translated_user)
 
-    for created_day in created_days:
+    for created_day in changes.days.created:
         await logger.log_new_day(created_day)
 
-    for mutated_day in mutated_days:
+    for mutated_day in changes.days.mutated:
         await logger.log_new_day_state(mutated_day)
 
-    for created_record in created_records:
+    for created_record in changes.records.created:
         await logger.log_new_record(created_record)
 
     for cancelled_record in cancelled_records:
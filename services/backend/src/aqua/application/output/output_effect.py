@@ -1,3 +1,4 @@
+from aqua.application.output.changes import changes_of
 from aqua.application.output.log_effect import log_effect
 from aqua.application.output.map_effect import map_effect
 from aqua.application.ports.loggers import Logger
@@ -13,9 +14,11 @@ async def output_effect(
     record_mapper: RecordMapper,
     logger: Logger,
 ) -> None:
-    await log_effect(effect, logger)
+    changes = changes_of(effect)
+
+    await log_effect(changes, logger)
     await map_effect(
-        effect,
+        changes,
         user_mapper=user_mapper,
         day_mapper=day_mapper,
         record_mapper=record_mapper,
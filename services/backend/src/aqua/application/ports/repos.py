@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import date
 from uuid import UUID
 
 from aqua.domain.model.core.aggregates.user.root import User
@@ -7,3 +8,13 @@ from aqua.domain.model.core.aggregates.user.root import User
 class Users(ABC):
     @abstractmethod
     async def user_with_id(self, user_id: UUID) -> User | None: ...
+
+    @abstractmethod
+    async def user_with_id_and_day(
+        self, user_id: UUID, *, date_: date
+    ) -> User | None: ...
+
+    @abstractmethod
+    async def user_with_id_and_record(
+        self, user_id: UUID, *, record_id: UUID
+    ) -> User | None: ...
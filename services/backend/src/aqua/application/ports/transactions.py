@@ -5,6 +5,9 @@ from typing import Self
 from aqua.domain.framework.fp.act import Act
 
 
+class TransactionConflictError(Exception): ...
+
+
 class Transaction(AbstractAsyncContextManager["Transaction"]):
     async def __aenter__(self) -> Self:
         return self
@@ -0,0 +1,79 @@
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from aqua.domain.framework.entity import Entities
+from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
+from aqua.domain.model.core.aggregates.user.internal.entities.record import (
+    Record,
+)
+from aqua.domain.model.core.aggregates.user.root import User
+from aqua.infrastructure.periphery.serializing.from_document.to_model import (
+    glass_of,
+    target_of,
+    time_of,
+    water_balance_of,
+    water_of,
+)
+
+
+record_count = 10_000
+records_per_day = 5
+
+
+def loaded_user() -> User:
+    user_id = uuid4()
+    days = Entities[Day]()
+    records = Entities[Record]()
+    start_time = datetime(2000, 1, 1, tzinfo=UTC)
+
+    for day_number in range(record_count // records_per_day):
+        day_time = start_time + timedelta(days=day_number)
+        day = Day(
+            id=uuid4(),
+            user_id=user_id,
+            date_=day_time.date(),
+            target=target_of(2000),
+            water_balance=water_balance_of(1000),
+            pinned_result=None,
+        )
+        days.add(day)
+
+        for record_number in range(records_per_day):
+            record = Record(
+                id=uuid4(),
+                user_id=user_id,
+                drunk_water=water_of(200),
+                recording_time=time_of(
+                    day_time + timedelta(hours=record_number)
+                ),
+                is_cancelled=False,
+            )
+            records.add(record)
+
+    return User(
+        id=user_id,
+        target=target_of(2000),
+        glass=glass_of(200),
+        weight=None,
+        days=days,
+        records=records,
+    )
+
+
+def main() -> None:
+    tracemalloc.start()
+    start_size, _ = tracemalloc.get_traced_memory()
+
+    user = loaded_user()
+
+    end_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    size = end_size - start_size
+    print(f"user with {len(user.records)} records: {size / 1024:.0f} KiB")
+    print(f"per record: {size / record_count:.0f} B")
+
+
+if __name__ == "__main__":
+    main()
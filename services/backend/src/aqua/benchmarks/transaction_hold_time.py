@@ -0,0 +1,139 @@
+import asyncio
+from statistics import mean, median
+from time import perf_counter
+from types import TracebackType
+from typing import Self, Type
+from uuid import UUID, uuid4
+
+from aqua.application.cases.write_water import write_water
+from aqua.application.ports.loggers import Logger
+from aqua.application.ports.transactions import Transaction, TransactionFor
+from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
+    MongoDayMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.record_mapper import (
+    MongoRecordMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.user_mapper import (
+    MongoUserMapperTo,
+)
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.transactions.mongo.transaction import (
+    MongoTransactionForMongoUsers,
+)
+from aqua.infrastructure.adapters.views.in_memory.writing_view_of import (
+    InMemoryWritingViewOf,
+)
+from aqua.presentation.di.containers import adapter_container
+from aqua.presentation.periphery.facade import close, register_user
+
+
+concurrent_writer_count = 10
+write_count_per_writer = 20
+rendering_seconds = 0.005
+
+
+class TimedTransaction(Transaction):
+    def __init__(
+        self, transaction: Transaction, *, hold_times: list[float]
+    ) -> None:
+        self.__transaction = transaction
+        self.__hold_times = hold_times
+        self.__start_time = 0.0
+
+    async def rollback(self) -> None:
+        await self.__transaction.rollback()
+
+    async def __aenter__(self) -> Self:
+        await self.__transaction.__aenter__()
+        self.__start_time = perf_counter()
+
+        return self
+
+    async def __aexit__(
+        self,
+        error_type: Type[BaseException] | None,
+        error: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool | None:
+        try:
+            return await self.__transaction.__aexit__(
+                error_type, error, traceback
+            )
+        finally:
+            self.__hold_times.append(perf_counter() - self.__start_time)
+
+
+class TimedTransactionFor(TransactionFor[MongoUsers]):
+    def __init__(
+        self,
+        transaction_for: TransactionFor[MongoUsers],
+        *,
+        hold_times: list[float],
+    ) -> None:
+        self.__transaction_for = transaction_for
+        self.__hold_times = hold_times
+
+    def __call__(self, users: MongoUsers) -> TimedTransaction:
+        return TimedTransaction(
+            self.__transaction_for(users), hold_times=self.__hold_times
+        )
+
+
+async def write(*, user_id: UUID, hold_times: list[float]) -> None:
+    for _ in range(write_count_per_writer):
+        async with adapter_container() as container:
+            transaction_for = TimedTransactionFor(
+                await container.get(
+                    MongoTransactionForMongoUsers, "transactions"
+                ),
+                hold_times=hold_times,
+            )
+
+            async with write_water(
+                user_id,
+                None,
+                view_of=await container.get(InMemoryWritingViewOf, "views"),
+                users=await container.get(MongoUsers, "repos"),
+                transaction_for=transaction_for,
+                logger=await container.get(Logger, "loggers"),
+                user_mapper_to=await container.get(
+                    MongoUserMapperTo, "mappers"
+                ),
+                record_mapper_to=await container.get(
+                    MongoRecordMapperTo, "mappers"
+                ),
+                day_mapper_to=await container.get(MongoDayMapperTo, "mappers"),
+            ):
+                await asyncio.sleep(rendering_seconds)
+
+
+async def main() -> None:
+    user_id = uuid4()
+    hold_times = list[float]()
+
+    async with register_user.perform(user_id, 2000, 200, None):
+        ...
+
+    start_time = perf_counter()
+
+    async with asyncio.TaskGroup() as task_group:
+        for _ in range(concurrent_writer_count):
+            task_group.create_task(
+                write(user_id=user_id, hold_times=hold_times)
+            )
+
+    total_time = perf_counter() - start_time
+
+    print(
+        f"writes: {len(hold_times)}, total: {total_time:.2f} s, "
+        f"hold time mean: {mean(hold_times) * 1000:.2f} ms, "
+        f"median: {median(hold_times) * 1000:.2f} ms, "
+        f"max: {max(hold_times) * 1000:.2f} ms"
+    )
+
+    await close.perform()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,15 +1,33 @@
-from typing import Iterable, cast
+from dataclasses import dataclass
+from typing import Any, Iterable, cast
 
 from aqua.domain.framework.effects.base import Effect
-from aqua.domain.framework.entity import AnyEntity, Entities, FrozenEntities
+from aqua.domain.framework.entity import (
+    AnyEntity,
+    Created,
+    Entities,
+    Event,
+    FrozenEntities,
+    Mutated,
+    Translated,
+)
 
 
 type _EntityMap = dict[type[AnyEntity], Entities[AnyEntity]]
+type _EventIndex = dict[type[AnyEntity], dict[type[Any], Entities[AnyEntity]]]
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class ChangeSet[EntityT: AnyEntity]:
+    created: FrozenEntities[EntityT]
+    mutated: FrozenEntities[EntityT]
+    translated: FrozenEntities[EntityT]
 
 
 class SearchableEffect(Effect):
     def __init__(self, entities: Iterable[AnyEntity] = tuple()) -> None:
         self.__entity_map: _EntityMap = dict()
+        self.__event_index: _EventIndex = dict()
         self.consider(*entities)
 
     def entities_that[EntityT: AnyEntity](
@@ -22,6 +40,31 @@ class SearchableEffect(Effect):
 
         return FrozenEntities(entities)
 
+    def entities_with[EntityT: AnyEntity](
+        self, entity_type: type[EntityT], event_type: type[Any]
+    ) -> FrozenEntities[EntityT]:
+        entities = self.__event_index.get(entity_type, dict()).get(event_type)
+
+        if entities is None:
+            return FrozenEntities()
+
+        return FrozenEntities(cast(Entities[EntityT], entities))
+
+    def change_set_of[EntityT: AnyEntity](
+        self, entity_type: type[EntityT]
+    ) -> ChangeSet[EntityT]:
+        created = self.entities_with(entity_type, Created)
+        mutated = FrozenEntities(
+            entity
+            for entity in self.entities_with(entity_type, Mutated)
+            if created.with_id(entity.id) is None
+        )
+        translated = self.entities_with(entity_type, Translated)
+
+        return ChangeSet(
+            created=created, mutated=mutated, translated=translated
+        )
+
     def consider(self, *entities: AnyEntity) -> None:
         for entity in entities:
             self.__consider_one(entity)
@@ -32,6 +75,7 @@ class SearchableEffect(Effect):
 
     def cancel(self) -> None:
         self.__entity_map = dict()
+        self.__event_index = dict()
 
     def __consider_one(self, entity: AnyEntity) -> None:
         entities = self.__entities_of(type(entity))
@@ -42,6 +86,13 @@ class SearchableEffect(Effect):
 
         entities.add(entity)
 
+        event_map = self.__event_index.setdefault(type(entity), dict())
+
+        for event in entity.events:
+            for event_type in type(event).__mro__:
+                if issubclass(event_type, Event):
+                    event_map.setdefault(event_type, Entities()).add(entity)
+
     def __ignore_one(self, entity: AnyEntity) -> None:
         entities = self.__entities_of(type(entity))
 
@@ -50,6 +101,9 @@ class SearchableEffect(Effect):
 
         entities.remove(entity)
 
+        for event_entities in self.__event_index[type(entity)].values():
+            event_entities.remove(entity)
+
     def __entities_of[EntityT: AnyEntity](
         self, entity_type: type[EntityT]
     ) -> Entities[EntityT] | None:
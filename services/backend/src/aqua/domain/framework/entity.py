@@ -1,6 +1,14 @@
-from copy import deepcopy
-from dataclasses import dataclass, field
-from typing import Any, Iterable, Iterator, Self
+from dataclasses import dataclass, field, fields, replace
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    NoReturn,
+    Self,
+    SupportsIndex,
+)
 
 from aqua.domain.framework.effects.base import Effect
 
@@ -23,10 +31,63 @@ class Translated[EntityT, OriginalT](Event[EntityT]):
     from_: OriginalT
 
 
-@dataclass(kw_only=True)
+class ImmutableEventsError(Exception): ...
+
+
+class _NoEvents(list[Any]):
+    def append(self, _: object) -> NoReturn:
+        raise ImmutableEventsError
+
+    def extend(self, _: Iterable[object]) -> NoReturn:
+        raise ImmutableEventsError
+
+    def insert(self, _: SupportsIndex, __: object) -> NoReturn:
+        raise ImmutableEventsError
+
+    def remove(self, _: object) -> NoReturn:
+        raise ImmutableEventsError
+
+    def pop(self, _: SupportsIndex = -1) -> NoReturn:
+        raise ImmutableEventsError
+
+    def clear(self) -> NoReturn:
+        raise ImmutableEventsError
+
+    def sort(self, *_: object, **__: object) -> NoReturn:
+        raise ImmutableEventsError
+
+    def reverse(self) -> NoReturn:
+        raise ImmutableEventsError
+
+    def __setitem__(self, _: object, __: object) -> NoReturn:
+        raise ImmutableEventsError
+
+    def __delitem__(self, _: object) -> NoReturn:
+        raise ImmutableEventsError
+
+    def __iadd__(self, _: Iterable[object]) -> NoReturn:  # type: ignore[misc]
+        raise ImmutableEventsError
+
+    def __imul__(self, _: SupportsIndex) -> NoReturn:
+        raise ImmutableEventsError
+
+    def __reduce__(self) -> str:
+        return "no_events"
+
+
+no_events: list[Any] = _NoEvents()
+
+
+@dataclass(kw_only=True, slots=True)
 class Entity[IDT, EventT]:
     id: IDT
-    events: list[EventT]
+    events: list[EventT] = field(default_factory=lambda: no_events)
+
+    def add_event(self, event: EventT) -> None:
+        if self.events is no_events:
+            self.events = [event]
+        else:
+            self.events.append(event)
 
     def events_with_type[OtherEventT](
         self, event_type: type[OtherEventT]
@@ -36,20 +97,23 @@ class Entity[IDT, EventT]:
         )
 
     def reset_events(self, *, effect: Effect) -> None:
-        self.events = list()
+        self.events = no_events
         effect.ignore(self)
 
     def is_(self, other: object) -> bool:
         return isinstance(other, type(self)) and self.id == other.id
 
     def without_aggregation(self) -> Self:
-        entity = deepcopy(self)
-
-        for attribute_name, attribute in entity.__dict__.items():
-            if isinstance(attribute, Entities):
-                entity.__dict__[attribute_name] = Entities()
+        changes: dict[str, Any] = {
+            entity_field.name: Entities()
+            for entity_field in fields(self)
+            if isinstance(getattr(self, entity_field.name), Entities)
+        }
+        changes["events"] = (
+            no_events if self.events is no_events else list(self.events)
+        )
 
-        return entity
+        return replace(self, **changes)
 
 
 type AnyEntity = Entity[Any, Any]
@@ -58,6 +122,7 @@ type AnyEntity = Entity[Any, Any]
 class _BaseEntities[EntityT: AnyEntity]:
     def __init__(self, entities: Iterable[EntityT] = tuple()) -> None:
         self._map: _Map[EntityT] = _map_of(entities)
+        self._indexes: dict[_KeyOf[EntityT], _Index[EntityT]] = dict()
 
     def __iter__(self) -> Iterator[EntityT]:
         return iter(self._map.values())
@@ -94,6 +159,20 @@ class _BaseEntities[EntityT: AnyEntity]:
     def without_aggregation(self) -> "FrozenEntities[EntityT]":
         return FrozenEntities(entity.without_aggregation() for entity in self)
 
+    def with_id(self, id_: object) -> EntityT | None:
+        return self._map.get(id_)
+
+    def with_key(
+        self, key: Hashable, *, key_of: "_KeyOf[EntityT]"
+    ) -> tuple[EntityT, ...]:
+        index = self._indexes.get(key_of)
+
+        if index is None:
+            index = _index_of(self._map.values(), key_of)
+            self._indexes[key_of] = index
+
+        return tuple(index.get(key, dict()).values())
+
 
 class Entities[EntityT: AnyEntity](_BaseEntities[EntityT]):
     def with_event[EventT](
@@ -104,12 +183,32 @@ class Entities[EntityT: AnyEntity](_BaseEntities[EntityT]):
         )
 
     def add(self, entity: EntityT) -> None:
+        self.__unindex(entity)
         self._map[entity.id] = entity
 
+        for key_of, index in self._indexes.items():
+            index.setdefault(key_of(entity), dict())[entity.id] = entity
+
     def remove(self, entity: EntityT) -> None:
+        self.__unindex(entity)
+
         if entity.id in self._map:
             del self._map[entity.id]
 
+    def __unindex(self, entity: EntityT) -> None:
+        stored_entity = self._map.get(entity.id)
+
+        if stored_entity is None:
+            return
+
+        for key_of, index in self._indexes.items():
+            key = key_of(stored_entity)
+            group = index[key]
+            del group[entity.id]
+
+            if not group:
+                del index[key]
+
 
 class FrozenEntities[EntityT: AnyEntity](_BaseEntities[EntityT]): ...
 
@@ -126,7 +225,20 @@ type SearchableEntities[EntityT: AnyEntity] = (
 
 
 type _Map[EntityT: AnyEntity] = dict[Any, EntityT]
+type _KeyOf[EntityT: AnyEntity] = Callable[[EntityT], Hashable]
+type _Index[EntityT: AnyEntity] = dict[Hashable, _Map[EntityT]]
 
 
 def _map_of[EntityT: AnyEntity](entities: Iterable[EntityT]) -> _Map[EntityT]:
     return {entity.id: entity for entity in entities}
+
+
+def _index_of[EntityT: AnyEntity](
+    entities: Iterable[EntityT], key_of: _KeyOf[EntityT]
+) -> _Index[EntityT]:
+    index: _Index[EntityT] = dict()
+
+    for entity in entities:
+        index.setdefault(key_of(entity), dict())[entity.id] = entity
+
+    return index
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class SafeImmutable:
     is_safe: bool = field(repr=False)
 
@@ -9,7 +9,7 @@ class SafeImmutable:
         _validate(self)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SafeMutable:
     is_safe: bool = field(repr=False)
 
@@ -5,5 +5,5 @@ from uuid import UUID
 from aqua.domain.framework.entity import Entity
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class User(Entity[UUID, Never]): ...
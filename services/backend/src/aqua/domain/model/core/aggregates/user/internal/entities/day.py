@@ -15,13 +15,14 @@ from aqua.domain.model.primitives.vos.water import Water
 
 @dataclass(kw_only=True, frozen=True, slots=True)
 class NewWaterBalance(Mutated["Day"]):
+    previous_water_balance: WaterBalance
     new_water_balance: WaterBalance
 
 
 type DayEvent = Created["Day"] | NewWaterBalance
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Day(Entity[UUID, DayEvent]):
     user_id: UUID
     date_: date
@@ -59,9 +60,8 @@ class Day(Entity[UUID, DayEvent]):
             target=target,
             water_balance=WaterBalance(water=water),
             pinned_result=None,
-            events=list(),
         )
-        day.events.append(Created(entity=day))
+        day.add_event(Created(entity=day))
         effect.consider(day)
 
         return day
@@ -78,18 +78,22 @@ class Day(Entity[UUID, DayEvent]):
         if self.water_balance == new_water_balance:
             return
 
-        self.water_balance = new_water_balance
-        self.events.append(
-            NewWaterBalance(entity=self, new_water_balance=new_water_balance)
-        )
-        effect.consider(self)
+        self.__set_water_balance(new_water_balance, effect=effect)
 
     def ignore(self, record: _record.Record, *, effect: Effect) -> None:
         water = (self.water_balance.water - record.drunk_water).unwrap()
         new_water_balance = WaterBalance(water=water)
 
-        self.water_balance = new_water_balance
-        self.events.append(
-            NewWaterBalance(entity=self, new_water_balance=new_water_balance)
+        self.__set_water_balance(new_water_balance, effect=effect)
+
+    def __set_water_balance(
+        self, new_water_balance: WaterBalance, *, effect: Effect
+    ) -> None:
+        event = NewWaterBalance(
+            entity=self,
+            previous_water_balance=self.water_balance,
+            new_water_balance=new_water_balance,
         )
+        self.water_balance = new_water_balance
+        self.add_event(event)
         effect.consider(self)
@@ -19,7 +19,7 @@ class Cancelled(Mutated["Record"]): ...
 type RecordEvent = Created["Record"] | Cancelled
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Record(Entity[UUID, RecordEvent]):
     user_id: UUID
     drunk_water: Water
@@ -41,9 +41,8 @@ class Record(Entity[UUID, RecordEvent]):
             drunk_water=drunk_water,
             recording_time=current_time,
             is_cancelled=False,
-            events=list(),
         )
-        record.events.append(Created(entity=record))
+        record.add_event(Created(entity=record))
         effect.consider(record)
 
         return record
@@ -60,7 +59,7 @@ def cancel(
         return Err(CancelledRecordToCancelError())
 
     record.is_cancelled = True
-    record.events.append(Cancelled(entity=record))
+    record.add_event(Cancelled(entity=record))
     effect.consider(record)
 
     return Ok(None)
@@ -13,6 +13,7 @@ from aqua.domain.framework.entity import (
     Translated,
 )
 from aqua.domain.framework.fp.env import Env, Just, env, just
+from aqua.domain.framework.iterable import one_from
 from aqua.domain.model.access.entities.user import User as AccessUser
 from aqua.domain.model.core.aggregates.user.internal.entities import (
     day as _day,
@@ -77,7 +78,7 @@ class CancelledRecordToCancelError: ...
 class NoRecordDayToCancelError: ...
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class User(Entity[UUID, UserEvent]):
     weight: Weight | None
     glass: Glass
@@ -138,11 +139,10 @@ class User(Entity[UUID, UserEvent]):
                 target=target,
                 days=Entities(),
                 records=Entities(),
-                events=list(),
             )
         )
         user_result.map(
-            lambda user: user.events.append(
+            lambda user: user.add_event(
                 TranslatedFromAccess(entity=user, from_=access_user)
             )
         )
@@ -218,20 +218,20 @@ class User(Entity[UUID, UserEvent]):
         )
 
     def __day_of(self, time: Time) -> _day.Day | None:
-        for day in self.days:
-            if day.date_ == time.datetime_.date():
-                return day
+        days = self.days.with_key(time.datetime_.date(), key_of=_date_of_day)
 
-        return None
+        return one_from(days)
 
     def __records_on(self, date_: date) -> Iterable[_record.Record]:
-        for record in self.records:
-            if record.recording_time.datetime_.date() == date_:
-                yield record
+        return self.records.with_key(date_, key_of=_date_of_record)
 
     def __record_with(self, record_id: UUID) -> _record.Record | None:
-        for record in self.records:
-            if record.id == record_id:
-                return record
+        return self.records.with_id(record_id)
 
-        return None
+
+def _date_of_day(day: _day.Day) -> date:
+    return day.date_
+
+
+def _date_of_record(record: _record.Record) -> date:
+    return record.recording_time.datetime_.date()
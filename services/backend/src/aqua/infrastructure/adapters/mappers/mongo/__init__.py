@@ -1,6 +1,9 @@
 from aqua.infrastructure.adapters.mappers.mongo import (
     day_mapper as day_mapper,
 )
+from aqua.infrastructure.adapters.mappers.mongo import (
+    index_registry as index_registry,
+)
 from aqua.infrastructure.adapters.mappers.mongo import (
     record_mapper as record_mapper,
 )
@@ -1,16 +1,15 @@
 from typing import Iterable
 
-from pymongo.asynchronous.client_session import AsyncClientSession
-
 from aqua.application.ports.mappers import DayMapper, DayMapperTo
 from aqua.domain.model.core.aggregates.user.internal.entities.day import (
     Day,
+    NewWaterBalance,
 )
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.periphery.pymongo.document import Document
 from aqua.infrastructure.periphery.pymongo.operations import (
-    ArrayOperations,
-    execute,
+    OperationBatch,
+    RootOperations,
 )
 from aqua.infrastructure.periphery.serializing.from_model.to_document import (
     document_result_of,
@@ -24,34 +23,42 @@ from aqua.infrastructure.periphery.serializing.from_native.to_document import (
 
 
 class MongoDayMapper(DayMapper):
-    __operations = ArrayOperations(namespace="db.users", prefix="day")
+    __operations = RootOperations(namespace="db.days")
 
-    def __init__(self, session: AsyncClientSession) -> None:
-        self.__session = session
+    def __init__(self, batch: OperationBatch) -> None:
+        self.__batch = batch
 
     async def add_all(self, days: Iterable[Day]) -> None:
         operations = (
-            self.__operations.to_push(self._document_of(day), id=day.user_id)
-            for day in days
+            self.__operations.to_put(self._document_of(day)) for day in days
         )
 
-        await execute(
-            operations, session=self.__session, comment="push user days"
-        )
+        self.__batch.add(operations, label="add days")
 
     async def update_all(self, days: Iterable[Day]) -> None:
         operations = (
-            self.__operations.to_map(self._document_of(day), id=day.user_id)
+            self.__operations.to_put(
+                self._document_of(day), expected=self.__expected_of(day)
+            )
             for day in days
         )
 
-        await execute(
-            operations, session=self.__session, comment="update user days"
-        )
+        self.__batch.add(operations, label="update days")
+
+    def __expected_of(self, day: Day) -> Document | None:
+        new_water_balance_events = day.events_with_type(NewWaterBalance)
+
+        if not new_water_balance_events:
+            return None
+
+        water_balance = new_water_balance_events[0].previous_water_balance
+
+        return {"water_balance": document_water_balance_of(water_balance)}
 
     def _document_of(self, day: Day) -> Document:
         return {
             "_id": day.id,
+            "user_id": day.user_id,
             "water_balance": document_water_balance_of(day.water_balance),
             "target": document_target_of(day.target),
             "date": document_date_of(day.date_),
@@ -63,4 +70,4 @@ class MongoDayMapper(DayMapper):
 
 class MongoDayMapperTo(DayMapperTo[MongoUsers]):
     def __call__(self, mongo_users: MongoUsers) -> MongoDayMapper:
-        return MongoDayMapper(mongo_users.session)
+        return MongoDayMapper(mongo_users.batch)
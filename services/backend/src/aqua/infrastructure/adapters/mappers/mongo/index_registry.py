@@ -0,0 +1,8 @@
+from aqua.infrastructure.periphery.pymongo.indexes import Index, IndexRegistry
+
+
+index_registry: IndexRegistry = {
+    "db.users": (),
+    "db.days": (Index(keys=(("user_id", 1), ("date", 1)), is_unique=True),),
+    "db.records": (Index(keys=(("user_id", 1), ("recording_time", -1))),),
+}
@@ -1,14 +1,12 @@
 from typing import Iterable
 
-from pymongo.asynchronous.client_session import AsyncClientSession
-
 from aqua.application.ports.mappers import UserMapper, UserMapperTo
 from aqua.domain.model.core.aggregates.user.root import User
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.periphery.pymongo.document import Document
 from aqua.infrastructure.periphery.pymongo.operations import (
+    OperationBatch,
     RootOperations,
-    execute,
 )
 from aqua.infrastructure.periphery.serializing.from_model.to_document import (
     document_glass_of,
@@ -20,21 +18,21 @@ from aqua.infrastructure.periphery.serializing.from_model.to_document import (
 class MongoUserMapper(UserMapper):
     __operations = RootOperations(namespace="db.users")
 
-    def __init__(self, session: AsyncClientSession) -> None:
-        self.__session = session
+    def __init__(self, batch: OperationBatch) -> None:
+        self.__batch = batch
 
     async def add_all(self, users: Iterable[User]) -> None:
-        await self.__put(users)
+        self.__put(users)
 
     async def update_all(self, users: Iterable[User]) -> None:
-        await self.__put(users)
+        self.__put(users)
 
-    async def __put(self, users: Iterable[User]) -> None:
+    def __put(self, users: Iterable[User]) -> None:
         operations = (
             self.__operations.to_put(self.__document_of(user)) for user in users
         )
 
-        await execute(operations, session=self.__session, comment="put users")
+        self.__batch.add(operations, label="put users")
 
     def __document_of(self, user: User) -> Document:
         return {
@@ -47,4 +45,4 @@ class MongoUserMapper(UserMapper):
 
 class MongoUserMapperTo(UserMapperTo[MongoUsers]):
     def __call__(self, mongo_users: MongoUsers) -> MongoUserMapper:
-        return MongoUserMapper(mongo_users.session)
+        return MongoUserMapper(mongo_users.batch)
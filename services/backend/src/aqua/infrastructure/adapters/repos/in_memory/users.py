@@ -1,6 +1,6 @@
 from copy import deepcopy
 from datetime import date
-from typing import Iterator
+from typing import Callable, Iterator
 from uuid import UUID
 
 from aqua.application.ports.repos import Users
@@ -41,6 +41,37 @@ class InMemoryUsers(
 
         return None if root is None else self.__with_aggregation(root)
 
+    async def user_with_id_and_day(
+        self, user_id: UUID, *, date_: date
+    ) -> User | None:
+        root = self._storage.user_with_id(user_id)
+
+        if root is None:
+            return None
+
+        return self.__with_aggregation(
+            root,
+            is_in_scope=lambda day_date: day_date == date_,
+        )
+
+    async def user_with_id_and_record(
+        self, user_id: UUID, *, record_id: UUID
+    ) -> User | None:
+        root = self._storage.user_with_id(user_id)
+
+        if root is None:
+            return None
+
+        record_dates = {
+            record.recording_time.datetime_.date()
+            for record in self._storage.records_with_user_id(user_id)
+            if record.id == record_id
+        }
+
+        return self.__with_aggregation(
+            root, is_in_scope=record_dates.__contains__
+        )
+
     def day_with_user_id_and_date(
         self, *, user_id: UUID, date_: date
     ) -> Day | None:
@@ -66,9 +97,22 @@ class InMemoryUsers(
     def update_record(self, record: Record) -> None:
         self._storage.update_record(record)
 
-    def __with_aggregation(self, root: User) -> User:
-        days = Entities(self._storage.days_with_user_id(root.id))
-        records = Entities(self._storage.records_with_user_id(root.id))
+    def __with_aggregation(
+        self,
+        root: User,
+        *,
+        is_in_scope: Callable[[date], bool] = lambda _: True,
+    ) -> User:
+        days = Entities(
+            day
+            for day in self._storage.days_with_user_id(root.id)
+            if is_in_scope(day.date_)
+        )
+        records = Entities(
+            record
+            for record in self._storage.records_with_user_id(root.id)
+            if is_in_scope(record.recording_time.datetime_.date())
+        )
 
         return User(
             id=root.id,
@@ -1,16 +1,22 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 from uuid import UUID
 
+from pymongo import ReadPreference
 from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.asynchronous.collection import AsyncCollection
 
 from aqua.application.ports.repos import Users
 from aqua.domain.framework.entity import Entities
+from aqua.domain.framework.iterable import one_from
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
     Record,
 )
 from aqua.domain.model.core.aggregates.user.root import User
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
+from aqua.infrastructure.periphery.pymongo.operators import in_date_range
 from aqua.infrastructure.periphery.serializing.from_document.to_model import (
     glass_of,
     maybe_result_of,
@@ -23,6 +29,9 @@ from aqua.infrastructure.periphery.serializing.from_document.to_model import (
 from aqua.infrastructure.periphery.serializing.from_document.to_native import (
     native_date_of,
 )
+from aqua.infrastructure.periphery.serializing.from_native.to_document import (
+    document_date_of,
+)
 from aqua.infrastructure.periphery.validation.objects import (
     StrictValidationObject,
 )
@@ -31,16 +40,96 @@ from aqua.infrastructure.periphery.validation.objects import (
 class MongoUsers(Users):
     def __init__(self, session: AsyncClientSession) -> None:
         self.__session = session
+        self.__batch = OperationBatch(session)
 
     @property
     def session(self) -> AsyncClientSession:
         return self.__session
 
+    @property
+    def batch(self) -> OperationBatch:
+        return self.__batch
+
     async def user_with_id(self, user_id: UUID) -> User | None:
-        document = await self.session.client.db.users.find_one(user_id)
+        return await self.__user_with(user_id, day_filter={}, record_filter={})
+
+    async def user_with_id_and_day(
+        self, user_id: UUID, *, date_: date
+    ) -> User | None:
+        document_date = document_date_of(date_)
+
+        return await self.__user_with(
+            user_id,
+            day_filter={"date": document_date},
+            record_filter={"recording_time": in_date_range(document_date)},
+        )
+
+    async def user_with_id_and_record(
+        self, user_id: UUID, *, record_id: UUID
+    ) -> User | None:
+        record_document = await self.__primary("records").find_one(
+            {"_id": record_id, "user_id": user_id},
+            {"recording_time": 1},
+            session=self.session,
+        )
+
+        if record_document is not None:
+            record_object = StrictValidationObject(record_document)
+            recording_time = record_object["recording_time", datetime]
+
+            return await self.user_with_id_and_day(
+                user_id, date_=recording_time.date()
+            )
+
+        document = await self.__primary("users").find_one(
+            user_id, session=self.session
+        )
+
+        if document is None:
+            return None
+
+        return self.__loaded_user_from(document | {"days": [], "records": []})
+
+    async def __user_with(
+        self,
+        user_id: UUID,
+        *,
+        day_filter: Document,
+        record_filter: Document,
+    ) -> User | None:
+        pipeline: list[Document] = [
+            {"$match": {"_id": user_id}},
+            {
+                "$lookup": {
+                    "from": "days",
+                    "localField": "_id",
+                    "foreignField": "user_id",
+                    "pipeline": [{"$match": day_filter}],
+                    "as": "days",
+                }
+            },
+            {
+                "$lookup": {
+                    "from": "records",
+                    "localField": "_id",
+                    "foreignField": "user_id",
+                    "pipeline": [{"$match": record_filter}],
+                    "as": "records",
+                }
+            },
+        ]
+        documents = await self.__primary("users").aggregate(
+            pipeline, session=self.session
+        )
+        document = one_from(await documents.to_list())
 
         return None if document is None else self.__loaded_user_from(document)
 
+    def __primary(self, collection_name: str) -> AsyncCollection[Document]:
+        return self.session.client.db.get_collection(
+            collection_name, read_preference=ReadPreference.PRIMARY
+        )
+
     def __loaded_user_from(self, document: dict[str, Any]) -> User:
         user_object = StrictValidationObject(document)
 
@@ -51,7 +140,6 @@ class MongoUsers(Users):
             day_object = StrictValidationObject(day_document)
             day = Day(
                 id=day_object["_id", UUID],
-                events=list(),
                 user_id=user_object["_id", UUID],
                 date_=native_date_of(day_object["date", datetime]),
                 target=target_of(day_object["target", int]),
@@ -68,7 +156,6 @@ class MongoUsers(Users):
             record_object = StrictValidationObject(record_document)
             record = Record(
                 id=record_object["_id", UUID],
-                events=list(),
                 user_id=user_object["_id", UUID],
                 drunk_water=water_of(record_object["drunk_water", int]),
                 recording_time=time_of(
@@ -80,7 +167,6 @@ class MongoUsers(Users):
 
         return User(
             id=user_object["_id", UUID],
-            events=list(),
             target=target_of(user_object["target", int]),
             glass=glass_of(user_object["glass", int]),
             weight=maybe_weight_of(user_object["weight", int]),
@@ -3,21 +3,34 @@ from typing import Self, Type
 
 from pymongo import ReadPreference
 from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.errors import ClientBulkWriteException, PyMongoError
 
-from aqua.application.ports.transactions import Transaction, TransactionFor
+from aqua.application.ports.transactions import (
+    Transaction,
+    TransactionConflictError,
+    TransactionFor,
+)
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
 
 
 class NestedTransactionError(Exception): ...
 
 
+_duplicate_key_error_code = 11000
+
+
 class MongoTransaction(Transaction):
-    def __init__(self, session: AsyncClientSession) -> None:
+    def __init__(
+        self, session: AsyncClientSession, batch: OperationBatch
+    ) -> None:
         self.__session = session
+        self.__batch = batch
         self.__is_completed = False
 
     async def rollback(self) -> None:
         self.__is_completed = True
+        self.__batch.clear()
         await self.__session.abort_transaction()
 
     async def __aenter__(self) -> Self:
@@ -40,12 +53,49 @@ class MongoTransaction(Transaction):
         if self.__is_completed:
             return
 
-        if error is None:
-            await self.__session.commit_transaction()
-        else:
+        if error is not None:
+            self.__batch.clear()
+            await self.__session.abort_transaction()
+            return
+
+        try:
+            await self.__batch.execute()
+        except PyMongoError as execution_error:
+            await self.__session.abort_transaction()
+
+            if _is_conflict(execution_error):
+                raise TransactionConflictError from execution_error
+
+            raise
+        except BaseException:
             await self.__session.abort_transaction()
+            raise
+
+        try:
+            await self.__session.commit_transaction()
+        except PyMongoError as commit_error:
+            if _is_conflict(commit_error):
+                raise TransactionConflictError from commit_error
+
+            raise
 
 
 class MongoTransactionForMongoUsers(TransactionFor[MongoUsers]):
     def __call__(self, mongo_users: MongoUsers) -> MongoTransaction:
-        return MongoTransaction(mongo_users.session)
+        return MongoTransaction(mongo_users.session, mongo_users.batch)
+
+
+def _is_conflict(error: PyMongoError) -> bool:
+    if error.has_error_label("TransientTransactionError"):
+        return True
+
+    if not isinstance(error, ClientBulkWriteException):
+        return False
+
+    if isinstance(error.error, PyMongoError):
+        return _is_conflict(error.error)
+
+    return any(
+        write_error.get("code") == _duplicate_key_error_code
+        for write_error in error.details.get("writeErrors", list())
+    )
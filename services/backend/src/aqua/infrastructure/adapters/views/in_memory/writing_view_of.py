@@ -23,12 +23,13 @@ class InMemoryWritingViewOf(WritingViewOf[InMemoryWritingView]):
         )
 
     def __viewable(self, records: Iterable[Record]) -> tuple[Record, ...]:
+        active_records = (
+            record for record in records if not record.is_cancelled
+        )
         sorted_records = sorted(
-            records,
+            active_records,
             key=lambda record: record.recording_time.datetime_,
             reverse=True,
         )
 
-        return tuple(
-            record for record in sorted_records if not record.is_cancelled
-        )
+        return deepcopy(tuple(sorted_records))
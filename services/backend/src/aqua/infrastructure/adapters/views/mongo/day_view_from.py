@@ -1,15 +1,12 @@
 from datetime import date, datetime
-from typing import Iterable, cast
+from typing import Iterable
 from uuid import UUID
 
 from aqua.application.ports.views import DayViewFrom
 from aqua.domain.framework.iterable import one_from
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.periphery.pymongo.document import Document
-from aqua.infrastructure.periphery.pymongo.operators import (
-    cond_about,
-    in_date_range,
-)
+from aqua.infrastructure.periphery.pymongo.operators import in_date_range
 from aqua.infrastructure.periphery.serializing.from_document.to_native import (
     native_datetime_of,
 )
@@ -36,33 +33,26 @@ class DBDayViewFromMongoUsers(DayViewFrom[MongoUsers, DBDayView]):
     ) -> DBDayView:
         document_date = document_date_of(date_)
         pipeline: list[Document] = [
-            {"$match": {"_id": user_id, "days.date": document_date}},
+            {"$match": {"user_id": user_id, "date": document_date}},
             {
-                "$project": {
-                    "days": {
-                        "$filter": {
-                            "input": "$days",
-                            "cond": {"$eq": ["$$this.date", document_date]},
-                        }
-                    },
-                    "records": {
-                        "$filter": {
-                            "input": "$records",
-                            "cond": {
-                                "$and": [
-                                    {"$eq": ["$$this.is_cancelled", False]},
-                                    *cond_about(
-                                        in_date_range(document_date),
-                                        field="$$this.recording_time",
-                                    ),
-                                ]
-                            },
-                        }
-                    },
+                "$lookup": {
+                    "from": "records",
+                    "localField": "user_id",
+                    "foreignField": "user_id",
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "recording_time": in_date_range(document_date),
+                                "is_cancelled": False,
+                            }
+                        },
+                        {"$sort": {"recording_time": -1}},
+                    ],
+                    "as": "records",
                 }
             },
         ]
-        documents = await mongo_users.session.client.db.users.aggregate(
+        documents = await mongo_users.session.client.db.days.aggregate(
             pipeline, session=mongo_users.session
         )
         document = one_from(await documents.to_list())
@@ -70,7 +60,7 @@ class DBDayViewFromMongoUsers(DayViewFrom[MongoUsers, DBDayView]):
         if document is None:
             return empty_db_day_view_with(user_id=user_id, date_=date_)
 
-        day_object = StrictValidationObject(cast(Document, document["days"][0]))
+        day_object = StrictValidationObject(document)
 
         return DBDayView(
             user_id=user_id,
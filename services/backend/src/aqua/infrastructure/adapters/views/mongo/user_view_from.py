@@ -6,10 +6,7 @@ from aqua.application.ports.views import UserViewFrom
 from aqua.domain.framework.iterable import one_from
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.periphery.pymongo.document import Document
-from aqua.infrastructure.periphery.pymongo.operators import (
-    cond_about,
-    in_date_range,
-)
+from aqua.infrastructure.periphery.pymongo.operators import in_date_range
 from aqua.infrastructure.periphery.serializing.from_document.to_native import (
     native_datetime_of,
 )
@@ -35,34 +32,36 @@ class DBUserViewFromMongoUsers(UserViewFrom[MongoUsers, DBUserView]):
         self, mongo_users: MongoUsers, *, user_id: UUID, date_: date
     ) -> DBUserView:
         document_date = document_date_of(date_)
-        pipeline = [
-            {"$match": {"_id": user_id, "days.date": document_date}},
+        pipeline: list[Document] = [
+            {"$match": {"_id": user_id}},
+            {
+                "$lookup": {
+                    "from": "days",
+                    "localField": "_id",
+                    "foreignField": "user_id",
+                    "pipeline": [{"$match": {"date": document_date}}],
+                    "as": "days",
+                }
+            },
+            {"$match": {"days": {"$ne": []}}},
             {
-                "$project": {
-                    "glass": 1,
-                    "weight": 1,
-                    "days": {
-                        "$filter": {
-                            "input": "$days",
-                            "cond": {"$eq": ["$$this.date", document_date]},
-                        }
-                    },
-                    "records": {
-                        "$filter": {
-                            "input": "$records",
-                            "cond": {
-                                "$and": [
-                                    {"$eq": ["$$this.is_cancelled", False]},
-                                    *cond_about(
-                                        in_date_range(document_date),
-                                        field="$$this.recording_time",
-                                    ),
-                                ]
-                            },
-                        }
-                    },
+                "$lookup": {
+                    "from": "records",
+                    "localField": "_id",
+                    "foreignField": "user_id",
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "recording_time": in_date_range(document_date),
+                                "is_cancelled": False,
+                            }
+                        },
+                        {"$sort": {"recording_time": -1}},
+                    ],
+                    "as": "records",
                 }
             },
+            {"$project": {"glass": 1, "weight": 1, "days": 1, "records": 1}},
         ]
         documents = await mongo_users.session.client.db.users.aggregate(
             pipeline, session=mongo_users.session
@@ -7,3 +7,5 @@ _env.read_env(".env")
 
 is_dev = _env.bool("AQUA_DEV")
 mongo_uri = _env.str("AQUA_MONGO_URI")
+ensures_mongo_indexes = _env.bool("AQUA_MONGO_ENSURE_INDEXES", default=True)
+mongo_min_pool_size = _env.int("AQUA_MONGO_MIN_POOL_SIZE", default=1)
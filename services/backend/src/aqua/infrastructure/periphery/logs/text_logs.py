@@ -5,3 +5,6 @@ new_day_state_log = "new day state"
 new_record_log = "new record"
 registered_user_log = "new user in aqua module"
 record_cancellation_log = "record was cancelled"
+missing_mongo_index_log = "mongo index is missing"
+unused_mongo_index_log = "mongo index is not used by aqua"
+mongo_operation_batch_log = "mongo operation batch was executed"
@@ -1,4 +1,5 @@
 from aqua.infrastructure.periphery.pymongo import clients as clients
 from aqua.infrastructure.periphery.pymongo import document as document
+from aqua.infrastructure.periphery.pymongo import indexes as indexes
 from aqua.infrastructure.periphery.pymongo import operations as operations
 from aqua.infrastructure.periphery.pymongo import operators as operators
@@ -15,4 +15,5 @@ def client_with(
         uuidRepresentation="standard",
         tz_aware=True,
         readPreference=read_preference,
+        minPoolSize=envs.mongo_min_pool_size,
     )
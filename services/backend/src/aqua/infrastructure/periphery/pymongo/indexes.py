@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import Mapping
+
+from pymongo import AsyncMongoClient, IndexModel
+from pymongo.asynchronous.collection import AsyncCollection
+
+from aqua.infrastructure.periphery.pymongo.document import Document
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Index:
+    keys: tuple[tuple[str, int], ...]
+    is_unique: bool = False
+
+    @property
+    def name(self) -> str:
+        return "_".join(
+            f"{field}_{direction}" for field, direction in self.keys
+        )
+
+    def to_model(self) -> IndexModel:
+        return IndexModel(
+            list(self.keys), name=self.name, unique=self.is_unique
+        )
+
+
+type IndexRegistry = Mapping[str, tuple[Index, ...]]
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class IndexReport:
+    missing_index_names: tuple[str, ...]
+    unused_index_names: tuple[str, ...]
+
+
+async def ensure_indexes(
+    client: AsyncMongoClient[Document], registry: IndexRegistry
+) -> None:
+    for namespace, indexes in registry.items():
+        if not indexes:
+            continue
+
+        collection = _collection_of(client, namespace)
+        await collection.create_indexes([index.to_model() for index in indexes])
+
+
+async def index_report_of(
+    client: AsyncMongoClient[Document], registry: IndexRegistry
+) -> IndexReport:
+    missing_index_names = list[str]()
+    unused_index_names = list[str]()
+
+    for namespace, indexes in registry.items():
+        collection = _collection_of(client, namespace)
+        index_documents = await collection.list_indexes()
+
+        existing_names = {
+            index_document["name"] async for index_document in index_documents
+        }
+        existing_names.discard("_id_")
+        required_names = {index.name for index in indexes}
+
+        missing_index_names.extend(
+            f"{namespace}.{name}"
+            for name in sorted(required_names - existing_names)
+        )
+        unused_index_names.extend(
+            f"{namespace}.{name}"
+            for name in sorted(existing_names - required_names)
+        )
+
+    return IndexReport(
+        missing_index_names=tuple(missing_index_names),
+        unused_index_names=tuple(unused_index_names),
+    )
+
+
+def _collection_of(
+    client: AsyncMongoClient[Document], namespace: str
+) -> AsyncCollection[Document]:
+    database_name, collection_name = namespace.split(".", 1)
+
+    return client[database_name][collection_name]
@@ -1,4 +1,4 @@
-from typing import Any, Iterable, Literal
+from typing import Iterable, Mapping
 
 from pymongo import (
     DeleteMany,
@@ -10,7 +10,11 @@ from pymongo import (
 )
 from pymongo.asynchronous.client_session import AsyncClientSession
 
+from aqua.infrastructure.periphery import envs
+from aqua.infrastructure.periphery.logs import text_logs as logs
 from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.structlog.dev_logger import dev_logger
+from aqua.infrastructure.periphery.structlog.prod_logger import prod_logger
 
 
 type Operation = (
@@ -22,70 +26,65 @@ type Operation = (
     | DeleteMany
 )
 type Put = UpdateOne
-type Map = UpdateOne
-type Push = UpdateOne
 
 
-type Sort = dict[str, Literal[1, -1]]
-
-
-class ArrayOperations:
-    def __init__(
-        self, *, namespace: str, prefix: str, sort: Sort | None = None
-    ) -> None:
+class RootOperations:
+    def __init__(self, *, namespace: str) -> None:
         self.__namespace = namespace
-        self.__prefix = prefix
-        self.__sort = sort
 
-    def to_map(self, document: Document, *, id: Any) -> Map:  # noqa: ANN401
-        return UpdateOne(
-            {"_id": id},
-            {"$set": self.__for_iteration(document)},
-            array_filters=[{f"{self.__prefix}._id": document["_id"]}],
-            namespace=self.__namespace,
-        )
-
-    def to_push(self, document: Document, *, id: Any) -> Push:  # noqa: ANN401
-        pushing = self.__pushing_of(document)
+    def to_put(
+        self, document: Document, *, expected: Document | None = None
+    ) -> Put:
+        filter_ = {"_id": document["_id"]} | (expected or dict())
+        command = {"$set": _command_of(document)}
 
         return UpdateOne(
-            {"_id": id}, pushing, upsert=True, namespace=self.__namespace
+            filter_, command, upsert=True, namespace=self.__namespace
         )
 
-    def __pushing_of(self, document: Document) -> Document:
-        params: Document = {"$each": [document]}
 
-        if self.__sort is not None:
-            params["$sort"] = self.__sort
+class OperationBatch:
+    def __init__(self, session: AsyncClientSession) -> None:
+        self.__session = session
+        self.__operations = list[Operation]()
+        self.__operation_counts = dict[str, int]()
 
-        return {"$push": {f"{self.__prefix}s": params}}
+    def add(self, raw_operations: Iterable[Operation], *, label: str) -> None:
+        operations = list(raw_operations)
 
-    def __for_iteration(self, document: Document) -> Document:
-        return {
-            f"{self.__prefix}s.$[{self.__prefix}].{field_name}": field_value
-            for field_name, field_value in document.items()
-            if field_name != "_id"
-        }
+        if not operations:
+            return
 
+        self.__operations.extend(operations)
+        operation_count = self.__operation_counts.get(label, 0)
+        self.__operation_counts[label] = operation_count + len(operations)
 
-class RootOperations:
-    def __init__(self, *, namespace: str) -> None:
-        self.__namespace = namespace
-
-    def to_put(self, document: Document) -> Put:
-        filter_ = {"_id": document["_id"]}
-        command = {"$set": _command_of(document)}
+    async def execute(self) -> None:
+        operations = self.__operations
+        operation_counts = self.__operation_counts
+        self.clear()
 
-        return UpdateOne(
-            filter_, command, upsert=True, namespace=self.__namespace
+        await execute(
+            operations,
+            session=self.__session,
+            comment=operation_counts,
+            ordered=True,
         )
 
+        if operation_counts:
+            await _log_operation_counts(operation_counts)
+
+    def clear(self) -> None:
+        self.__operations = list()
+        self.__operation_counts = dict()
+
 
 async def execute(
     raw_operations: Iterable[Operation],
     *,
     session: AsyncClientSession,
-    comment: str | None = None,
+    comment: str | Mapping[str, int] | None = None,
+    ordered: bool = False,
 ) -> None:
     operations = list(raw_operations)
 
@@ -95,11 +94,19 @@ async def execute(
     await session.client.bulk_write(
         operations,
         session=session,
-        ordered=False,
+        ordered=ordered,
         comment=comment,
     )
 
 
+async def _log_operation_counts(operation_counts: Mapping[str, int]) -> None:
+    logger = dev_logger if envs.is_dev else prod_logger
+
+    await logger.ainfo(
+        logs.mongo_operation_batch_log, operation_counts=operation_counts
+    )
+
+
 def _command_of(document: Document) -> Document:
     command_document = dict(document.items())
     del command_document["_id"]
@@ -14,6 +14,9 @@ from aqua.infrastructure.adapters.loggers.structlog.prod_logger import (
 from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
     MongoDayMapperTo,
 )
+from aqua.infrastructure.adapters.mappers.mongo.index_registry import (
+    index_registry,
+)
 from aqua.infrastructure.adapters.mappers.mongo.record_mapper import (
     MongoRecordMapperTo,
 )
@@ -40,8 +43,16 @@ from aqua.infrastructure.adapters.views.mongo.user_view_from import (
     DBUserViewFromMongoUsers,
 )
 from aqua.infrastructure.periphery import envs
+from aqua.infrastructure.periphery.logs import text_logs as logs
 from aqua.infrastructure.periphery.pymongo.clients import client_with
 from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.indexes import (
+    IndexReport,
+    ensure_indexes,
+    index_report_of,
+)
+from aqua.infrastructure.periphery.structlog.dev_logger import dev_logger
+from aqua.infrastructure.periphery.structlog.prod_logger import prod_logger
 
 
 class NoConncetionError(Exception): ...
@@ -53,6 +64,12 @@ class MongoProvider(Provider):
     @provide(scope=Scope.APP)
     async def get_client(self) -> AsyncIterable[AsyncMongoClient[Document]]:
         client = client_with()
+
+        if envs.ensures_mongo_indexes:
+            await ensure_indexes(client, index_registry)
+
+        await _log_index_report(await index_report_of(client, index_registry))
+
         yield client
         await client.close()
 
@@ -64,6 +81,16 @@ class MongoProvider(Provider):
             yield session
 
 
+async def _log_index_report(report: IndexReport) -> None:
+    logger = dev_logger if envs.is_dev else prod_logger
+
+    for index_name in report.missing_index_names:
+        await logger.awarning(logs.missing_mongo_index_log, index=index_name)
+
+    for index_name in report.unused_index_names:
+        await logger.awarning(logs.unused_mongo_index_log, index=index_name)
+
+
 class LoggerProvider(Provider):
     component = "loggers"
 
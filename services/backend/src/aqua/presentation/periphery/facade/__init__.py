@@ -7,6 +7,7 @@ from aqua.presentation.periphery.facade import read_user as read_user
 from aqua.presentation.periphery.facade import (
     register_user as register_user,
 )
+from aqua.presentation.periphery.facade import warm_up as warm_up
 from aqua.presentation.periphery.facade import (
     write_water as write_water,
 )
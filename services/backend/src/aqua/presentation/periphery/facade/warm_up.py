@@ -0,0 +1,50 @@
+from aqua.application.ports.loggers import Logger
+from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
+    MongoDayMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.record_mapper import (
+    MongoRecordMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.user_mapper import (
+    MongoUserMapperTo,
+)
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.transactions.mongo.transaction import (
+    MongoTransactionForMongoUsers,
+)
+from aqua.infrastructure.adapters.views.in_memory.cancellation_view_of import (
+    InMemoryCancellationViewOf,
+)
+from aqua.infrastructure.adapters.views.in_memory.registration_view_of import (
+    InMemoryRegistrationViewOf,
+)
+from aqua.infrastructure.adapters.views.in_memory.writing_view_of import (
+    InMemoryWritingViewOf,
+)
+from aqua.infrastructure.adapters.views.mongo.day_view_from import (
+    DBDayViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.user_view_from import (
+    DBUserViewFromMongoUsers,
+)
+from aqua.presentation.di.containers import adapter_container
+
+
+async def perform() -> None:
+    async with adapter_container() as container:
+        await container.get(Logger, "loggers")
+        await container.get(MongoUserMapperTo, "mappers")
+        await container.get(MongoDayMapperTo, "mappers")
+        await container.get(MongoRecordMapperTo, "mappers")
+        await container.get(MongoTransactionForMongoUsers, "transactions")
+        await container.get(InMemoryWritingViewOf, "views")
+        await container.get(InMemoryCancellationViewOf, "views")
+        await container.get(InMemoryRegistrationViewOf, "views")
+        await container.get(DBUserViewFromMongoUsers, "views")
+        await container.get(DBDayViewFromMongoUsers, "views")
+
+        users = await container.get(MongoUsers, "repos")
+        documents = await users.session.client.db.users.aggregate(
+            [{"$match": {"_id": None}}], session=users.session
+        )
+        await documents.to_list()
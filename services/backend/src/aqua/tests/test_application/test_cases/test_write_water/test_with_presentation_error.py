@@ -0,0 +1,50 @@
+from pytest import mark, raises
+
+from aqua.application.cases.write_water import (
+    write_water as case,
+)
+from aqua.domain.model.core.aggregates.user.root import User
+from aqua.infrastructure.adapters.mappers.in_memory.day_mapper import (
+    InMemoryDayMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.in_memory.record_mapper import (
+    InMemoryRecordMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.in_memory.user_mapper import (
+    InMemoryUserMapperTo,
+)
+from aqua.infrastructure.adapters.transactions.in_memory import (
+    storage_transaction as _storage_transaction,
+)
+from aqua.infrastructure.adapters.views.in_memory.writing_view_of import (
+    InMemoryWritingViewOf,
+)
+from aqua.tests.test_application.test_cases.test_write_water.conftest import (
+    Context,
+)
+
+
+class PresentationError(Exception): ...
+
+
+@mark.asyncio
+async def test_storage(context_with_user1: Context, user1: User) -> None:
+    context = context_with_user1
+
+    with raises(PresentationError):
+        async with case(
+            user1.id,
+            None,
+            view_of=InMemoryWritingViewOf(),
+            users=context.users,
+            transaction_for=(
+                _storage_transaction.InMemoryStorageTransactionFor()
+            ),
+            logger=context.logger,
+            user_mapper_to=InMemoryUserMapperTo(),
+            day_mapper_to=InMemoryDayMapperTo(),
+            record_mapper_to=InMemoryRecordMapperTo(),
+        ):
+            raise PresentationError
+
+    assert len(context.users.storage.records) == 4
@@ -0,0 +1,143 @@
+from types import TracebackType
+from typing import Any, Self, Type
+from uuid import UUID
+
+from pytest import mark, raises
+from result import Result
+
+from aqua.application.cases.write_water import (
+    NoUserError,
+)
+from aqua.application.cases.write_water import (
+    write_water as case,
+)
+from aqua.application.ports.transactions import (
+    Transaction,
+    TransactionConflictError,
+    TransactionFor,
+)
+from aqua.domain.framework.entity import FrozenEntities
+from aqua.domain.model.core.aggregates.user.root import User
+from aqua.domain.model.primitives.vos.water import NegativeWaterAmountError
+from aqua.infrastructure.adapters.mappers.in_memory.day_mapper import (
+    InMemoryDayMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.in_memory.record_mapper import (
+    InMemoryRecordMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.in_memory.user_mapper import (
+    InMemoryUserMapperTo,
+)
+from aqua.infrastructure.adapters.transactions.in_memory.storage_transaction import (  # noqa: E501
+    InMemoryStorageTransaction,
+)
+from aqua.infrastructure.adapters.views.in_memory.writing_view_of import (
+    InMemoryWritingViewOf,
+)
+from aqua.infrastructure.periphery.storages.transactional_storage import (
+    TransactionalInMemoryStorage,
+)
+from aqua.infrastructure.periphery.views.in_memory.writing_view import (
+    InMemoryWritingView,
+)
+from aqua.tests.test_application.test_cases.test_write_water.conftest import (
+    Context,
+)
+
+
+class ConflictingTransaction(Transaction):
+    def __init__(
+        self,
+        storage: TransactionalInMemoryStorage[Any],
+        *,
+        is_conflicting: bool,
+    ) -> None:
+        self.__transaction = InMemoryStorageTransaction(storage)
+        self.__is_conflicting = is_conflicting
+
+    async def rollback(self) -> None:
+        await self.__transaction.rollback()
+
+    async def __aenter__(self) -> Self:
+        await self.__transaction.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        error_type: Type[BaseException] | None,
+        error: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool:
+        if error is None and self.__is_conflicting:
+            await self.__transaction.rollback()
+            raise TransactionConflictError
+
+        return await self.__transaction.__aexit__(error_type, error, traceback)
+
+
+class ConflictingTransactionFor(
+    TransactionFor[TransactionalInMemoryStorage[Any]]
+):
+    def __init__(self, *, conflict_count: int) -> None:
+        self.__conflict_count = conflict_count
+        self.transaction_count = 0
+
+    def __call__(
+        self, storage: TransactionalInMemoryStorage[Any]
+    ) -> ConflictingTransaction:
+        self.transaction_count += 1
+        is_conflicting = self.transaction_count <= self.__conflict_count
+
+        return ConflictingTransaction(storage, is_conflicting=is_conflicting)
+
+
+async def write_water(
+    context: Context,
+    user_id: UUID,
+    *,
+    transaction_for: ConflictingTransactionFor,
+) -> Result[InMemoryWritingView, NoUserError | NegativeWaterAmountError]:
+    async with case(
+        user_id,
+        None,
+        view_of=InMemoryWritingViewOf(),
+        users=context.users,
+        transaction_for=transaction_for,
+        logger=context.logger,
+        user_mapper_to=InMemoryUserMapperTo(),
+        day_mapper_to=InMemoryDayMapperTo(),
+        record_mapper_to=InMemoryRecordMapperTo(),
+    ) as result:
+        return result
+
+
+@mark.asyncio
+async def test_with_retried_conflicts(
+    context_with_user2: Context, user2: User
+) -> None:
+    context = context_with_user2
+    transaction_for = ConflictingTransactionFor(conflict_count=2)
+
+    result = await write_water(
+        context, user2.id, transaction_for=transaction_for
+    )
+    view = result.unwrap()
+
+    assert transaction_for.transaction_count == 3
+    assert context.users.storage.days == FrozenEntities([view.day])
+    assert context.users.storage.records == FrozenEntities([view.new_record])
+
+
+@mark.asyncio
+async def test_with_exhausted_retries(
+    context_with_user2: Context, user2: User
+) -> None:
+    context = context_with_user2
+    transaction_for = ConflictingTransactionFor(conflict_count=3)
+
+    with raises(TransactionConflictError):
+        await write_water(context, user2.id, transaction_for=transaction_for)
+
+    assert transaction_for.transaction_count == 3
+    assert not context.users.storage.days
+    assert not context.users.storage.records
@@ -1,7 +1,16 @@
 from dataclasses import dataclass
 
-from aqua.domain.framework.effects.searchable import SearchableEffect
-from aqua.domain.framework.entity import Entity, FrozenEntities
+from aqua.domain.framework.effects.searchable import (
+    ChangeSet,
+    SearchableEffect,
+)
+from aqua.domain.framework.entity import (
+    Created,
+    Entity,
+    FrozenEntities,
+    Mutated,
+    Translated,
+)
 
 
 @dataclass(kw_only=True, eq=False)
@@ -19,6 +28,10 @@ class Z(Entity[int, int | str | float]):
     z: float = float()
 
 
+@dataclass(kw_only=True, eq=False)
+class W(Entity[int, Created["W"] | Mutated["W"] | Translated["W", int]]): ...
+
+
 def test_entities_that() -> None:
     x1 = X(id=0, events=list())
     x2 = X(id=1, events=list())
@@ -66,3 +79,40 @@ def test_cancel() -> None:
     assert not effect.entities_that(X)
     assert not effect.entities_that(Y)
     assert not effect.entities_that(Z)
+
+
+def test_change_set_of() -> None:
+    w1 = W(id=0)
+    w1.add_event(Created(entity=w1))
+    w1.add_event(Mutated(entity=w1))
+    w2 = W(id=1)
+    w2.add_event(Mutated(entity=w2))
+    w3 = W(id=2)
+    w3.add_event(Translated(entity=w3, from_=2))
+    w4 = W(id=3)
+
+    effect = SearchableEffect([w1, w2, w3, w4])
+
+    assert effect.change_set_of(W) == ChangeSet(
+        created=FrozenEntities([w1]),
+        mutated=FrozenEntities([w2]),
+        translated=FrozenEntities([w3]),
+    )
+
+
+def test_change_set_of_after_new_events() -> None:
+    w1 = W(id=0)
+    w2 = W(id=1)
+    w2.add_event(Created(entity=w2))
+
+    effect = SearchableEffect([w1, w2])
+
+    w1.add_event(Mutated(entity=w1))
+    effect.consider(w1)
+    effect.ignore(w2)
+
+    assert effect.change_set_of(W) == ChangeSet(
+        created=FrozenEntities(),
+        mutated=FrozenEntities([w1]),
+        translated=FrozenEntities(),
+    )
@@ -66,3 +66,47 @@ def test_with_event() -> None:
     entities_with_event = entities.with_event(int)
 
     assert entities_with_event == FrozenEntities([a, d])
+
+
+def test_with_id() -> None:
+    a = X(id=0, events=list())
+    b = X(id=1, events=list())
+
+    entities = Entities[X]([a, b])
+
+    assert entities.with_id(1) is b
+    assert entities.with_id(2) is None
+
+
+def _parity_of(x: X) -> int:
+    return x.id % 2
+
+
+def test_with_key() -> None:
+    a = X(id=0, events=list())
+    b = X(id=1, events=list())
+    c = X(id=2, events=list())
+
+    entities = Entities[X]([a, b, c])
+
+    assert entities.with_key(0, key_of=_parity_of) == (a, c)
+    assert entities.with_key(1, key_of=_parity_of) == (b,)
+
+
+def test_with_key_after_changes() -> None:
+    a = X(id=0, events=list())
+    b = X(id=1, events=list())
+    c = X(id=2, events=list())
+    d = X(id=3, events=list())
+
+    entities = Entities[X]([a, b])
+    entities.with_key(0, key_of=_parity_of)
+
+    entities.add(c)
+    entities.add(d)
+    entities.remove(a)
+    entities.remove(b)
+
+    assert entities.with_key(0, key_of=_parity_of) == (c,)
+    assert entities.with_key(1, key_of=_parity_of) == (d,)
+    assert entities.with_key(2, key_of=_parity_of) == ()
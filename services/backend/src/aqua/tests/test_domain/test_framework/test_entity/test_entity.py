@@ -1,6 +1,13 @@
 from dataclasses import dataclass
 
-from aqua.domain.framework.entity import Entity
+from pytest import raises
+
+from aqua.domain.framework.entity import (
+    Entities,
+    Entity,
+    ImmutableEventsError,
+    no_events,
+)
 
 
 @dataclass(kw_only=True)
@@ -28,3 +35,72 @@ def test_false_eq_with_x() -> None:
     b = X(id=1, x=5, events=[])
 
     assert a != b
+
+
+def test_add_event_without_events() -> None:
+    x = X(id=0, x=4)
+
+    x.add_event(1)
+    x.add_event("2")
+
+    assert x.events == [1, "2"]
+    assert not no_events
+
+
+def test_no_events_mutation() -> None:
+    with raises(ImmutableEventsError):
+        no_events.append(1)
+
+
+def test_no_events_in_place_addition() -> None:
+    events = no_events
+
+    with raises(ImmutableEventsError):
+        events += [1]
+
+    assert not no_events
+
+
+def test_no_events_in_place_multiplication() -> None:
+    events = no_events
+
+    with raises(ImmutableEventsError):
+        events *= 2
+
+    assert not no_events
+
+
+def test_no_events_slice_assignment() -> None:
+    with raises(ImmutableEventsError):
+        no_events[:] = [1]
+
+    assert not no_events
+
+
+def test_entity_events_in_place_addition() -> None:
+    x = X(id=0, x=4)
+
+    with raises(ImmutableEventsError):
+        x.events += [1]
+
+    assert not no_events
+    assert not X(id=1, x=4).events
+
+
+@dataclass(kw_only=True)
+class Y(Entity[int, int]):
+    x: X
+    xs: Entities[X]
+
+
+def test_without_aggregation() -> None:
+    x = X(id=1, x=4)
+    y = Y(id=0, x=x, xs=Entities([x]), events=[1, 2])
+
+    clone = y.without_aggregation()
+    clone.add_event(3)
+
+    assert clone == Y(id=0, x=x, xs=Entities(), events=[1, 2, 3])
+    assert clone.x is x
+    assert y.events == [1, 2]
+    assert y.xs == Entities([x])
@@ -42,7 +42,13 @@ def test_day() -> None:
     new_water_balance = WaterBalance(
         water=Water.with_(milliliters=300).unwrap()
     )
-    event = NewWaterBalance(entity=day, new_water_balance=new_water_balance)
+    event = NewWaterBalance(
+        entity=day,
+        previous_water_balance=WaterBalance(
+            water=Water.with_(milliliters=800).unwrap()
+        ),
+        new_water_balance=new_water_balance,
+    )
 
     day.ignore(record, effect=SearchableEffect())
 
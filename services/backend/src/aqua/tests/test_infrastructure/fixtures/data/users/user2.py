@@ -166,55 +166,69 @@ def user2_document() -> Document:
         "target": 50_000,
         "glass": 500,
         "weight": 75,
-        "days": [
-            {
-                "_id": UUID(int=1),
-                "date": datetime(2000, 1, 1, tzinfo=bson_utc),
-                "target": 2000,
-                "water_balance": 500,
-                "result": 2,
-                "correct_result": 2,
-                "pinned_result": None,
-            },
-            {
-                "_id": UUID(int=2),
-                "date": datetime(2000, 1, 5, tzinfo=bson_utc),
-                "target": 50_000,
-                "water_balance": 100,
-                "result": 1,
-                "correct_result": 2,
-                "pinned_result": 1,
-            },
-        ],
-        "records": [
-            {
-                "_id": UUID(int=1),
-                "drunk_water": 100,
-                "recording_time": datetime(2000, 1, 5, 20, 15, tzinfo=bson_utc),
-                "is_cancelled": False,
-            },
-            {
-                "_id": UUID(int=2),
-                "drunk_water": 100_000,
-                "recording_time": datetime(2000, 1, 1, 16, 00, tzinfo=bson_utc),
-                "is_cancelled": True,
-            },
-            {
-                "_id": UUID(int=3),
-                "drunk_water": 290,
-                "recording_time": datetime(2000, 1, 1, 15, 30, tzinfo=bson_utc),
-                "is_cancelled": False,
-            },
-            {
-                "_id": UUID(int=4),
-                "drunk_water": 210,
-                "recording_time": datetime(2000, 1, 1, 10, 30, tzinfo=bson_utc),
-                "is_cancelled": False,
-            },
-        ],
     }
 
 
+@fixture
+def user2_day_documents() -> list[Document]:
+    return [
+        {
+            "_id": UUID(int=1),
+            "user_id": UUID(int=2),
+            "date": datetime(2000, 1, 1, tzinfo=bson_utc),
+            "target": 2000,
+            "water_balance": 500,
+            "result": 2,
+            "correct_result": 2,
+            "pinned_result": None,
+        },
+        {
+            "_id": UUID(int=2),
+            "user_id": UUID(int=2),
+            "date": datetime(2000, 1, 5, tzinfo=bson_utc),
+            "target": 50_000,
+            "water_balance": 100,
+            "result": 1,
+            "correct_result": 2,
+            "pinned_result": 1,
+        },
+    ]
+
+
+@fixture
+def user2_record_documents() -> list[Document]:
+    return [
+        {
+            "_id": UUID(int=1),
+            "user_id": UUID(int=2),
+            "drunk_water": 100,
+            "recording_time": datetime(2000, 1, 5, 20, 15, tzinfo=bson_utc),
+            "is_cancelled": False,
+        },
+        {
+            "_id": UUID(int=2),
+            "user_id": UUID(int=2),
+            "drunk_water": 100_000,
+            "recording_time": datetime(2000, 1, 1, 16, 00, tzinfo=bson_utc),
+            "is_cancelled": True,
+        },
+        {
+            "_id": UUID(int=3),
+            "user_id": UUID(int=2),
+            "drunk_water": 290,
+            "recording_time": datetime(2000, 1, 1, 15, 30, tzinfo=bson_utc),
+            "is_cancelled": False,
+        },
+        {
+            "_id": UUID(int=4),
+            "user_id": UUID(int=2),
+            "drunk_water": 210,
+            "recording_time": datetime(2000, 1, 1, 10, 30, tzinfo=bson_utc),
+            "is_cancelled": False,
+        },
+    ]
+
+
 @fixture
 def user2_db_view_on_day1() -> DBUserViewData:
     record3_view = DBUserViewRecordData(
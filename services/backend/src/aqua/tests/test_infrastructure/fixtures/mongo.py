@@ -10,6 +10,7 @@ from aqua.infrastructure.periphery.pymongo.clients import (
     client_with,
 )
 from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
 
 
 @fixture(scope="session")
@@ -27,6 +28,11 @@ async def mongo_session(
         yield session
 
 
+@fixture
+def mongo_batch(mongo_session: AsyncMongoSession) -> OperationBatch:
+    return OperationBatch(mongo_session)
+
+
 @fixture
 async def empty_mongo(
     mongo_client: AsyncMongoClient[Document],
@@ -35,15 +41,29 @@ async def empty_mongo(
     await mongo_client.db.users.delete_many(
         {}, session=mongo_session, comment="clear test users"
     )
+    await mongo_client.db.days.delete_many(
+        {}, session=mongo_session, comment="clear test days"
+    )
+    await mongo_client.db.records.delete_many(
+        {}, session=mongo_session, comment="clear test records"
+    )
 
 
 @fixture
-async def full_mongo(
+async def full_mongo(  # noqa: PLR0917
     empty_mongo: None,  # noqa: ARG001
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
     user_documents: list[Document],
+    day_documents: list[Document],
+    record_documents: list[Document],
 ) -> None:
     await mongo_client.db.users.insert_many(
         user_documents, session=mongo_session, comment="add test users"
     )
+    await mongo_client.db.days.insert_many(
+        day_documents, session=mongo_session, comment="add test days"
+    )
+    await mongo_client.db.records.insert_many(
+        record_documents, session=mongo_session, comment="add test records"
+    )
@@ -1,13 +1,11 @@
-from pymongo.asynchronous.client_session import (
-    AsyncClientSession as AsyncMongoSession,
-)
 from pytest import fixture
 
 from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
     MongoDayMapper,
 )
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
 
 
 @fixture
-def day_mapper(mongo_session: AsyncMongoSession) -> MongoDayMapper:
-    return MongoDayMapper(mongo_session)
+def day_mapper(mongo_batch: OperationBatch) -> MongoDayMapper:
+    return MongoDayMapper(mongo_batch)
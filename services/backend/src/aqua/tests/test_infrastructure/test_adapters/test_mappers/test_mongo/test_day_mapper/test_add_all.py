@@ -8,6 +8,7 @@ from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
     MongoDayMapper,
 )
 from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
 
 
 async def test_with_user2_days(  # noqa: PLR0917
@@ -15,32 +16,31 @@ async def test_with_user2_days(  # noqa: PLR0917
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
     user2_days: list[Day],
-    user2_document: Document,
+    user2_day_documents: list[Document],
+    mongo_batch: OperationBatch,
     day_mapper: MongoDayMapper,
 ) -> None:
     await day_mapper.add_all(user2_days)
+    await mongo_batch.execute()
 
-    del user2_document["records"]
-    del user2_document["target"]
-    del user2_document["glass"]
-    del user2_document["weight"]
-
-    async_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_documents = mongo_client.db.days.find({}, session=mongo_session)
     stored_documents = [document async for document in async_documents]
 
-    assert [user2_document] == stored_documents
+    assert user2_day_documents == stored_documents
 
 
-async def test_without_users(
+async def test_without_users(  # noqa: PLR0917
     full_mongo: None,  # noqa: ARG001
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
-    user_documents: list[Document],
+    day_documents: list[Document],
+    mongo_batch: OperationBatch,
     day_mapper: MongoDayMapper,
 ) -> None:
     await day_mapper.add_all([])
+    await mongo_batch.execute()
 
-    async_db_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_db_documents = mongo_client.db.days.find({}, session=mongo_session)
     db_documents = [document async for document in async_db_documents]
 
-    assert user_documents == db_documents
+    assert day_documents == db_documents
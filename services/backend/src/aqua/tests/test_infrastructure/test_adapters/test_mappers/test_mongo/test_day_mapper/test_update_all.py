@@ -2,8 +2,13 @@ from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import (
     AsyncClientSession as AsyncMongoSession,
 )
+from pymongo.errors import ClientBulkWriteException
+from pytest import raises
 
-from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
+from aqua.domain.model.core.aggregates.user.internal.entities.day import (
+    Day,
+    NewWaterBalance,
+)
 from aqua.domain.model.core.vos.target import Target
 from aqua.domain.model.core.vos.water_balance import (
     WaterBalance,
@@ -13,6 +18,7 @@ from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
     MongoDayMapper,
 )
 from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
 
 
 async def test_with_user2_day2(  # noqa: PLR0917
@@ -20,7 +26,8 @@ async def test_with_user2_day2(  # noqa: PLR0917
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
     user2_day2: Day,
-    user_documents: list[Document],
+    day_documents: list[Document],
+    mongo_batch: OperationBatch,
     day_mapper: MongoDayMapper,
 ) -> None:
     user2_day2.target = Target(
@@ -31,24 +38,94 @@ async def test_with_user2_day2(  # noqa: PLR0917
 
     await day_mapper.update_all([user2_day2])
 
-    user_documents[1]["days"][1]["target"] = 5_000_000
+    await mongo_batch.execute()
+
+    day_documents[1]["target"] = 5_000_000
+
+    async_documents = mongo_client.db.days.find({}, session=mongo_session)
+    stored_documents = [document async for document in async_documents]
+
+    assert day_documents == stored_documents
+
+
+async def test_with_actual_previous_water_balance(  # noqa: PLR0917
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    user2_day2: Day,
+    day_documents: list[Document],
+    mongo_batch: OperationBatch,
+    day_mapper: MongoDayMapper,
+) -> None:
+    new_water_balance = WaterBalance(
+        water=Water.with_(milliliters=400).unwrap()
+    )
+    user2_day2.events.append(
+        NewWaterBalance(
+            entity=user2_day2,
+            previous_water_balance=user2_day2.water_balance,
+            new_water_balance=new_water_balance,
+        )
+    )
+    user2_day2.water_balance = new_water_balance
+
+    await day_mapper.update_all([user2_day2])
+
+    await mongo_batch.execute()
+
+    day_documents[1]["water_balance"] = 400
+
+    async_documents = mongo_client.db.days.find({}, session=mongo_session)
+    stored_documents = [document async for document in async_documents]
+
+    assert day_documents == stored_documents
+
+
+async def test_with_outdated_previous_water_balance(  # noqa: PLR0917
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    user2_day2: Day,
+    day_documents: list[Document],
+    mongo_batch: OperationBatch,
+    day_mapper: MongoDayMapper,
+) -> None:
+    new_water_balance = WaterBalance(
+        water=Water.with_(milliliters=400).unwrap()
+    )
+    user2_day2.events.append(
+        NewWaterBalance(
+            entity=user2_day2,
+            previous_water_balance=WaterBalance(
+                water=Water.with_(milliliters=300).unwrap()
+            ),
+            new_water_balance=new_water_balance,
+        )
+    )
+    user2_day2.water_balance = new_water_balance
+
+    with raises(ClientBulkWriteException):
+        await day_mapper.update_all([user2_day2])
+        await mongo_batch.execute()
 
-    async_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_documents = mongo_client.db.days.find({}, session=mongo_session)
     stored_documents = [document async for document in async_documents]
 
-    assert user_documents == stored_documents
+    assert day_documents == stored_documents
 
 
-async def test_without_users(
+async def test_without_users(  # noqa: PLR0917
     full_mongo: None,  # noqa: ARG001
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
-    user_documents: list[Document],
+    day_documents: list[Document],
+    mongo_batch: OperationBatch,
     day_mapper: MongoDayMapper,
 ) -> None:
     await day_mapper.update_all([])
+    await mongo_batch.execute()
 
-    async_db_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_db_documents = mongo_client.db.days.find({}, session=mongo_session)
     db_documents = [document async for document in async_db_documents]
 
-    assert user_documents == db_documents
+    assert day_documents == db_documents
@@ -0,0 +1,23 @@
+from pymongo import AsyncMongoClient
+
+from aqua.infrastructure.adapters.mappers.mongo.index_registry import (
+    index_registry,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.indexes import (
+    IndexReport,
+    ensure_indexes,
+    index_report_of,
+)
+
+
+async def test_ensured_indexes(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    await ensure_indexes(mongo_client, index_registry)
+    await ensure_indexes(mongo_client, index_registry)
+
+    report = await index_report_of(mongo_client, index_registry)
+
+    assert report == IndexReport(missing_index_names=(), unused_index_names=())
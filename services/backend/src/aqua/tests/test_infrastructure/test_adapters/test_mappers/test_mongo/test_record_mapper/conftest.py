@@ -1,13 +1,11 @@
-from pymongo.asynchronous.client_session import (
-    AsyncClientSession as AsyncMongoSession,
-)
 from pytest import fixture
 
 from aqua.infrastructure.adapters.mappers.mongo.record_mapper import (
     MongoRecordMapper,
 )
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
 
 
 @fixture
-def record_mapper(mongo_session: AsyncMongoSession) -> MongoRecordMapper:
-    return MongoRecordMapper(mongo_session)
+def record_mapper(mongo_batch: OperationBatch) -> MongoRecordMapper:
+    return MongoRecordMapper(mongo_batch)
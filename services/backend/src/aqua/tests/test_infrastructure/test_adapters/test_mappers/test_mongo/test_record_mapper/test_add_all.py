@@ -10,6 +10,7 @@ from aqua.infrastructure.adapters.mappers.mongo.record_mapper import (
     MongoRecordMapper,
 )
 from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
 
 
 async def test_with_user2_records(  # noqa: PLR0917
@@ -17,32 +18,31 @@ async def test_with_user2_records(  # noqa: PLR0917
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
     user2_records: list[Record],
-    user2_document: Document,
+    user2_record_documents: list[Document],
+    mongo_batch: OperationBatch,
     record_mapper: MongoRecordMapper,
 ) -> None:
     await record_mapper.add_all(user2_records)
+    await mongo_batch.execute()
 
-    del user2_document["days"]
-    del user2_document["target"]
-    del user2_document["glass"]
-    del user2_document["weight"]
-
-    async_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_documents = mongo_client.db.records.find({}, session=mongo_session)
     stored_documents = [document async for document in async_documents]
 
-    assert [user2_document] == stored_documents
+    assert user2_record_documents == stored_documents
 
 
-async def test_without_users(
+async def test_without_users(  # noqa: PLR0917
     full_mongo: None,  # noqa: ARG001
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
-    user_documents: list[Document],
+    record_documents: list[Document],
+    mongo_batch: OperationBatch,
     record_mapper: MongoRecordMapper,
 ) -> None:
     await record_mapper.add_all([])
+    await mongo_batch.execute()
 
-    async_db_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_db_documents = mongo_client.db.records.find({}, session=mongo_session)
     db_documents = [document async for document in async_db_documents]
 
-    assert user_documents == db_documents
+    assert record_documents == db_documents
@@ -1,13 +1,11 @@
-from pymongo.asynchronous.client_session import (
-    AsyncClientSession as AsyncMongoSession,
-)
 from pytest import fixture
 
 from aqua.infrastructure.adapters.mappers.mongo.user_mapper import (
     MongoUserMapper,
 )
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
 
 
 @fixture
-def user_mapper(mongo_session: AsyncMongoSession) -> MongoUserMapper:
-    return MongoUserMapper(mongo_session)
+def user_mapper(mongo_batch: OperationBatch) -> MongoUserMapper:
+    return MongoUserMapper(mongo_batch)
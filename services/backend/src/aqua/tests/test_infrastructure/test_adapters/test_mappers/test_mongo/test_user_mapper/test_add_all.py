@@ -8,6 +8,7 @@ from aqua.infrastructure.adapters.mappers.mongo.user_mapper import (
     MongoUserMapper,
 )
 from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
 
 
 async def test_with_users(  # noqa: PLR0917
@@ -16,13 +17,11 @@ async def test_with_users(  # noqa: PLR0917
     mongo_session: AsyncMongoSession,
     users: list[User],
     user_documents: list[Document],
+    mongo_batch: OperationBatch,
     user_mapper: MongoUserMapper,
 ) -> None:
     await user_mapper.add_all(users)
-
-    for user_document in user_documents:
-        del user_document["records"]
-        del user_document["days"]
+    await mongo_batch.execute()
 
     async_documents = mongo_client.db.users.find({}, session=mongo_session)
     added_documents = [document async for document in async_documents]
@@ -30,14 +29,16 @@ async def test_with_users(  # noqa: PLR0917
     assert user_documents == added_documents
 
 
-async def test_without_users(
+async def test_without_users(  # noqa: PLR0917
     full_mongo: None,  # noqa: ARG001
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
     user_documents: list[Document],
+    mongo_batch: OperationBatch,
     user_mapper: MongoUserMapper,
 ) -> None:
     await user_mapper.add_all([])
+    await mongo_batch.execute()
 
     async_db_documents = mongo_client.db.users.find({}, session=mongo_session)
     db_documents = [document async for document in async_db_documents]
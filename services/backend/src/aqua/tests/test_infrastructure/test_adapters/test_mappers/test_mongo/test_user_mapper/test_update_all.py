@@ -10,6 +10,7 @@ from aqua.infrastructure.adapters.mappers.mongo.user_mapper import (
     MongoUserMapper,
 )
 from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
 
 
 async def test_with_mutated_user1(  # noqa: PLR0917
@@ -18,12 +19,15 @@ async def test_with_mutated_user1(  # noqa: PLR0917
     mongo_session: AsyncMongoSession,
     user1: User,
     user_documents: list[Document],
+    mongo_batch: OperationBatch,
     user_mapper: MongoUserMapper,
 ) -> None:
     user1.glass = Glass(capacity=Water.with_(milliliters=5_000_000).unwrap())
 
     await user_mapper.update_all([user1])
 
+    await mongo_batch.execute()
+
     user_documents[0]["glass"] = 5_000_000
 
     async_db_documents = mongo_client.db.users.find({}, session=mongo_session)
@@ -32,14 +36,16 @@ async def test_with_mutated_user1(  # noqa: PLR0917
     assert user_documents == db_documents
 
 
-async def test_without_users(
+async def test_without_users(  # noqa: PLR0917
     full_mongo: None,  # noqa: ARG001
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
     user_documents: list[Document],
+    mongo_batch: OperationBatch,
     user_mapper: MongoUserMapper,
 ) -> None:
     await user_mapper.update_all([])
+    await mongo_batch.execute()
 
     async_db_documents = mongo_client.db.users.find({}, session=mongo_session)
     db_documents = [document async for document in async_db_documents]
@@ -0,0 +1,52 @@
+from datetime import date
+from uuid import UUID
+
+from aqua.domain.framework.entity import Entities
+from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
+from aqua.domain.model.core.aggregates.user.internal.entities.record import (
+    Record,
+)
+from aqua.domain.model.core.aggregates.user.root import User
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+
+
+async def test_user2_on_day1(  # noqa: PLR0917
+    full_mongo: None,  # noqa: ARG001
+    user2: User,
+    user2_day1: Day,
+    user2_record2: Record,
+    user2_record3: Record,
+    user2_record4: Record,
+    mongo_users: MongoUsers,
+) -> None:
+    result = await mongo_users.user_with_id_and_day(
+        user2.id, date_=date(2000, 1, 1)
+    )
+
+    user2.days = Entities([user2_day1])
+    user2.records = Entities([user2_record2, user2_record3, user2_record4])
+
+    assert result == user2
+
+
+async def test_user2_without_day(
+    full_mongo: None,  # noqa: ARG001
+    user2: User,
+    mongo_users: MongoUsers,
+) -> None:
+    result = await mongo_users.user_with_id_and_day(
+        user2.id, date_=date(2000, 1, 2)
+    )
+
+    user2.days = Entities()
+    user2.records = Entities()
+
+    assert result == user2
+
+
+async def test_no_user(full_mongo: None, mongo_users: MongoUsers) -> None:  # noqa: ARG001
+    result = await mongo_users.user_with_id_and_day(
+        UUID(int=8), date_=date(2000, 1, 1)
+    )
+
+    assert result is None
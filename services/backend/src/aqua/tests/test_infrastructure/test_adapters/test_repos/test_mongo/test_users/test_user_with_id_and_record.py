@@ -0,0 +1,49 @@
+from uuid import UUID
+
+from aqua.domain.framework.entity import Entities
+from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
+from aqua.domain.model.core.aggregates.user.internal.entities.record import (
+    Record,
+)
+from aqua.domain.model.core.aggregates.user.root import User
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+
+
+async def test_user2_with_record1(
+    full_mongo: None,  # noqa: ARG001
+    user2: User,
+    user2_day2: Day,
+    user2_record1: Record,
+    mongo_users: MongoUsers,
+) -> None:
+    result = await mongo_users.user_with_id_and_record(
+        user2.id, record_id=user2_record1.id
+    )
+
+    user2.days = Entities([user2_day2])
+    user2.records = Entities([user2_record1])
+
+    assert result == user2
+
+
+async def test_user2_without_record(
+    full_mongo: None,  # noqa: ARG001
+    user2: User,
+    mongo_users: MongoUsers,
+) -> None:
+    result = await mongo_users.user_with_id_and_record(
+        user2.id, record_id=UUID(int=8)
+    )
+
+    user2.days = Entities()
+    user2.records = Entities()
+
+    assert result == user2
+
+
+async def test_no_user(full_mongo: None, mongo_users: MongoUsers) -> None:  # noqa: ARG001
+    result = await mongo_users.user_with_id_and_record(
+        UUID(int=8), record_id=UUID(int=1)
+    )
+
+    assert result is None
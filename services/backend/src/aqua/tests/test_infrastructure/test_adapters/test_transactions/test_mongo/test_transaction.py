@@ -1,20 +1,24 @@
 from uuid import UUID
 
-from pymongo import AsyncMongoClient
+from pymongo import AsyncMongoClient, UpdateOne
 from pymongo.asynchronous.client_session import (
     AsyncClientSession as AsyncMongoSession,
 )
 from pytest import fixture, raises
 
+from aqua.application.ports.transactions import TransactionConflictError
 from aqua.infrastructure.adapters.transactions.mongo.transaction import (
     MongoTransaction,
 )
 from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
 
 
 @fixture
-def transaction(mongo_session: AsyncMongoSession) -> MongoTransaction:
-    return MongoTransaction(mongo_session)
+def transaction(
+    mongo_session: AsyncMongoSession, mongo_batch: OperationBatch
+) -> MongoTransaction:
+    return MongoTransaction(mongo_session, mongo_batch)
 
 
 async def test_positive_case(
@@ -76,3 +80,27 @@ async def test_rollback(
 
     results = await mongo_client.db.users.find(session=mongo_session).to_list()
     assert [document] == results
+
+
+async def test_with_optimistic_guard_conflict(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    mongo_batch: OperationBatch,
+    transaction: MongoTransaction,
+) -> None:
+    document = {"_id": UUID(int=0), "x": 5}
+    await mongo_client.db.users.insert_one(document, session=mongo_session)
+
+    with raises(TransactionConflictError):
+        async with transaction:
+            operation = UpdateOne(
+                {"_id": UUID(int=0), "x": 4},
+                {"$set": {"x": 6}},
+                upsert=True,
+                namespace="db.users",
+            )
+            mongo_batch.add([operation], label="update users")
+
+    results = await mongo_client.db.users.find(session=mongo_session).to_list()
+    assert [document] == results
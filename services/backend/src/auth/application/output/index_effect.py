@@ -0,0 +1,15 @@
+from auth.application.ports.account_name_index import AccountNameIndex
+from auth.domain.framework.effects.searchable import SearchableEffect
+from auth.domain.framework.entity import Created
+from auth.domain.models.access.aggregates import account as _account
+
+
+async def index_effect(
+    effect: SearchableEffect, account_name_index: AccountNameIndex
+) -> None:
+    names = effect.entities_that(
+        _account.internal.entities.account_name.AccountName
+    )
+    created_names = names.with_event(Created)
+
+    await account_name_index.add(*(name.text for name in created_names))
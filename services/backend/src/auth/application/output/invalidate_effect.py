@@ -0,0 +1,22 @@
+from auth.application.ports.session_cache import SessionCache
+from auth.domain.framework.effects.searchable import SearchableEffect
+from auth.domain.models.access.aggregates import account as _account
+
+
+async def invalidate_effect(
+    effect: SearchableEffect, session_cache: SessionCache
+) -> None:
+    sessions = effect.entities_that(_account.internal.entities.session.Session)
+
+    replaced_sessions = sessions.with_event(
+        _account.internal.entities.session.Replaced
+    )
+    cancelled_sessions = sessions.with_event(
+        _account.internal.entities.session.Cancelled
+    )
+
+    for replaced_session in replaced_sessions:
+        await session_cache.invalidate(replaced_session.id)
+
+    for cancelled_session in cancelled_sessions:
+        await session_cache.invalidate(cancelled_session.id)
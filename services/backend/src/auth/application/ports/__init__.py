@@ -1,5 +1,7 @@
+from auth.application.ports import account_name_index as account_name_index
 from auth.application.ports import gateway as gateway
 from auth.application.ports import loggers as loggers
 from auth.application.ports import mappers as mappers
 from auth.application.ports import repos as repos
+from auth.application.ports import session_cache as session_cache
 from auth.application.ports import views as views
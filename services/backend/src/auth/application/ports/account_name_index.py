@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+
+class AccountNameIndex(ABC):
+    @abstractmethod
+    def may_contain(self, name_text: str) -> bool: ...
+
+    @abstractmethod
+    async def add(self, *name_texts: str) -> None: ...
@@ -27,7 +27,10 @@ class AccountMapper(Mapper[_account.root.Account]): ...
 
 class AccountNameMapper(
     Mapper[_account.internal.entities.account_name.AccountName]
-): ...
+):
+    class Error(Exception): ...
+
+    class TakenTextError(Error): ...
 
 
 class SessionMapper(Mapper[_account.internal.entities.session.Session]): ...
@@ -1,19 +1,27 @@
 from abc import ABC, abstractmethod
+from typing import Literal
 from uuid import UUID
 
 from auth.domain.models.access.aggregates.account.root import Account
 
 
+type MutationIntent = Literal["account", "session", "nothing"]
+
+
 class Accounts(ABC):
     @abstractmethod
-    async def account_with_name(self, *, name_text: str) -> Account | None: ...
+    async def account_with_name(
+        self, *, name_text: str, intent: MutationIntent = "nothing"
+    ) -> Account | None: ...
 
     @abstractmethod
-    async def account_with_id(self, account_id: UUID) -> Account | None: ...
+    async def account_with_id(
+        self, account_id: UUID, *, intent: MutationIntent = "nothing"
+    ) -> Account | None: ...
 
     @abstractmethod
     async def account_with_session(
-        self, *, session_id: UUID
+        self, *, session_id: UUID, intent: MutationIntent = "nothing"
     ) -> Account | None: ...
 
     @abstractmethod
@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class SessionCache(ABC):
+    @abstractmethod
+    async def invalidate(self, session_id: UUID) -> None: ...
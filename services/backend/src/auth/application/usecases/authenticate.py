@@ -1,32 +1,28 @@
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import AsyncIterator, Literal, TypeAlias
+from typing import AsyncIterator, Literal
 from uuid import UUID
 
-from result import Err, Result
+from result import Err, Ok, Result
 
 from auth.application.output.log_effect import log_effect
-from auth.application.output.map_effect import Mappers, map_effect
+from auth.application.ports.gateway import GatewayFactory
 from auth.application.ports.loggers import Logger
-from auth.application.ports.mappers import MapperFactory
 from auth.application.ports.repos import Accounts
 from auth.application.ports.transactions import TransactionFactory
 from auth.domain.framework.effects.searchable import SearchableEffect
-from auth.domain.framework.result import swap
-from auth.domain.models.access.aggregates import account as _account
+from auth.domain.models.access.aggregates.account.internal.entities import (
+    session as _session,
+)
 from auth.domain.models.access.vos.time import Time
 
 
-_Account: TypeAlias = _account.root.Account
-_AccountName: TypeAlias = _account.internal.entities.account_name.AccountName
-_Session: TypeAlias = _account.internal.entities.session.Session
-
-
 @dataclass(kw_only=True, frozen=True, slots=True)
 class Output:
     account_id: UUID
     session_id: UUID
+    session_end_time: datetime
 
 
 @asynccontextmanager
@@ -34,16 +30,14 @@ async def authenticate[AccountsT: Accounts](
     session_id: UUID,
     *,
     accounts: AccountsT,
-    account_mapper_in: MapperFactory[AccountsT, _Account],
-    account_name_mapper_in: MapperFactory[AccountsT, _AccountName],
-    session_mapper_in: MapperFactory[AccountsT, _Session],
+    gateway_to: GatewayFactory[AccountsT],
     transaction_for: TransactionFactory[AccountsT],
     logger: Logger,
+    session_extension_threshold: float,
 ) -> AsyncIterator[
     Result[
         Output,
         Literal[
-            "no_account",
             "no_session_for_secondary_authentication",
             "expired_session_for_secondary_authentication",
             "cancelled_session_for_secondary_authentication",
@@ -54,33 +48,53 @@ async def authenticate[AccountsT: Accounts](
     current_time = Time.with_(datetime_=datetime.now(UTC)).unwrap()
 
     async with transaction_for(accounts) as transaction:
-        account = await accounts.account_with_session(session_id=session_id)
+        gateway = gateway_to(accounts)
+        session = await gateway.session_with_id(session_id)
 
-        if account is None:
+        if session is None:
             await transaction.rollback()
-            yield Err("no_account")
+            yield Err("no_session_for_secondary_authentication")
             return
 
         effect = SearchableEffect()
-        session_result = account.secondarily_authenticate(
-            session_id=session_id, current_time=current_time, effect=effect
-        )
-        await swap(session_result).map_async(lambda _: transaction.rollback())
+        previous_lifetime = session.lifetime
+
+        match _session.secondarily_authenticate(
+            session,
+            current_time=current_time,
+            extension_threshold=session_extension_threshold,
+            effect=effect,
+        ):
+            case Err(error):
+                await transaction.rollback()
+                yield Err(error)
+                return
+            case Ok(_):
+                pass
 
-        await session_result.map_async(lambda _: log_effect(effect, logger))
-        await session_result.map_async(
-            lambda _: map_effect(
-                effect,
-                Mappers(
-                    (_Account, account_mapper_in(accounts)),
-                    (_AccountName, account_name_mapper_in(accounts)),
-                    (_Session, session_mapper_in(accounts)),
-                ),
+        is_extended = session.lifetime == previous_lifetime or (
+            await gateway.extend_session(
+                session, previous_lifetime=previous_lifetime
             )
         )
 
-        yield session_result.map(
-            lambda session: (
-                Output(account_id=account.id, session_id=session.id)
+        if not is_extended:
+            effect = SearchableEffect()
+            session = await gateway.session_with_id(session_id)
+
+            if session is None or not session.is_active(
+                current_time=current_time
+            ):
+                await transaction.rollback()
+                yield Err("no_session_for_secondary_authentication")
+                return
+
+        await log_effect(effect, logger)
+
+        yield Ok(
+            Output(
+                account_id=session.account_id,
+                session_id=session.id,
+                session_end_time=session.lifetime.end_time.datetime_,
             )
         )
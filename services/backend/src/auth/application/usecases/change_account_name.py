@@ -6,15 +6,13 @@ from uuid import UUID
 
 from result import Err, Result
 
-from auth.application.adapters.specs import (
-    IsAccountNameTextTakenBasedOnCache,
-    IsAccountNameTextTakenInRepo,
-)
+from auth.application.adapters.specs import IsAccountNameTextTakenInMapping
+from auth.application.output.index_effect import index_effect
 from auth.application.output.log_effect import log_effect
 from auth.application.output.map_effect import Mappers, map_effect
-from auth.application.ports.gateway import GatewayFactory
+from auth.application.ports.account_name_index import AccountNameIndex
 from auth.application.ports.loggers import Logger
-from auth.application.ports.mappers import MapperFactory
+from auth.application.ports.mappers import AccountNameMapper, MapperFactory
 from auth.application.ports.repos import Accounts
 from auth.application.ports.transactions import TransactionFactory
 from auth.domain.framework.effects.searchable import SearchableEffect
@@ -43,12 +41,12 @@ async def change_account_name[AccountsT: Accounts](
     account_name_text: str,
     *,
     accounts: AccountsT,
-    gateway_to: GatewayFactory[AccountsT],
     account_mapper_in: MapperFactory[AccountsT, _Account],
     account_name_mapper_in: MapperFactory[AccountsT, _AccountName],
     session_mapper_in: MapperFactory[AccountsT, _Session],
     transaction_for: TransactionFactory[AccountsT],
     logger: Logger,
+    account_name_index: AccountNameIndex,
 ) -> AsyncIterator[
     Result[
         Output,
@@ -60,19 +58,7 @@ async def change_account_name[AccountsT: Accounts](
     current_time = Time.with_(datetime_=datetime.now(UTC)).unwrap()
 
     async with transaction_for(accounts) as transaction:
-        gateway = gateway_to(accounts)
-        gateway_result = (
-            await gateway.account_with_id_and_contains_account_name_with_text(
-                account_id=account_id,
-                account_name_text=account_name_text,
-            )
-        )
-        account = gateway_result.account
-        is_account_name_text_taken = IsAccountNameTextTakenBasedOnCache.of(
-            gateway_result,
-            name_text=account_name_text,
-            is_account_name_text_taken=IsAccountNameTextTakenInRepo(accounts),
-        )
+        account = await accounts.account_with_id(account_id, intent="account")
 
         if not account:
             await transaction.rollback()
@@ -85,11 +71,27 @@ async def change_account_name[AccountsT: Accounts](
             current_time=current_time,
             effect=effect,
             is_account_name_taken=_is_account_name_taken.IsAccountNameTaken(
-                is_account_name_text_taken
+                IsAccountNameTextTakenInMapping()
             ),
         )
         await swap(result).map_async(lambda _: transaction.rollback())
 
+        try:
+            await result.map_async(
+                lambda _: map_effect(
+                    effect,
+                    Mappers(
+                        (_Account, account_mapper_in(accounts)),
+                        (_AccountName, account_name_mapper_in(accounts)),
+                        (_Session, session_mapper_in(accounts)),
+                    ),
+                )
+            )
+        except AccountNameMapper.TakenTextError:
+            await transaction.rollback()
+            yield Err("account_name_is_taken")
+            return
+
         async def act(output: _Account.NameChangeOutput) -> None:
             if output.previous_name is not None:
                 await logger.log_renaming(
@@ -101,16 +103,6 @@ async def change_account_name[AccountsT: Accounts](
         await result.map_async(act)
 
         await result.map_async(lambda _: log_effect(effect, logger))
-        await result.map_async(
-            lambda _: map_effect(
-                effect,
-                Mappers(
-                    (_Account, account_mapper_in(accounts)),
-                    (_AccountName, account_name_mapper_in(accounts)),
-                    (_Session, session_mapper_in(accounts)),
-                ),
-            )
-        )
 
         yield result.map(
             lambda output: Output(
@@ -118,3 +110,5 @@ async def change_account_name[AccountsT: Accounts](
                 previous_account_name=output.previous_name,
             )
         )
+
+    await result.map_async(lambda _: index_effect(effect, account_name_index))
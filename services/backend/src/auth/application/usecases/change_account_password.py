@@ -5,15 +5,20 @@ from uuid import UUID
 
 from result import Err, Ok, Result
 
+from auth.application.output.invalidate_effect import invalidate_effect
 from auth.application.output.log_effect import log_effect
 from auth.application.output.map_effect import Mappers, map_effect
 from auth.application.ports.loggers import Logger
 from auth.application.ports.mappers import MapperFactory
 from auth.application.ports.repos import Accounts
+from auth.application.ports.session_cache import SessionCache
 from auth.application.ports.transactions import TransactionFactory
 from auth.domain.framework.effects.searchable import SearchableEffect
 from auth.domain.framework.result import swap
 from auth.domain.models.access.aggregates import account as _account
+from auth.domain.models.access.aggregates.account.ports.hashers import (
+    password_hasher as _password_hasher,
+)
 from auth.domain.models.access.vos.password import Password
 
 
@@ -40,6 +45,8 @@ async def change_account_password[AccountsT: Accounts](
     session_mapper_in: MapperFactory[AccountsT, _Session],
     transaction_for: TransactionFactory[AccountsT],
     logger: Logger,
+    password_hasher: _password_hasher.PasswordHasher,
+    session_cache: SessionCache,
 ) -> AsyncIterator[
     Result[
         Output,
@@ -61,8 +68,21 @@ async def change_account_password[AccountsT: Accounts](
             yield r
             return
 
+    async with transaction_for(accounts):
+        unlocked_account = await accounts.account_with_id(account_id)
+
+    if unlocked_account is None:
+        yield Err("no_account")
+        return
+
+    password_change_check = await _account.root.password_change_check_of(
+        unlocked_account.password_hash,
+        new_password=new_password,
+        password_hasher=password_hasher,
+    )
+
     async with transaction_for(accounts) as transaction:
-        account = await accounts.account_with_id(account_id)
+        account = await accounts.account_with_id(account_id, intent="account")
 
         if not account:
             await transaction.rollback()
@@ -70,10 +90,12 @@ async def change_account_password[AccountsT: Accounts](
             return
 
         effect = SearchableEffect()
-        result = account.change_password(
+        result = await account.change_password(
             new_password=new_password,
             current_session_id=session_id,
+            password_hasher=password_hasher,
             effect=effect,
+            password_change_check=password_change_check,
         )
         await swap(result).map_async(lambda _: transaction.rollback())
 
@@ -95,3 +117,5 @@ async def change_account_password[AccountsT: Accounts](
         yield result.map(
             lambda session: Output(account=account, session=session)
         )
+
+    await result.map_async(lambda _: invalidate_effect(effect, session_cache))
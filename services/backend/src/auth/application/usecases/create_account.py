@@ -6,16 +6,17 @@ from uuid import UUID
 
 from result import Err, Ok, Result
 
-from auth.application.adapters.specs import (
-    IsAccountNameTextTakenBasedOnCache,
-    IsAccountNameTextTakenInRepo,
-)
+from auth.application.adapters.specs import IsAccountNameTextTakenInMapping
+from auth.application.output.index_effect import index_effect
+from auth.application.output.invalidate_effect import invalidate_effect
 from auth.application.output.log_effect import log_effect
 from auth.application.output.map_effect import Mappers, map_effect
+from auth.application.ports.account_name_index import AccountNameIndex
 from auth.application.ports.gateway import GatewayFactory
 from auth.application.ports.loggers import Logger
-from auth.application.ports.mappers import MapperFactory
+from auth.application.ports.mappers import AccountNameMapper, MapperFactory
 from auth.application.ports.repos import Accounts
+from auth.application.ports.session_cache import SessionCache
 from auth.application.ports.transactions import TransactionFactory
 from auth.domain.framework.effects.searchable import SearchableEffect
 from auth.domain.framework.result import swap
@@ -23,8 +24,8 @@ from auth.domain.models.access.aggregates import account as _account
 from auth.domain.models.access.aggregates.account.internal.specs import (
     is_account_name_taken as _is_account_name_taken,
 )
-from auth.domain.models.access.aggregates.account.ports.specs import (
-    is_account_name_text_taken as _is_account_name_text_taken,
+from auth.domain.models.access.aggregates.account.ports.hashers import (
+    password_hasher as _password_hasher,
 )
 from auth.domain.models.access.vos.password import Password
 from auth.domain.models.access.vos.time import Time
@@ -33,9 +34,6 @@ from auth.domain.models.access.vos.time import Time
 _Account: TypeAlias = _account.root.Account
 _AccountName: TypeAlias = _account.internal.entities.account_name.AccountName
 _Session: TypeAlias = _account.internal.entities.session.Session
-_IsAccountNameTextTaken: TypeAlias = (
-    _is_account_name_text_taken.IsAccountNameTextTaken
-)
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
@@ -57,6 +55,9 @@ async def create_account[AccountsT: Accounts](
     transaction_for: TransactionFactory[AccountsT],
     gateway_to: GatewayFactory[AccountsT],
     logger: Logger,
+    password_hasher: _password_hasher.PasswordHasher,
+    account_name_index: AccountNameIndex,
+    session_cache: SessionCache,
 ) -> AsyncIterator[
     Result[
         Output,
@@ -80,60 +81,58 @@ async def create_account[AccountsT: Accounts](
             yield r
             return
 
-    async with transaction_for(accounts) as transaction:
-        is_account_name_text_taken: _IsAccountNameTextTaken
+    password_hash = await password_hasher.hash_of(password)
 
+    async with transaction_for(accounts) as transaction:
         if session_id is None:
             current_session = None
-            is_account_name_text_taken = IsAccountNameTextTakenInRepo(accounts)
         else:
-            gateway_result = await gateway_to(
-                accounts
-            ).session_with_id_and_contains_account_name_with_text(
-                session_id=session_id,
-                account_name_text=name_text,
-            )
-            current_session = gateway_result.session
-            is_account_name_text_taken = IsAccountNameTextTakenBasedOnCache.of(
-                gateway_result,
-                name_text=name_text,
-                is_account_name_text_taken=IsAccountNameTextTakenInRepo(
-                    accounts
-                ),
+            gateway = gateway_to(accounts)
+            current_session = await gateway.session_with_id(
+                session_id, intent="session"
             )
 
         effect = SearchableEffect()
         result = await _Account.create(
             name_text=name_text,
-            password=password,
+            password_hash=password_hash,
             effect=effect,
             current_time=current_time,
             current_session=current_session,
             is_account_name_taken=_is_account_name_taken.IsAccountNameTaken(
-                is_account_name_text_taken
+                IsAccountNameTextTakenInMapping()
             ),
         )
         await swap(result).map_async(lambda _: transaction.rollback())
 
+        try:
+            await result.map_async(
+                lambda _: map_effect(
+                    effect,
+                    Mappers(
+                        (_Account, account_mapper_in(accounts)),
+                        (_AccountName, account_name_mapper_in(accounts)),
+                        (_Session, session_mapper_in(accounts)),
+                    ),
+                )
+            )
+        except AccountNameMapper.TakenTextError:
+            await transaction.rollback()
+            yield Err("account_name_is_taken")
+            return
+
         await result.map_async(
             lambda output: logger.log_registration(
                 account=output.account, session=output.current_session
             )
         )
         await result.map_async(lambda _: log_effect(effect, logger))
-        await result.map_async(
-            lambda _: map_effect(
-                effect,
-                Mappers(
-                    (_Account, account_mapper_in(accounts)),
-                    (_AccountName, account_name_mapper_in(accounts)),
-                    (_Session, session_mapper_in(accounts)),
-                ),
-            )
-        )
 
         yield result.map(
             lambda output: Output(
                 account=output.account, session=output.current_session
             )
         )
+
+    await result.map_async(lambda _: invalidate_effect(effect, session_cache))
+    await result.map_async(lambda _: index_effect(effect, account_name_index))
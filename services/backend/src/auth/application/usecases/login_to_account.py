@@ -6,15 +6,20 @@ from uuid import UUID
 
 from result import Err, Ok, Result
 
+from auth.application.output.invalidate_effect import invalidate_effect
 from auth.application.output.log_effect import log_effect
 from auth.application.output.map_effect import Mappers, map_effect
 from auth.application.ports.gateway import GatewayFactory
 from auth.application.ports.loggers import Logger
 from auth.application.ports.mappers import MapperFactory
 from auth.application.ports.repos import Accounts
+from auth.application.ports.session_cache import SessionCache
 from auth.application.ports.transactions import TransactionFactory
 from auth.domain.framework.effects.searchable import SearchableEffect
 from auth.domain.models.access.aggregates import account as _account
+from auth.domain.models.access.aggregates.account.ports.hashers import (
+    password_hasher as _password_hasher,
+)
 from auth.domain.models.access.vos.password import Password
 from auth.domain.models.access.vos.time import Time
 
@@ -43,6 +48,8 @@ async def login_to_account[AccountsT: Accounts](
     transaction_for: TransactionFactory[AccountsT],
     gateway_to: GatewayFactory[AccountsT],
     logger: Logger,
+    password_hasher: _password_hasher.PasswordHasher,
+    session_cache: SessionCache,
 ) -> AsyncIterator[Result[Output, Literal["no_account", "incorrect_password"]]]:
     current_time = Time.with_(datetime_=datetime.now(UTC)).unwrap()
 
@@ -53,16 +60,36 @@ async def login_to_account[AccountsT: Accounts](
             yield Err("incorrect_password")
             return
 
+    async with transaction_for(accounts):
+        unlocked_account = await accounts.account_with_name(name_text=name_text)
+
+    if unlocked_account is None:
+        yield Err("no_account")
+        return
+
+    password_check = await _account.root.password_check_of(
+        unlocked_account.password_hash,
+        password=password,
+        password_hasher=password_hasher,
+    )
+
+    if password_check is None:
+        yield Err("incorrect_password")
+        return
+
     async with transaction_for(accounts) as transaction:
         if session_id is None:
             current_session = None
-            account = await accounts.account_with_name(name_text=name_text)
+            account = await accounts.account_with_name(
+                name_text=name_text, intent="account"
+            )
         else:
             gateway = gateway_to(accounts)
             gateway_result = (
                 await gateway.session_with_id_and_account_with_name(
                     session_id=session_id,
                     account_name_text=name_text,
+                    intent="account",
                 )
             )
             current_session = gateway_result.session
@@ -74,12 +101,14 @@ async def login_to_account[AccountsT: Accounts](
             return
 
         effect = SearchableEffect()
-        result = _account.root.login_to(
+        result = await _account.root.login_to(
             account,
             password=password,
+            password_hasher=password_hasher,
             current_time=current_time,
             current_session=current_session,
             effect=effect,
+            password_check=password_check,
         )
         match result:
             case Ok(v):
@@ -101,3 +130,5 @@ async def login_to_account[AccountsT: Accounts](
         )
 
         yield Ok(Output(account=account, session=session))
+
+    await invalidate_effect(effect, session_cache)
@@ -1,3 +1,4 @@
+from auth.application.ports.account_name_index import AccountNameIndex
 from auth.application.ports.repos import Accounts
 
 
@@ -5,5 +6,9 @@ async def view_account_with_name_exists(
     name_text: str,
     *,
     accounts: Accounts,
+    account_name_index: AccountNameIndex,
 ) -> bool:
+    if not account_name_index.may_contain(name_text):
+        return False
+
     return await accounts.contains_account_with_name(name_text=name_text)
@@ -0,0 +1,93 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from auth.domain.framework.ids import time_ordered_uuid_of
+from auth.infrastructure.adapters.repos.db import DBAccounts
+from auth.infrastructure.periphery.sqlalchemy import tables
+from auth.infrastructure.periphery.sqlalchemy.engines import (
+    postgres_engine_with,
+)
+
+
+postgres_engine = postgres_engine_with()
+session_counts = (1, 10, 100, 1000)
+previous_name_count = 10
+load_count = 100
+
+
+async def inserted_account(
+    connection: AsyncConnection, *, session_count: int
+) -> UUID:
+    account_id = uuid4()
+    now = datetime.now(UTC)
+    session_id = time_ordered_uuid_of(now)
+
+    names = [
+        {
+            "id": uuid4(),
+            "account_id": account_id,
+            "text": f"benchmark-{account_id}-{name_number}",
+            "is_current": name_number == 0,
+        }
+        for name_number in range(previous_name_count + 1)
+    ]
+    taking_times = [
+        {"id": uuid4(), "account_name_id": name["id"], "time": now}
+        for name in names
+    ]
+    sessions = [
+        {
+            "id": (
+                session_id if session_number == 0 else time_ordered_uuid_of(now)
+            ),
+            "account_id": account_id,
+            "start_time": now,
+            "end_time": now + timedelta(days=60),
+            "is_cancelled": False,
+            "leader_session_id": None,
+        }
+        for session_number in range(session_count)
+    ]
+
+    await connection.execute(
+        insert(tables.account_table),
+        [{"id": account_id, "password_hash": "benchmark"}],
+    )
+    await connection.execute(insert(tables.account_name_table), names)
+    await connection.execute(
+        insert(tables.account_name_taking_time_table), taking_times
+    )
+    await connection.execute(insert(tables.session_table), sessions)
+
+    return session_id
+
+
+async def main() -> None:
+    for session_count in session_counts:
+        async with postgres_engine.connect() as connection:
+            transaction = await connection.begin()
+            session_id = await inserted_account(
+                connection, session_count=session_count
+            )
+            accounts = DBAccounts(connection)
+
+            start_time = perf_counter()
+
+            for _ in range(load_count):
+                await accounts.account_with_session(session_id=session_id)
+
+            load_time = (perf_counter() - start_time) / load_count
+            await transaction.rollback()
+
+        print(f"sessions: {session_count}, load: {load_time * 1000:.2f} ms")
+
+    await postgres_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,136 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+from typing import get_args
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, insert, select
+
+from auth.application.ports.repos import MutationIntent
+from auth.domain.framework.ids import time_ordered_uuid_of
+from auth.infrastructure.adapters.gateways.db import DBGateway
+from auth.infrastructure.adapters.repos.db import DBAccounts
+from auth.infrastructure.periphery.sqlalchemy import tables
+from auth.infrastructure.periphery.sqlalchemy.engines import (
+    postgres_engine_with,
+)
+
+
+postgres_engine = postgres_engine_with()
+concurrent_request_count = 10
+request_count_per_task = 50
+hold_seconds = 0.002
+
+
+async def inserted_account() -> tuple[UUID, UUID]:
+    account_id = uuid4()
+    name_id = uuid4()
+    now = datetime.now(UTC)
+    session_id = time_ordered_uuid_of(now)
+
+    async with postgres_engine.begin() as connection:
+        await connection.execute(
+            insert(tables.account_table),
+            [{"id": account_id, "password_hash": "benchmark"}],
+        )
+        await connection.execute(
+            insert(tables.account_name_table),
+            [
+                {
+                    "id": name_id,
+                    "account_id": account_id,
+                    "text": f"benchmark-{account_id}",
+                    "is_current": True,
+                }
+            ],
+        )
+        await connection.execute(
+            insert(tables.account_name_taking_time_table),
+            [{"id": uuid4(), "account_name_id": name_id, "time": now}],
+        )
+        await connection.execute(
+            insert(tables.session_table),
+            [
+                {
+                    "id": session_id,
+                    "account_id": account_id,
+                    "start_time": now,
+                    "end_time": now + timedelta(days=60),
+                    "is_cancelled": False,
+                    "leader_session_id": None,
+                }
+            ],
+        )
+
+    return account_id, session_id
+
+
+async def deleted_account(account_id: UUID) -> None:
+    async with postgres_engine.begin() as connection:
+        await connection.execute(
+            delete(tables.session_table).where(
+                tables.session_table.c.account_id == account_id
+            )
+        )
+        await connection.execute(
+            delete(tables.account_name_taking_time_table).where(
+                tables.account_name_taking_time_table.c.account_name_id.in_(
+                    select(tables.account_name_table.c.id).where(
+                        tables.account_name_table.c.account_id == account_id
+                    )
+                )
+            )
+        )
+        await connection.execute(
+            delete(tables.account_name_table).where(
+                tables.account_name_table.c.account_id == account_id
+            )
+        )
+        await connection.execute(
+            delete(tables.account_table).where(
+                tables.account_table.c.id == account_id
+            )
+        )
+
+
+async def perform_requests(*, session_id: UUID, intent: MutationIntent) -> None:
+    for _ in range(request_count_per_task):
+        async with postgres_engine.begin() as connection:
+            accounts = DBAccounts(connection)
+            gateway = DBGateway(accounts)
+
+            await gateway.session_with_id(session_id, intent=intent)
+            await accounts.account_with_session(
+                session_id=session_id, intent=intent
+            )
+            await asyncio.sleep(hold_seconds)
+
+
+async def main() -> None:
+    account_id, session_id = await inserted_account()
+
+    try:
+        for intent in get_args(MutationIntent.__value__):
+            start_time = perf_counter()
+
+            async with asyncio.TaskGroup() as task_group:
+                for _ in range(concurrent_request_count):
+                    task_group.create_task(
+                        perform_requests(session_id=session_id, intent=intent)
+                    )
+
+            total_time = perf_counter() - start_time
+            request_count = concurrent_request_count * request_count_per_task
+
+            print(
+                f"intent: {intent}, "
+                f"throughput: {request_count / total_time:.0f} requests/s, "
+                f"total: {total_time:.2f} s"
+            )
+    finally:
+        await deleted_account(account_id)
+        await postgres_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.sql.expression import Select
+
+from auth.infrastructure.adapters.repos import db as repos
+from auth.infrastructure.periphery.sqlalchemy import tables
+from auth.infrastructure.periphery.sqlalchemy.engines import (
+    postgres_engine_with,
+)
+
+
+postgres_engine = postgres_engine_with()
+request_count = 10_000
+
+
+def built_account_with_name_stmt() -> Select[tuple[Any, ...]]:
+    return (
+        select(tables.account_table)
+        .join(
+            tables.account_name_table,
+            tables.account_table.c.id == tables.account_name_table.c.account_id,
+        )
+        .where(tables.account_name_table.c.text == "benchmark")
+        .order_by(tables.account_name_table.c.is_current.desc())
+        .limit(1)
+    )
+
+
+def built_names_stmt() -> Select[tuple[Any, ...]]:
+    return (
+        select(
+            tables.account_name_table.c.id,
+            tables.account_name_table.c.text,
+            tables.account_name_table.c.is_current,
+            tables.account_name_taking_time_table.c.time.label("taking_time"),
+        )
+        .join_from(
+            tables.account_name_table,
+            tables.account_name_taking_time_table,
+            tables.account_name_table.c.id
+            == tables.account_name_taking_time_table.c.account_name_id,
+        )
+        .where(tables.account_name_table.c.account_id == uuid4())
+    )
+
+
+def built_sessions_stmt() -> Select[tuple[Any, ...]]:
+    return select(tables.session_table).where(
+        tables.session_table.c.account_id == uuid4()
+    )
+
+
+def built_stmts() -> tuple[Select[tuple[Any, ...]], ...]:
+    return (
+        built_account_with_name_stmt(),
+        built_names_stmt(),
+        built_sessions_stmt(),
+    )
+
+
+def prebuilt_stmts() -> tuple[Select[tuple[Any, ...]], ...]:
+    return (
+        repos._account_with_name_select.stmt,  # noqa: SLF001
+        repos._names_stmt,  # noqa: SLF001
+        repos._sessions_select.stmt,  # noqa: SLF001
+    )
+
+
+def microseconds_per_request(
+    stmts_of: Callable[[], tuple[Select[tuple[Any, ...]], ...]],
+    *,
+    compiles: bool,
+) -> float:
+    compiled_cache = dict[Any, Any]()
+    start_time = perf_counter()
+
+    for _ in range(request_count):
+        for stmt in stmts_of():
+            cache_key = stmt._generate_cache_key()  # noqa: SLF001
+
+            if not compiles or cache_key is None:
+                continue
+
+            if cache_key.key not in compiled_cache:
+                compiled_cache[cache_key.key] = stmt.compile(
+                    dialect=postgres_engine.dialect
+                )
+
+    return (perf_counter() - start_time) / request_count * 1_000_000
+
+
+def main() -> None:
+    for name, stmts_of in (
+        ("built per request", built_stmts),
+        ("prebuilt", prebuilt_stmts),
+    ):
+        construction_time = microseconds_per_request(stmts_of, compiles=False)
+        total_time = microseconds_per_request(stmts_of, compiles=True)
+
+        print(
+            f"{name}: construction and cache key {construction_time:.1f} us, "
+            f"with compiled cache {total_time:.1f} us per request"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import secrets
+from datetime import datetime
+from uuid import UUID
+
+
+_timestamp_mask = (1 << 48) - 1
+_version = 0x7
+_variant = 0b10
+_random_a_size = 12
+_random_b_size = 62
+
+
+def time_ordered_uuid_of(time: datetime) -> UUID:
+    random_a = secrets.randbits(_random_a_size)
+    random_b = secrets.randbits(_random_b_size)
+
+    return UUID(
+        int=(
+            first_time_ordered_uuid_of(time).int
+            | _version << 76
+            | random_a << 64
+            | _variant << 62
+            | random_b
+        )
+    )
+
+
+def first_time_ordered_uuid_of(time: datetime) -> UUID:
+    milliseconds = int(time.timestamp() * 1000)
+
+    return UUID(int=(milliseconds & _timestamp_mask) << 80)
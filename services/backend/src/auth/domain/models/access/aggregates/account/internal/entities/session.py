@@ -1,9 +1,12 @@
 from dataclasses import dataclass
 from typing import Literal, TypeAlias
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from result import Err, Ok, Result
 
 from auth.domain.framework import entity as _entity
 from auth.domain.framework.effects.base import Effect
+from auth.domain.framework.ids import time_ordered_uuid_of
 from auth.domain.models.access.vos import (
     session_lifetime as _session_lifetime,
 )
@@ -38,6 +41,12 @@ SessionInactivityReasons: TypeAlias = (
     Literal["replaced"] | Literal["expired"] | Literal["cancelled"]
 )
 
+InactiveSessionForSecondaryAuthentication: TypeAlias = Literal[
+    "expired_session_for_secondary_authentication",
+    "cancelled_session_for_secondary_authentication",
+    "replaced_session_for_secondary_authentication",
+]
+
 
 @dataclass(kw_only=True, eq=False)
 class Session(_entity.Entity[UUID, SessionEvent]):
@@ -93,7 +102,7 @@ def issue_session(
 
     lifetime = _session_lifetime.SessionLifetime.starting_from(current_time)
     current_session = Session(
-        id=uuid4(),
+        id=time_ordered_uuid_of(current_time.datetime_),
         account_id=account_id,
         lifetime=lifetime,
         events=[],
@@ -107,6 +116,32 @@ def issue_session(
     return current_session
 
 
+def secondarily_authenticate(
+    session: Session,
+    *,
+    current_time: _time.Time,
+    extension_threshold: float,
+    effect: Effect,
+) -> Result[Session, InactiveSessionForSecondaryAuthentication]:
+    reasons = session.inactivity_reasons_when(current_time=current_time)
+
+    if "replaced" in reasons:
+        return Err("replaced_session_for_secondary_authentication")
+
+    if "expired" in reasons:
+        return Err("expired_session_for_secondary_authentication")
+
+    if "cancelled" in reasons:
+        return Err("cancelled_session_for_secondary_authentication")
+
+    if session.lifetime.is_due_for_extension_when(
+        current_time=current_time, extension_threshold=extension_threshold
+    ):
+        extend(session, current_time=current_time, effect=effect)
+
+    return Ok(session)
+
+
 def session_id_that_replaced(session: Session) -> UUID | None:
     return session.leader_session_id
 
@@ -125,6 +160,8 @@ def extend(
         current_time=current_time,
     )
 
+    session.lifetime = extended_lifetime
+
     event = Extended(entity=session, new_lifetime=extended_lifetime)
     session.events.append(event)
 
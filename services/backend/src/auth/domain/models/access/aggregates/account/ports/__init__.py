@@ -1 +1,4 @@
+from auth.domain.models.access.aggregates.account.ports import (
+    hashers as hashers,
+)
 from auth.domain.models.access.aggregates.account.ports import specs as specs
@@ -0,0 +1,3 @@
+from auth.domain.models.access.aggregates.account.ports.hashers import (
+    password_hasher as password_hasher,
+)
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from auth.domain.models.access.vos.password import Password, PasswordHash
+
+
+class PasswordHasher(ABC):
+    @abstractmethod
+    async def hash_of(self, password: Password) -> PasswordHash: ...
+
+    @abstractmethod
+    async def is_hash_of(
+        self, password: Password, password_hash: PasswordHash
+    ) -> bool: ...
+
+    @abstractmethod
+    def is_outdated(self, password_hash: PasswordHash) -> bool: ...
@@ -15,6 +15,9 @@ from auth.domain.models.access.aggregates.account.internal.entities import (
 from auth.domain.models.access.aggregates.account.internal.specs import (
     is_account_name_taken as _is_account_name_taken,
 )
+from auth.domain.models.access.aggregates.account.ports.hashers import (
+    password_hasher as _password_hasher,
+)
 from auth.domain.models.access.vos import password as _password
 from auth.domain.models.access.vos import time as _time
 
@@ -24,7 +27,26 @@ class PasswordChange(_entity.Mutated["Account"]):
     new_password_hash: _password.PasswordHash
 
 
-AccountEvent: TypeAlias = _entity.Created["Account"] | PasswordChange
+@dataclass(kw_only=True, frozen=True, slots=True)
+class PasswordRehashing(_entity.Mutated["Account"]):
+    new_password_hash: _password.PasswordHash
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class PasswordCheck:
+    password_hash: _password.PasswordHash
+    new_password_hash: _password.PasswordHash | None
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class PasswordChangeCheck:
+    password_hash: _password.PasswordHash
+    new_password_hash: _password.PasswordHash | None
+
+
+AccountEvent: TypeAlias = (
+    _entity.Created["Account"] | PasswordChange | PasswordRehashing
+)
 
 
 @dataclass(kw_only=True, eq=False)
@@ -38,14 +60,36 @@ class Account(_entity.Entity[UUID, AccountEvent]):
     def names(self) -> frozenset[_account_name.AccountName]:
         return frozenset({self.current_name, *self.previous_names})
 
-    def primary_authenticate(
-        self, *, password: _password.Password
+    async def primary_authenticate(
+        self,
+        *,
+        password: _password.Password,
+        password_hasher: _password_hasher.PasswordHasher,
+        effect: Effect,
+        password_check: PasswordCheck | None = None,
     ) -> Result[None, Literal["invalid_password_for_primary_authentication"]]:
-        password_hash = _password.hash_of(password)
+        if (
+            password_check is None
+            or password_check.password_hash != self.password_hash
+        ):
+            password_check = await password_check_of(
+                self.password_hash,
+                password=password,
+                password_hasher=password_hasher,
+            )
 
-        if self.password_hash != password_hash:
+        if password_check is None:
             return Err("invalid_password_for_primary_authentication")
 
+        if password_check.new_password_hash is not None:
+            self.password_hash = password_check.new_password_hash
+
+            event = PasswordRehashing(
+                entity=self, new_password_hash=self.password_hash
+            )
+            self.events.append(event)
+            effect.consider(self)
+
         return Ok(None)
 
     def secondarily_authenticate(
@@ -53,6 +97,7 @@ class Account(_entity.Entity[UUID, AccountEvent]):
         *,
         session_id: UUID,
         current_time: _time.Time,
+        extension_threshold: float,
         effect: Effect,
     ) -> Result[
         _session.Session,
@@ -68,19 +113,12 @@ class Account(_entity.Entity[UUID, AccountEvent]):
         if not session:
             return Err("no_session_for_secondary_authentication")
 
-        reasons = session.inactivity_reasons_when(current_time=current_time)
-
-        if "replaced" in reasons:
-            return Err("replaced_session_for_secondary_authentication")
-
-        if "expired" in reasons:
-            return Err("expired_session_for_secondary_authentication")
-
-        if "cancelled" in reasons:
-            return Err("cancelled_session_for_secondary_authentication")
-
-        _session.extend(session, current_time=current_time, effect=effect)
-        return Ok(session)
+        return _session.secondarily_authenticate(
+            session,
+            current_time=current_time,
+            extension_threshold=extension_threshold,
+            effect=effect,
+        )
 
     @dataclass(kw_only=True, frozen=True, slots=True)
     class NameChangeOutput:
@@ -126,21 +164,33 @@ class Account(_entity.Entity[UUID, AccountEvent]):
 
         return name_result.and_then(lambda _: output)
 
-    def change_password(
+    async def change_password(
         self,
         *,
         new_password: _password.Password,
         current_session_id: UUID,
+        password_hasher: _password_hasher.PasswordHasher,
         effect: Effect,
+        password_change_check: PasswordChangeCheck | None = None,
     ) -> Result[_session.Session, Literal["no_session_for_password_change"]]:
         current_session = self.__session_with(current_session_id)
 
         if current_session is None:
             return Err("no_session_for_password_change")
 
-        new_password_hash = _password.hash_of(new_password)
+        if (
+            password_change_check is None
+            or password_change_check.password_hash != self.password_hash
+        ):
+            password_change_check = await password_change_check_of(
+                self.password_hash,
+                new_password=new_password,
+                password_hasher=password_hasher,
+            )
+
+        new_password_hash = password_change_check.new_password_hash
 
-        if self.password_hash == new_password_hash:
+        if new_password_hash is None:
             return Ok(current_session)
 
         self.password_hash = new_password_hash
@@ -167,7 +217,7 @@ class Account(_entity.Entity[UUID, AccountEvent]):
         cls,
         *,
         name_text: str,
-        password: _password.Password,
+        password_hash: _password.PasswordHash,
         effect: Effect,
         current_time: _time.Time,
         current_session: _session.Session | None = None,
@@ -184,8 +234,6 @@ class Account(_entity.Entity[UUID, AccountEvent]):
             is_account_name_taken=is_account_name_taken,
             effect=effect,
         )
-        password_hash = _password.hash_of(password)
-
         current_session = _session.issue_session(
             account_id=account_id,
             current_time=current_time,
@@ -261,17 +309,61 @@ class Account(_entity.Entity[UUID, AccountEvent]):
         self.previous_names.remove(self.current_name)
 
 
-def login_to(
+async def password_check_of(
+    password_hash: _password.PasswordHash,
+    *,
+    password: _password.Password,
+    password_hasher: _password_hasher.PasswordHasher,
+) -> PasswordCheck | None:
+    if not await password_hasher.is_hash_of(password, password_hash):
+        return None
+
+    new_password_hash = None
+
+    if password_hasher.is_outdated(password_hash):
+        new_password_hash = await password_hasher.hash_of(password)
+
+    return PasswordCheck(
+        password_hash=password_hash, new_password_hash=new_password_hash
+    )
+
+
+async def password_change_check_of(
+    password_hash: _password.PasswordHash,
+    *,
+    new_password: _password.Password,
+    password_hasher: _password_hasher.PasswordHasher,
+) -> PasswordChangeCheck:
+    if await password_hasher.is_hash_of(new_password, password_hash):
+        return PasswordChangeCheck(
+            password_hash=password_hash, new_password_hash=None
+        )
+
+    new_password_hash = await password_hasher.hash_of(new_password)
+
+    return PasswordChangeCheck(
+        password_hash=password_hash, new_password_hash=new_password_hash
+    )
+
+
+async def login_to(
     account: Account,
     *,
     password: _password.Password,
+    password_hasher: _password_hasher.PasswordHasher,
     current_time: _time.Time,
     current_session: _session.Session | None = None,
     effect: Effect,
+    password_check: PasswordCheck | None = None,
 ) -> Result[
     _session.Session, Literal["invalid_password_for_primary_authentication"]
 ]:
-    result = account.primary_authenticate(password=password)
+    result = await account.primary_authenticate(
+        password=password,
+        password_hasher=password_hasher,
+        effect=effect,
+        password_check=password_check,
+    )
 
     return result.map(
         lambda _: _session.issue_session(
@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from hashlib import sha256
 from string import digits
 from typing import Literal
 
@@ -56,10 +55,3 @@ def _has_only_digits(password: Password) -> bool:
 @dataclass(kw_only=True, frozen=True, slots=True)
 class PasswordHash:
     text: str
-
-
-def hash_of(password: Password) -> PasswordHash:
-    hash_ = sha256()
-    hash_.update(password.text.encode("utf-8"))
-
-    return PasswordHash(text=hash_.hexdigest())
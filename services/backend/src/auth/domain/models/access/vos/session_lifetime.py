@@ -31,6 +31,13 @@ class SessionLifetime:
 
         return not start_datetime <= current_datetime <= end_datetime
 
+    def is_due_for_extension_when(
+        self, *, current_time: _time.Time, extension_threshold: float
+    ) -> bool:
+        remaining_lifetime = self.end_time.datetime_ - current_time.datetime_
+
+        return remaining_lifetime < SessionLifetime.chunk * extension_threshold
+
 
 def extended(
     lifetime: SessionLifetime,
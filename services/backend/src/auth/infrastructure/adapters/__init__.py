@@ -1,5 +1,8 @@
 from auth.infrastructure.adapters import gateways as gateways
+from auth.infrastructure.adapters import hashers as hashers
 from auth.infrastructure.adapters import loggers as loggers
 from auth.infrastructure.adapters import mappers as mappers
+from auth.infrastructure.adapters import name_indexes as name_indexes
 from auth.infrastructure.adapters import repos as repos
+from auth.infrastructure.adapters import session_caches as session_caches
 from auth.infrastructure.adapters import views as views
@@ -1,20 +1,73 @@
+from datetime import UTC, datetime
 from typing import Any, TypeAlias
 from uuid import UUID
 
-from sqlalchemy import Row, exists, select
+from sqlalchemy import Row, bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from auth.application.ports import gateway as _gateway
+from auth.application.ports.repos import MutationIntent
 from auth.domain.models.access.aggregates import account as _account
 from auth.domain.models.access.vos.session_lifetime import SessionLifetime
 from auth.domain.models.access.vos.time import Time
 from auth.infrastructure.adapters.repos.db import DBAccounts
 from auth.infrastructure.periphery.sqlalchemy import tables
+from auth.infrastructure.periphery.sqlalchemy.stmt_builders import (
+    PrebuiltSelect,
+)
+from auth.infrastructure.periphery.sqlalchemy.warm_up import (
+    HotExecution,
+    HotExecutionRegistry,
+)
 
 
 _Session: TypeAlias = _account.internal.entities.session.Session
 
 
+_session_select = PrebuiltSelect(
+    select(
+        tables.session_table.c.account_id,
+        tables.session_table.c.start_time,
+        tables.session_table.c.end_time,
+        tables.session_table.c.is_cancelled,
+        tables.session_table.c.leader_session_id,
+    ).where(tables.session_table.c.id == bindparam("session_id")),
+    locked_table=tables.session_table,
+)
+
+_session_extension_stmt = (
+    update(tables.session_table)
+    .where(
+        (tables.session_table.c.id == bindparam("session_id"))
+        & (tables.session_table.c.end_time == bindparam("previous_end_time"))
+        & tables.session_table.c.is_cancelled.isnot(True)
+        & tables.session_table.c.leader_session_id.is_(None)
+    )
+    .values(end_time=bindparam("new_end_time"))
+    .returning(tables.session_table.c.id)
+)
+
+_missing_id = UUID(int=0)
+_missing_time = datetime(1970, 1, 1, tzinfo=UTC)
+
+hot_executions: HotExecutionRegistry = (
+    HotExecution(
+        stmt=_session_select.stmt, params=dict(session_id=_missing_id)
+    ),
+    HotExecution(
+        stmt=_session_select.locked_stmt, params=dict(session_id=_missing_id)
+    ),
+    HotExecution(
+        stmt=_session_extension_stmt,
+        params=dict(
+            session_id=_missing_id,
+            previous_end_time=_missing_time,
+            new_end_time=_missing_time,
+        ),
+    ),
+)
+
+
 class DBGateway(_gateway.Gateway):
     class Error(Exception): ...
 
@@ -27,88 +80,44 @@ class DBGateway(_gateway.Gateway):
     def __connection(self) -> AsyncConnection:
         return self.__db_accounts.connection
 
-    async def session_with_id_and_contains_account_name_with_text(
+    async def session_with_id_and_account_with_name(
         self,
         *,
         session_id: UUID,
         account_name_text: str,
-    ) -> _gateway.SessionAndPresenceOfAccountNameWithText:
-        presence_stmt = select(
-            exists(
-                select(1)
-                .where(tables.account_name_table.c.text == account_name_text)
-                .with_for_update()
-            )
-        )
-        session_stmt = (
-            select(
-                tables.session_table.c.account_id,
-                tables.session_table.c.start_time,
-                tables.session_table.c.end_time,
-                tables.session_table.c.is_cancelled,
-                tables.session_table.c.leader_session_id,
-            )
-            .where(tables.session_table.c.id == session_id)
-            .with_for_update()
-        )
-
-        presence_result = await self.__connection.execute(presence_stmt)
-        session_result = await self.__connection.execute(session_stmt)
-
-        session_row = session_result.first()
-        presence = bool(presence_result.first())
-
-        return _gateway.SessionAndPresenceOfAccountNameWithText(
-            session=self.__session_from(session_row, session_id=session_id),
-            contains_account_name_with_text=presence,
-        )
-
-    async def session_with_id_and_account_with_name(
-        self, *, session_id: UUID, account_name_text: str
+        intent: MutationIntent = "nothing",
     ) -> _gateway.SessionAndAccount:
         account = await self.__db_accounts.account_with_name(
-            name_text=account_name_text
+            name_text=account_name_text, intent=intent
         )
-        session = await self.session_with_id(session_id)
+        session = await self.session_with_id(session_id, intent=intent)
 
         return _gateway.SessionAndAccount(session=session, account=account)
 
-    async def session_with_id(self, session_id: UUID) -> _Session | None:
-        stmt = (
-            select(
-                tables.session_table.c.account_id,
-                tables.session_table.c.start_time,
-                tables.session_table.c.end_time,
-                tables.session_table.c.is_cancelled,
-                tables.session_table.c.leader_session_id,
-            )
-            .where(
-                tables.session_table.c.id == session_id,
-            )
-            .limit(1)
-            .with_for_update()
+    async def session_with_id(
+        self, session_id: UUID, *, intent: MutationIntent = "nothing"
+    ) -> _Session | None:
+        stmt = _session_select.stmt_when(is_locked=intent != "nothing")
+        result = await self.__connection.execute(
+            stmt, dict(session_id=session_id)
         )
-
-        result = await self.__db_accounts.connection.execute(stmt)
         row = result.first()
 
         return self.__session_from(row, session_id=session_id)
 
-    async def account_with_id_and_contains_account_name_with_text(
-        self,
-        *,
-        account_id: UUID,
-        account_name_text: str,
-    ) -> _gateway.AccountAndPresenceOfAccountNameWithText:
-        account = await self.__db_accounts.account_with_id(account_id)
-        contains_account = await self.__db_accounts.contains_account_with_name(
-            name_text=account_name_text,
+    async def extend_session(
+        self, session: _Session, *, previous_lifetime: SessionLifetime
+    ) -> bool:
+        result = await self.__connection.execute(
+            _session_extension_stmt,
+            dict(
+                session_id=session.id,
+                previous_end_time=previous_lifetime.end_time.datetime_,
+                new_end_time=session.lifetime.end_time.datetime_,
+            ),
         )
 
-        return _gateway.AccountAndPresenceOfAccountNameWithText(
-            account=account,
-            contains_account_name_with_text=contains_account,
-        )
+        return result.first() is not None
 
     def __session_from(
         self, row: Row[Any] | None, *, session_id: UUID
@@ -2,7 +2,9 @@ from typing import TypeAlias
 from uuid import UUID
 
 from auth.application.ports import gateway as _gateway
+from auth.application.ports.repos import MutationIntent
 from auth.domain.models.access.aggregates import account as _account
+from auth.domain.models.access.vos.session_lifetime import SessionLifetime
 from auth.infrastructure.adapters.repos.in_memory import InMemoryAccounts
 
 
@@ -14,23 +16,12 @@ class InMemoryGateway(_gateway.Gateway):
     def __init__(self, in_memory_accounts: InMemoryAccounts) -> None:
         self.__in_memory_accounts = in_memory_accounts
 
-    async def session_with_id_and_contains_account_name_with_text(
+    async def session_with_id_and_account_with_name(
         self,
         *,
         session_id: UUID,
         account_name_text: str,
-    ) -> _gateway.SessionAndPresenceOfAccountNameWithText:
-        presence = await self.__in_memory_accounts.contains_account_with_name(
-            name_text=account_name_text,
-        )
-        session = self.__in_memory_accounts.storage.sessions_with_id(session_id)
-
-        return _gateway.SessionAndPresenceOfAccountNameWithText(
-            session=session, contains_account_name_with_text=presence
-        )
-
-    async def session_with_id_and_account_with_name(
-        self, *, session_id: UUID, account_name_text: str
+        intent: MutationIntent = "nothing",
     ) -> _gateway.SessionAndAccount:
         account = await self.__in_memory_accounts.account_with_name(
             name_text=account_name_text
@@ -39,23 +30,27 @@ class InMemoryGateway(_gateway.Gateway):
 
         return _gateway.SessionAndAccount(session=session, account=account)
 
-    async def session_with_id(self, session_id: UUID) -> _Session | None:
+    async def session_with_id(
+        self, session_id: UUID, *, intent: MutationIntent = "nothing"
+    ) -> _Session | None:
         return self.__in_memory_accounts.storage.sessions_with_id(session_id)
 
-    async def account_with_id_and_contains_account_name_with_text(
-        self,
-        *,
-        account_id: UUID,
-        account_name_text: str,
-    ) -> _gateway.AccountAndPresenceOfAccountNameWithText:
-        account = await self.__in_memory_accounts.account_with_id(account_id)
-        presence = await self.__in_memory_accounts.contains_account_with_name(
-            name_text=account_name_text,
-        )
-
-        return _gateway.AccountAndPresenceOfAccountNameWithText(
-            account=account, contains_account_name_with_text=presence
-        )
+    async def extend_session(
+        self, session: _Session, *, previous_lifetime: SessionLifetime
+    ) -> bool:
+        storage = self.__in_memory_accounts.storage
+        stored_session = storage.sessions_with_id(session.id)
+
+        if (
+            stored_session is None
+            or stored_session.lifetime != previous_lifetime
+            or stored_session.is_cancelled
+            or stored_session.is_replaced
+        ):
+            return False
+
+        self.__in_memory_accounts.update_by_session(session)
+        return True
 
 
 class InMemoryGatewayFactory(_gateway.GatewayFactory[InMemoryAccounts]):
@@ -0,0 +1 @@
+from auth.infrastructure.adapters.hashers import scrypt as scrypt
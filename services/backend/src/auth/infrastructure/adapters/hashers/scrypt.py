@@ -0,0 +1,133 @@
+import hashlib
+import hmac
+import secrets
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+from dataclasses import dataclass
+from functools import partial
+from string import hexdigits
+
+from auth.domain.models.access.aggregates.account.ports.hashers import (
+    password_hasher,
+)
+from auth.domain.models.access.vos.password import Password, PasswordHash
+from auth.infrastructure.periphery.executors import BoundedExecutor
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class ScryptParams:
+    n: int
+    r: int
+    p: int
+    key_size: int
+
+    @property
+    def max_memory(self) -> int:
+        return 2 * 128 * self.n * self.r * self.p
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class _ScryptHash:
+    params: ScryptParams
+    salt: bytes
+    key: bytes
+
+    @property
+    def text(self) -> str:
+        params = f"n={self.params.n},r={self.params.r},p={self.params.p}"
+        salt = b64encode(self.salt).decode()
+        key = b64encode(self.key).decode()
+
+        return f"$scrypt${params}${salt}${key}"
+
+
+class ScryptPasswordHasher(password_hasher.PasswordHasher):
+    def __init__(
+        self,
+        executor: BoundedExecutor,
+        *,
+        params: ScryptParams,
+        salt_size: int = 16,
+    ) -> None:
+        self.__executor = executor
+        self.__params = params
+        self.__salt_size = salt_size
+
+    async def hash_of(self, password: Password) -> PasswordHash:
+        salt = secrets.token_bytes(self.__salt_size)
+        key = await self.__key_of(password, salt=salt, params=self.__params)
+        hash_ = _ScryptHash(params=self.__params, salt=salt, key=key)
+
+        return PasswordHash(text=hash_.text)
+
+    async def is_hash_of(
+        self, password: Password, password_hash: PasswordHash
+    ) -> bool:
+        if _is_sha256_hash(password_hash):
+            sha256_hash = hashlib.sha256(password.text.encode()).hexdigest()
+            return hmac.compare_digest(sha256_hash, password_hash.text)
+
+        hash_ = _scrypt_hash_of(password_hash)
+
+        if hash_ is None:
+            return False
+
+        key = await self.__key_of(
+            password, salt=hash_.salt, params=hash_.params
+        )
+        return hmac.compare_digest(key, hash_.key)
+
+    def is_outdated(self, password_hash: PasswordHash) -> bool:
+        hash_ = _scrypt_hash_of(password_hash)
+
+        return hash_ is None or hash_.params != self.__params
+
+    async def __key_of(
+        self, password: Password, *, salt: bytes, params: ScryptParams
+    ) -> bytes:
+        return await self.__executor.run(
+            partial(
+                hashlib.scrypt,
+                password.text.encode(),
+                salt=salt,
+                n=params.n,
+                r=params.r,
+                p=params.p,
+                maxmem=params.max_memory,
+                dklen=params.key_size,
+            )
+        )
+
+
+def _is_sha256_hash(password_hash: PasswordHash) -> bool:
+    return len(password_hash.text) == 64 and all(  # noqa: PLR2004
+        char in hexdigits for char in password_hash.text
+    )
+
+
+def _scrypt_hash_of(password_hash: PasswordHash) -> _ScryptHash | None:
+    match password_hash.text.split("$"):
+        case ["", "scrypt", raw_params, raw_salt, raw_key]:
+            pass
+        case _:
+            return None
+
+    try:
+        params = dict(
+            raw_param.split("=", 1) for raw_param in raw_params.split(",")
+        )
+        salt = b64decode(raw_salt, validate=True)
+        key = b64decode(raw_key, validate=True)
+
+        return _ScryptHash(
+            params=ScryptParams(
+                n=int(params["n"]),
+                r=int(params["r"]),
+                p=int(params["p"]),
+                key_size=len(key),
+            ),
+            salt=salt,
+            key=key,
+        )
+    except (KeyError, ValueError, BinasciiError):
+        return None
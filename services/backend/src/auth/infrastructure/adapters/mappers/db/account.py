@@ -13,6 +13,15 @@ _Account: TypeAlias = _account.root.Account
 _Values: TypeAlias = list[dict[str, Any]]
 
 
+_insertion_stmt = insert(tables.account_table)
+
+_update_stmt = (
+    update(tables.account_table)
+    .where(tables.account_table.c.id == bindparam("id_"))
+    .values(password_hash=bindparam("password_hash_"))
+)
+
+
 class DBAccountMapper(AccountMapper):
     def __init__(self, connection: AsyncConnection) -> None:
         self.__connection = connection
@@ -21,22 +30,16 @@ class DBAccountMapper(AccountMapper):
         if not accounts:
             return
 
-        stmt = insert(tables.account_table)
-
-        await self.__connection.execute(stmt, self.__values_of(accounts))
+        await self.__connection.execute(
+            _insertion_stmt, self.__values_of(accounts)
+        )
 
     async def update_all(self, accounts: frozenset[_Account]) -> None:
         if not accounts:
             return
 
-        stmt = (
-            update(tables.account_table)
-            .where(tables.account_table.c.id == bindparam("id_"))
-            .values(password_hash=bindparam("password_hash_"))
-        )
-
         values = self.__updating(self.__values_of(accounts))
-        await self.__connection.execute(stmt, values)
+        await self.__connection.execute(_update_stmt, values)
 
     def __values_of(self, accounts: frozenset[_Account]) -> _Values:
         return [
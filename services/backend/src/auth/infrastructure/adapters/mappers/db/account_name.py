@@ -3,6 +3,7 @@ from typing import Any, Iterable, TypeAlias
 from uuid import uuid4
 
 from sqlalchemy import bindparam, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from auth.application.ports.mappers import AccountNameMapper, MapperFactory
@@ -19,6 +20,24 @@ _BecameCurrent: TypeAlias = (
 _Values: TypeAlias = list[dict[str, Any]]
 
 
+_name_insertion_stmt = (
+    pg_insert(tables.account_name_table)
+    .on_conflict_do_nothing(index_elements=[tables.account_name_table.c.text])
+    .returning(tables.account_name_table.c.id)
+)
+
+_taking_time_insertion_stmt = insert(tables.account_name_taking_time_table)
+
+_name_update_stmt = (
+    update(tables.account_name_table)
+    .where(tables.account_name_table.c.id == bindparam("id_"))
+    .values(
+        text=bindparam("text_"),
+        is_current=bindparam("is_current_"),
+    )
+)
+
+
 class DBAccountNameMapper(AccountNameMapper):
     def __init__(self, connection: AsyncConnection) -> None:
         self.__connection = connection
@@ -40,34 +59,23 @@ class DBAccountNameMapper(AccountNameMapper):
     async def __insert_to_account_name_table(
         self, account_names: frozenset[_AccountName]
     ) -> None:
-        stmt = insert(tables.account_name_table)
-
         values = self.__name_values_of(account_names)
-        await self.__connection.execute(stmt, values)
+        result = await self.__connection.execute(_name_insertion_stmt, values)
+
+        if len(result.all()) != len(values):
+            raise AccountNameMapper.TakenTextError
 
     async def __insert_to_account_name_taking_time_table(
         self, account_names: frozenset[_AccountName]
     ) -> None:
-        stmt = insert(tables.account_name_taking_time_table)
-
         values = self.__time_values_of(account_names)
-        await self.__connection.execute(stmt, values)
+        await self.__connection.execute(_taking_time_insertion_stmt, values)
 
     async def __update_account_name_table(
         self, account_names: frozenset[_AccountName]
     ) -> None:
-        stmt = (
-            update(tables.account_name_table)
-            .where(tables.account_name_table.c.id == bindparam("id_"))
-            .values(
-                password_hash=bindparam("password_hash_"),
-                text=bindparam("text_"),
-                is_current=bindparam("is_current_"),
-            )
-        )
-
         values = self.__updating(self.__name_values_of(account_names))
-        await self.__connection.execute(stmt, values)
+        await self.__connection.execute(_name_update_stmt, values)
 
     async def __update_account_name_taking_time_table(
         self, account_names: frozenset[_AccountName]
@@ -81,8 +89,9 @@ class DBAccountNameMapper(AccountNameMapper):
     async def __insert_to_account_name_taking_time_table_by_events(
         self, events: Iterable[_BecameCurrent]
     ) -> None:
-        stmt = insert(tables.account_name_taking_time_table)
-        await self.__connection.execute(stmt, self.__event_values_of(events))
+        await self.__connection.execute(
+            _taking_time_insertion_stmt, self.__event_values_of(events)
+        )
 
     def __name_values_of(
         self, account_names: frozenset[_AccountName]
@@ -15,6 +15,20 @@ _Value: TypeAlias = dict[str, Any]
 _Values: TypeAlias = list[_Value]
 
 
+_insertion_stmt = insert(tables.session_table)
+
+_update_stmt = (
+    update(tables.session_table)
+    .where(tables.session_table.c.id == bindparam("id_"))
+    .values(
+        start_time=bindparam("start_time_"),
+        end_time=bindparam("end_time_"),
+        is_cancelled=bindparam("is_cancelled_"),
+        leader_session_id=bindparam("leader_session_id_"),
+    )
+)
+
+
 class DBSessionMapper(SessionMapper):
     def __init__(self, connection: AsyncConnection) -> None:
         self.__connection = connection
@@ -23,27 +37,16 @@ class DBSessionMapper(SessionMapper):
         if not sessions:
             return
 
-        stmt = insert(tables.session_table)
-
-        await self.__connection.execute(stmt, self.__values_of(sessions))
+        await self.__connection.execute(
+            _insertion_stmt, self.__values_of(sessions)
+        )
 
     async def update_all(self, sessions: frozenset[_Session]) -> None:
         if not sessions:
             return
 
-        stmt = (
-            update(tables.session_table)
-            .where(tables.session_table.c.id == bindparam("id_"))
-            .values(
-                start_time=bindparam("start_time_"),
-                end_time=bindparam("end_time_"),
-                is_cancelled=bindparam("is_cancelled_"),
-                leader_session_id=bindparam("leader_session_id_"),
-            )
-        )
-
         values = self.__updating(self.__values_of(sessions))
-        await self.__connection.execute(stmt, values)
+        await self.__connection.execute(_update_stmt, values)
 
     def __values_of(self, sessions: frozenset[_Session]) -> _Values:
         return list(map(self.__value_of, sessions))
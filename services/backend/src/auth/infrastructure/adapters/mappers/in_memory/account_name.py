@@ -13,6 +13,16 @@ class InMemoryAccountNameMapper(AccountNameMapper):
         self.__in_memory_accounts = in_memory_accounts
 
     async def add_all(self, account_names: frozenset[_AccountName]) -> None:
+        for name in account_names:
+            is_text_taken = (
+                await self.__in_memory_accounts.contains_account_with_name(
+                    name_text=name.text
+                )
+            )
+
+            if is_text_taken:
+                raise AccountNameMapper.TakenTextError
+
         for name in account_names:
             self.__in_memory_accounts.add_account_name(name)
 
@@ -0,0 +1 @@
+from auth.infrastructure.adapters.name_indexes import bloom as bloom
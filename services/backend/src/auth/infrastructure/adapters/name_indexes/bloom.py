@@ -0,0 +1,101 @@
+from asyncio import Lock
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import select
+
+from auth.application.ports.account_name_index import AccountNameIndex
+from auth.infrastructure.adapters.repos.db import DBAccounts
+from auth.infrastructure.periphery.bloom_filter import BloomFilter
+from auth.infrastructure.periphery.sqlalchemy import tables
+
+
+_name_texts_stmt = select(tables.account_name_table.c.text)
+
+
+class BloomAccountNameIndex(AccountNameIndex):
+    def __init__(
+        self,
+        *,
+        capacity: int,
+        false_positive_rate: float,
+        refresh_interval: timedelta,
+    ) -> None:
+        self.__capacity = capacity
+        self.__false_positive_rate = false_positive_rate
+        self.__refresh_interval = refresh_interval
+        self.__bloom_filter = self.__new_bloom_filter()
+        self.__refresh_time: datetime | None = None
+        self.__refresh_lock = Lock()
+        self.__texts_added_during_refresh: list[str] | None = None
+        self.__definite_miss_count = 0
+        self.__possible_hit_count = 0
+
+    @property
+    def is_warm(self) -> bool:
+        return self.__refresh_time is not None
+
+    @property
+    def name_count(self) -> int:
+        return self.__bloom_filter.item_count
+
+    @property
+    def definite_miss_count(self) -> int:
+        return self.__definite_miss_count
+
+    @property
+    def possible_hit_count(self) -> int:
+        return self.__possible_hit_count
+
+    def is_stale(self, *, current_time: datetime | None = None) -> bool:
+        if self.__refresh_time is None:
+            return True
+
+        current_time = current_time or datetime.now(UTC)
+
+        refresh_age = current_time - self.__refresh_time
+
+        return refresh_age >= self.__refresh_interval * 2
+
+    def may_contain(self, name_text: str) -> bool:
+        if self.is_stale() or name_text in self.__bloom_filter:
+            self.__possible_hit_count += 1
+            return True
+
+        self.__definite_miss_count += 1
+        return False
+
+    async def add(self, *name_texts: str) -> None:
+        for name_text in name_texts:
+            self.__bloom_filter.add(name_text)
+
+        if self.__texts_added_during_refresh is not None:
+            self.__texts_added_during_refresh.extend(name_texts)
+
+    async def refresh_from(self, db_accounts: DBAccounts) -> None:
+        if self.__refresh_lock.locked():
+            return
+
+        async with self.__refresh_lock:
+            refresh_time = datetime.now(UTC)
+            bloom_filter = self.__new_bloom_filter()
+            self.__texts_added_during_refresh = list()
+
+            try:
+                result = await db_accounts.connection.stream(_name_texts_stmt)
+
+                async for row in result:
+                    bloom_filter.add(row.text)
+
+                for name_text in self.__texts_added_during_refresh:
+                    bloom_filter.add(name_text)
+            finally:
+                self.__texts_added_during_refresh = None
+
+            self.__bloom_filter = bloom_filter
+            self.__refresh_time = refresh_time
+
+    def __new_bloom_filter(self) -> BloomFilter:
+        return BloomFilter(
+            capacity=self.__capacity,
+            false_positive_rate=self.__false_positive_rate,
+        )
@@ -49,18 +49,31 @@ class InMemoryAccounts(ports.repos.Accounts, TransactionalContainer[Storage]):
         super().__init__()
         self._storage = Storage() if storage is None else deepcopy(storage)
 
-    async def account_with_name(self, *, name_text: str) -> _Account | None:
+    async def account_with_name(
+        self,
+        *,
+        name_text: str,
+        intent: ports.repos.MutationIntent = "nothing",
+    ) -> _Account | None:
         for name in self._storage.account_names:
             if name.text == name_text:
                 return self.__load_account(account_id=name.account_id)
 
         return None
 
-    async def account_with_id(self, account_id: UUID) -> _Account | None:
+    async def account_with_id(
+        self,
+        account_id: UUID,
+        *,
+        intent: ports.repos.MutationIntent = "nothing",
+    ) -> _Account | None:
         return self.__load_account(account_id=account_id)
 
     async def account_with_session(
-        self, *, session_id: UUID
+        self,
+        *,
+        session_id: UUID,
+        intent: ports.repos.MutationIntent = "nothing",
     ) -> _Account | None:
         for session in self._storage.sessions:
             if session.id == session_id:
@@ -0,0 +1 @@
+from auth.infrastructure.adapters.session_caches import in_memory as in_memory
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from auth.application.ports.session_cache import SessionCache
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class CachedSession:
+    account_id: UUID
+    end_time: datetime
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class _Entry:
+    cached_session: CachedSession
+    expiration_time: datetime
+
+
+class InMemorySessionCache(SessionCache):
+    def __init__(self, *, max_size: int, ttl: timedelta) -> None:
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__entries: OrderedDict[UUID, _Entry] = OrderedDict()
+        self.__hit_count = 0
+        self.__miss_count = 0
+
+    @property
+    def hit_count(self) -> int:
+        return self.__hit_count
+
+    @property
+    def miss_count(self) -> int:
+        return self.__miss_count
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def session_with_id(
+        self, session_id: UUID, *, current_time: datetime | None = None
+    ) -> CachedSession | None:
+        current_time = current_time or datetime.now(UTC)
+        entry = self.__entries.get(session_id)
+
+        if entry is None:
+            self.__miss_count += 1
+            return None
+
+        if entry.expiration_time <= current_time:
+            del self.__entries[session_id]
+            self.__miss_count += 1
+            return None
+
+        self.__entries.move_to_end(session_id)
+        self.__hit_count += 1
+        return entry.cached_session
+
+    def put(
+        self,
+        session_id: UUID,
+        cached_session: CachedSession,
+        *,
+        current_time: datetime | None = None,
+    ) -> None:
+        if self.__max_size <= 0:
+            return
+
+        current_time = current_time or datetime.now(UTC)
+        expiration_time = min(
+            current_time + self.__ttl, cached_session.end_time
+        )
+
+        if expiration_time <= current_time:
+            self.__entries.pop(session_id, None)
+            return
+
+        self.__entries[session_id] = _Entry(
+            cached_session=cached_session, expiration_time=expiration_time
+        )
+        self.__entries.move_to_end(session_id)
+
+        while len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+    async def invalidate(self, session_id: UUID) -> None:
+        self.__entries.pop(session_id, None)
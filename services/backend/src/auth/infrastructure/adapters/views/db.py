@@ -2,9 +2,15 @@ from dataclasses import dataclass
 from typing import TypeAlias
 from uuid import UUID
 
+from sqlalchemy import bindparam, select
+
 from auth.application.ports.views import AccountViewFrom
 from auth.infrastructure.adapters.repos.db import DBAccounts
 from auth.infrastructure.periphery.sqlalchemy import tables
+from auth.infrastructure.periphery.sqlalchemy.warm_up import (
+    HotExecution,
+    HotExecutionRegistry,
+)
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
@@ -16,23 +22,29 @@ class DBAccountData:
 DBAccountView: TypeAlias = DBAccountData | None
 
 
+_current_name_text_stmt = (
+    select(tables.account_name_table.c.text.label("current_name_text"))
+    .where(
+        (tables.account_name_table.c.account_id == bindparam("account_id"))
+        & tables.account_name_table.c.is_current
+    )
+    .limit(1)
+)
+
+hot_executions: HotExecutionRegistry = (
+    HotExecution(
+        stmt=_current_name_text_stmt, params=dict(account_id=UUID(int=0))
+    ),
+)
+
+
 class DBAccountViewFrom(AccountViewFrom[DBAccounts, DBAccountView]):
     async def __call__(
         self, db_accounts: DBAccounts, *, account_id: UUID
     ) -> DBAccountView:
-        stmt = (
-            db_accounts.builder.select(
-                tables.account_name_table.c.text.label("current_name_text"),
-            )
-            .build()
-            .where(
-                (tables.account_name_table.c.account_id == account_id)
-                & tables.account_name_table.c.is_current
-            )
-            .limit(1)
+        result = await db_accounts.connection.execute(
+            _current_name_text_stmt, dict(account_id=account_id)
         )
-
-        result = await db_accounts.connection.execute(stmt)
         row = result.first()
 
         if row is None:
@@ -1,3 +1,4 @@
 from auth.infrastructure.periphery import envs as envs
+from auth.infrastructure.periphery import executors as executors
 from auth.infrastructure.periphery import logs as logs
 from auth.infrastructure.periphery import sqlalchemy as sqlalchemy
@@ -0,0 +1,48 @@
+from hashlib import blake2b
+from math import ceil, log
+
+
+class BloomFilter:
+    def __init__(self, *, capacity: int, false_positive_rate: float) -> None:
+        capacity = max(capacity, 1)
+
+        self.__bit_count = max(
+            ceil(-capacity * log(false_positive_rate) / log(2) ** 2), 8
+        )
+        self.__hash_count = max(round(self.__bit_count / capacity * log(2)), 1)
+        self.__bits = bytearray(ceil(self.__bit_count / 8))
+        self.__item_count = 0
+
+    @property
+    def bit_count(self) -> int:
+        return self.__bit_count
+
+    @property
+    def hash_count(self) -> int:
+        return self.__hash_count
+
+    @property
+    def item_count(self) -> int:
+        return self.__item_count
+
+    def add(self, item: str) -> None:
+        for position in self.__positions_of(item):
+            self.__bits[position >> 3] |= 1 << (position & 7)
+
+        self.__item_count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.__bits[position >> 3] & (1 << (position & 7))
+            for position in self.__positions_of(item)
+        )
+
+    def __positions_of(self, item: str) -> list[int]:
+        digest = blake2b(item.encode(), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8])
+        second_hash = int.from_bytes(digest[8:]) | 1
+
+        return [
+            (first_hash + number * second_hash) % self.__bit_count
+            for number in range(self.__hash_count)
+        ]
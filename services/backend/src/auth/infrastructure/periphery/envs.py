@@ -13,3 +13,62 @@ postgres_password = _env.str("AUTH_POSTGRES_PASSWORD")
 postgres_host = _env.str("AUTH_POSTGRES_HOST")
 postgres_port = _env.int("AUTH_POSTGRES_PORT")
 postgres_echo = _env.bool("AUTH_POSTGRES_ECHO")
+postgres_warm_connection_count = _env.int(
+    "AUTH_POSTGRES_WARM_CONNECTION_COUNT", default=2
+)
+
+process_count = _env.int("AUTH_PROCESS_COUNT", default=1)
+is_multiprocess = process_count > 1
+
+multiprocess_session_cache_max_ttl_seconds = 5.0
+
+session_cache_max_size = _env.int(
+    "AUTH_SESSION_CACHE_MAX_SIZE", default=0 if is_multiprocess else 4096
+)
+session_cache_ttl_seconds = _env.float(
+    "AUTH_SESSION_CACHE_TTL_SECONDS", default=30
+)
+
+if is_multiprocess:
+    session_cache_ttl_seconds = min(
+        session_cache_ttl_seconds, multiprocess_session_cache_max_ttl_seconds
+    )
+
+uses_account_name_index = _env.bool(
+    "AUTH_USES_ACCOUNT_NAME_INDEX", default=not is_multiprocess
+)
+
+account_name_index_capacity = _env.int(
+    "AUTH_ACCOUNT_NAME_INDEX_CAPACITY", default=1_000_000
+)
+account_name_index_false_positive_rate = _env.float(
+    "AUTH_ACCOUNT_NAME_INDEX_FALSE_POSITIVE_RATE", default=0.01
+)
+account_name_index_refresh_seconds = _env.float(
+    "AUTH_ACCOUNT_NAME_INDEX_REFRESH_SECONDS", default=60
+)
+
+session_extension_threshold = _env.float(
+    "AUTH_SESSION_EXTENSION_THRESHOLD", default=0.5
+)
+
+session_retention_grace_days = _env.int(
+    "AUTH_SESSION_RETENTION_GRACE_DAYS", default=30
+)
+session_retention_batch_size = _env.int(
+    "AUTH_SESSION_RETENTION_BATCH_SIZE", default=1000
+)
+session_retention_max_batch_count = _env.int(
+    "AUTH_SESSION_RETENTION_MAX_BATCH_COUNT", default=100
+)
+session_partition_month_count = _env.int(
+    "AUTH_SESSION_PARTITION_MONTH_COUNT", default=4
+)
+
+password_hashing_worker_count = _env.int(
+    "AUTH_PASSWORD_HASHING_WORKER_COUNT", default=2
+)
+password_hashing_uses_processes = _env.bool(
+    "AUTH_PASSWORD_HASHING_USES_PROCESSES", default=False
+)
+password_scrypt_n = _env.int("AUTH_PASSWORD_SCRYPT_N", default=2**14)
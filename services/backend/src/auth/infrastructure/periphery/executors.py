@@ -0,0 +1,62 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable
+
+
+class BoundedExecutor:
+    def __init__(self, executor: Executor, *, worker_count: int) -> None:
+        self.__executor = executor
+        self.__free_worker_count = asyncio.Semaphore(worker_count)
+        self.__queue_depth = 0
+        self.__peak_queue_depth = 0
+        self.__running_count = 0
+        self.__completed_count = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self.__queue_depth
+
+    @property
+    def peak_queue_depth(self) -> int:
+        return self.__peak_queue_depth
+
+    @property
+    def running_count(self) -> int:
+        return self.__running_count
+
+    @property
+    def completed_count(self) -> int:
+        return self.__completed_count
+
+    async def run[ResultT](self, func: Callable[[], ResultT]) -> ResultT:
+        self.__queue_depth += 1
+        self.__peak_queue_depth = max(
+            self.__peak_queue_depth, self.__queue_depth
+        )
+
+        try:
+            await self.__free_worker_count.acquire()
+        finally:
+            self.__queue_depth -= 1
+
+        self.__running_count += 1
+        loop = asyncio.get_running_loop()
+
+        try:
+            future = self.__executor.submit(func)
+        except BaseException:
+            self.__complete()
+            raise
+
+        future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(self.__complete)
+        )
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        self.__executor.shutdown(wait=True, cancel_futures=True)
+
+    def __complete(self) -> None:
+        self.__running_count -= 1
+        self.__completed_count += 1
+        self.__free_worker_count.release()
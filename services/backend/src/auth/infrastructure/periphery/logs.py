@@ -5,3 +5,6 @@ renaming_log = "user changed name"
 password_change_log = "user changed password"  # noqa: S105
 replaced_session_log = "session replaced"
 cancelled_session_log = "session cancelled"
+session_reclamation_log = "sessions reclaimed"
+session_cache_report_log = "session cache report"
+password_hashing_report_log = "password hashing report"  # noqa: S105
@@ -1,4 +1,5 @@
 from auth.infrastructure.periphery.sqlalchemy import engines as engines
+from auth.infrastructure.periphery.sqlalchemy import retention as retention
 from auth.infrastructure.periphery.sqlalchemy import (
     stmt_builders as stmt_builders,
 )
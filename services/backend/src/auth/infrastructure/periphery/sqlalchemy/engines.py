@@ -1,5 +1,5 @@
 from sqlalchemy import URL
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import NullPool
 
 from auth.infrastructure.periphery import envs
@@ -14,9 +14,11 @@ db_url = URL.create(
     port=envs.postgres_port,
 )
 
-if envs.is_dev:
-    postgres_engine = create_async_engine(
-        db_url, echo=envs.postgres_echo, poolclass=NullPool
-    )
-else:
-    postgres_engine = create_async_engine(db_url, echo=envs.postgres_echo)
+
+def postgres_engine_with() -> AsyncEngine:
+    if envs.is_dev:
+        return create_async_engine(
+            db_url, echo=envs.postgres_echo, poolclass=NullPool
+        )
+
+    return create_async_engine(db_url, echo=envs.postgres_echo)
@@ -0,0 +1,142 @@
+"""partition `sessions` by time-ordered `id`
+
+Revision ID: 5c2e7d9a1f43
+Revises: ae957e5f10d9
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e7d9a1f43"
+down_revision: Union[str, None] = "ae957e5f10d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE auth.sessions RENAME TO sessions_unpartitioned")
+    op.execute(
+        "ALTER INDEX auth.ix_auth_sessions_account_id "
+        "RENAME TO ix_auth_sessions_unpartitioned_account_id"
+    )
+    op.execute(
+        """
+        CREATE TABLE auth.sessions (
+            id UUID NOT NULL,
+            account_id UUID NOT NULL,
+            start_time TIMESTAMP WITH TIME ZONE,
+            end_time TIMESTAMP WITH TIME ZONE NOT NULL,
+            is_cancelled BOOLEAN,
+            leader_session_id UUID,
+            CONSTRAINT sessions_partitioned_pkey PRIMARY KEY (id)
+        ) PARTITION BY RANGE (id)
+        """
+    )
+    op.execute(
+        "CREATE INDEX ix_auth_sessions_account_id ON auth.sessions (account_id)"
+    )
+    op.execute(
+        "CREATE INDEX ix_auth_sessions_end_time ON auth.sessions (end_time)"
+    )
+    op.execute(
+        "CREATE TABLE auth.sessions_default PARTITION OF auth.sessions DEFAULT"
+    )
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month_start TIMESTAMP WITH TIME ZONE;
+            last_month_start TIMESTAMP WITH TIME ZONE;
+            lower_id UUID;
+            upper_id UUID;
+        BEGIN
+            month_start := date_trunc('month', now(), 'UTC');
+            last_month_start := date_trunc(
+                'month', now() + interval '4 months', 'UTC'
+            );
+
+            WHILE month_start <= last_month_start LOOP
+                lower_id := (
+                    lpad(
+                        to_hex(
+                            floor(extract(epoch FROM month_start) * 1000)
+                            ::BIGINT
+                        ),
+                        12,
+                        '0'
+                    )
+                    || repeat('0', 20)
+                )::UUID;
+                upper_id := (
+                    lpad(
+                        to_hex(
+                            floor(
+                                extract(
+                                    epoch FROM month_start + interval '1 month'
+                                )
+                                * 1000
+                            )::BIGINT
+                        ),
+                        12,
+                        '0'
+                    )
+                    || repeat('0', 20)
+                )::UUID;
+
+                EXECUTE format(
+                    'CREATE TABLE auth.%I PARTITION OF auth.sessions '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    to_char(
+                        month_start AT TIME ZONE 'UTC', '"sessions_y"YYYY"m"MM'
+                    ),
+                    lower_id,
+                    upper_id
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute(
+        "INSERT INTO auth.sessions "
+        "SELECT id, account_id, start_time, end_time, is_cancelled, "
+        "leader_session_id "
+        "FROM auth.sessions_unpartitioned"
+    )
+    op.execute("DROP TABLE auth.sessions_unpartitioned")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE auth.sessions RENAME TO sessions_partitioned")
+    op.execute(
+        "ALTER INDEX auth.ix_auth_sessions_account_id "
+        "RENAME TO ix_auth_sessions_partitioned_account_id"
+    )
+    op.execute(
+        """
+        CREATE TABLE auth.sessions (
+            id UUID NOT NULL,
+            account_id UUID NOT NULL,
+            start_time TIMESTAMP WITH TIME ZONE,
+            end_time TIMESTAMP WITH TIME ZONE NOT NULL,
+            is_cancelled BOOLEAN,
+            leader_session_id UUID,
+            CONSTRAINT sessions_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute(
+        "CREATE INDEX ix_auth_sessions_account_id ON auth.sessions (account_id)"
+    )
+    op.execute(
+        "INSERT INTO auth.sessions "
+        "SELECT id, account_id, start_time, end_time, is_cancelled, "
+        "leader_session_id "
+        "FROM auth.sessions_partitioned"
+    )
+    op.execute("DROP TABLE auth.sessions_partitioned")
@@ -0,0 +1,48 @@
+"""make account name texts unique
+
+Revision ID: 8e41b6c0d2a7
+Revises: 5c2e7d9a1f43
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8e41b6c0d2a7"
+down_revision: Union[str, None] = "5c2e7d9a1f43"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(
+        op.f("ix_auth_account_names_text"),
+        table_name="account_names",
+        schema="auth",
+    )
+    op.create_index(
+        op.f("ix_auth_account_names_text"),
+        "account_names",
+        ["text"],
+        unique=True,
+        schema="auth",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_auth_account_names_text"),
+        table_name="account_names",
+        schema="auth",
+    )
+    op.create_index(
+        op.f("ix_auth_account_names_text"),
+        "account_names",
+        ["text"],
+        unique=False,
+        schema="auth",
+    )
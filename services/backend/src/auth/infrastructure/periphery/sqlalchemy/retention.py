@@ -0,0 +1,259 @@
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import bindparam, delete, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from auth.domain.framework.ids import first_time_ordered_uuid_of
+from auth.infrastructure.periphery.sqlalchemy import tables
+
+
+_partition_name_pattern = re.compile(r"^sessions_y(\d{4})m(\d{2})$")
+
+_expired_sessions = (
+    select(tables.session_table.c.id)
+    .where(tables.session_table.c.end_time < bindparam("cutoff_time"))
+    .limit(bindparam("batch_size"))
+    .with_for_update(skip_locked=True)
+)
+
+_batch_deletion_stmt = delete(tables.session_table).where(
+    tables.session_table.c.id.in_(_expired_sessions)
+)
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class RetentionReport:
+    deleted_session_count: int
+    batch_count: int
+    created_partition_names: tuple[str, ...]
+    moved_session_count: int
+    dropped_partition_names: tuple[str, ...]
+
+
+def partition_name_of(month_start_time: datetime) -> str:
+    return f"sessions_y{month_start_time.year:04}m{month_start_time.month:02}"
+
+
+def month_start_time_of(time: datetime) -> datetime:
+    return datetime(time.year, time.month, 1, tzinfo=UTC)
+
+
+def next_month_start_time_of(time: datetime) -> datetime:
+    if time.month == 12:  # noqa: PLR2004
+        return datetime(time.year + 1, 1, 1, tzinfo=UTC)
+
+    return datetime(time.year, time.month + 1, 1, tzinfo=UTC)
+
+
+def partition_bounds_of(month_start_time: datetime) -> tuple[UUID, UUID]:
+    next_month_start_time = next_month_start_time_of(month_start_time)
+
+    return (
+        first_time_ordered_uuid_of(month_start_time),
+        first_time_ordered_uuid_of(next_month_start_time),
+    )
+
+
+async def delete_expired_sessions(
+    engine: AsyncEngine,
+    *,
+    cutoff_time: datetime,
+    batch_size: int,
+    max_batch_count: int,
+) -> tuple[int, int]:
+    deleted_session_count = 0
+    batch_count = 0
+
+    while batch_count < max_batch_count:
+        async with engine.begin() as connection:
+            result = await connection.execute(
+                _batch_deletion_stmt,
+                dict(cutoff_time=cutoff_time, batch_size=batch_size),
+            )
+
+        batch_count += 1
+        deleted_session_count += result.rowcount
+
+        if result.rowcount < batch_size:
+            break
+
+    return deleted_session_count, batch_count
+
+
+async def create_session_partitions(
+    engine: AsyncEngine, *, current_time: datetime, month_count: int
+) -> tuple[tuple[str, ...], int]:
+    created_partition_names = list()
+    moved_session_count = 0
+
+    async with engine.begin() as connection:
+        partition_names = set(await _session_partition_names(connection))
+        month_start_time = month_start_time_of(current_time)
+
+        for _ in range(month_count):
+            partition_name = partition_name_of(month_start_time)
+
+            if partition_name not in partition_names:
+                moved_session_count += await _create_session_partition(
+                    connection, month_start_time=month_start_time
+                )
+                created_partition_names.append(partition_name)
+
+            month_start_time = next_month_start_time_of(month_start_time)
+
+    return tuple(created_partition_names), moved_session_count
+
+
+async def drop_session_partitions(
+    engine: AsyncEngine, *, cutoff_time: datetime
+) -> tuple[str, ...]:
+    dropped_partition_names = list()
+
+    async with engine.begin() as connection:
+        partition_names = await _session_partition_names(connection)
+
+    for partition_name in sorted(partition_names):
+        match = _partition_name_pattern.match(partition_name)
+
+        if match is None:
+            continue
+
+        year, month = map(int, match.groups())
+        month_start_time = datetime(year, month, 1, tzinfo=UTC)
+
+        if next_month_start_time_of(month_start_time) > cutoff_time:
+            continue
+
+        async with engine.connect() as connection:
+            if await _has_live_sessions(
+                connection, partition_name, cutoff_time=cutoff_time
+            ):
+                continue
+
+        async with engine.begin() as connection:
+            await connection.execute(
+                text(
+                    "ALTER TABLE auth.sessions "
+                    f"DETACH PARTITION auth.{partition_name}"
+                )
+            )
+
+            if await _has_live_sessions(
+                connection, partition_name, cutoff_time=cutoff_time
+            ):
+                await connection.rollback()
+                continue
+
+            await connection.execute(text(f"DROP TABLE auth.{partition_name}"))
+
+        dropped_partition_names.append(partition_name)
+
+    return tuple(dropped_partition_names)
+
+
+async def reclaim_sessions(
+    engine: AsyncEngine,
+    *,
+    cutoff_time: datetime,
+    batch_size: int,
+    max_batch_count: int,
+    partition_month_count: int,
+    current_time: datetime | None = None,
+) -> RetentionReport:
+    current_time = current_time or datetime.now(UTC)
+
+    (
+        created_partition_names,
+        moved_session_count,
+    ) = await create_session_partitions(
+        engine, current_time=current_time, month_count=partition_month_count
+    )
+    dropped_partition_names = await drop_session_partitions(
+        engine, cutoff_time=cutoff_time
+    )
+    deleted_session_count, batch_count = await delete_expired_sessions(
+        engine,
+        cutoff_time=cutoff_time,
+        batch_size=batch_size,
+        max_batch_count=max_batch_count,
+    )
+
+    return RetentionReport(
+        deleted_session_count=deleted_session_count,
+        batch_count=batch_count,
+        created_partition_names=created_partition_names,
+        moved_session_count=moved_session_count,
+        dropped_partition_names=dropped_partition_names,
+    )
+
+
+async def _session_partition_names(
+    connection: AsyncConnection,
+) -> tuple[str, ...]:
+    result = await connection.execute(
+        text(
+            "SELECT child.relname "
+            "FROM pg_inherits "
+            "JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+            "JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_namespace ON pg_namespace.oid = parent.relnamespace "
+            "WHERE pg_namespace.nspname = 'auth' "
+            "AND parent.relname = 'sessions'"
+        )
+    )
+
+    return tuple(result.scalars())
+
+
+async def _create_session_partition(
+    connection: AsyncConnection, *, month_start_time: datetime
+) -> int:
+    partition_name = partition_name_of(month_start_time)
+    lower_id, upper_id = partition_bounds_of(month_start_time)
+
+    await connection.execute(
+        text(
+            f"CREATE TABLE auth.{partition_name} "
+            "(LIKE auth.sessions INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    result = await connection.execute(
+        text(
+            "WITH moved_sessions AS ("  # noqa: S608
+            "DELETE FROM auth.sessions_default "
+            "WHERE id >= :lower_id AND id < :upper_id "
+            "RETURNING *"
+            ") "
+            f"INSERT INTO auth.{partition_name} "
+            "SELECT * FROM moved_sessions"
+        ),
+        dict(lower_id=lower_id, upper_id=upper_id),
+    )
+    await connection.execute(
+        text(
+            "ALTER TABLE auth.sessions "
+            f"ATTACH PARTITION auth.{partition_name} "
+            f"FOR VALUES FROM ('{lower_id}') TO ('{upper_id}')"
+        )
+    )
+
+    return result.rowcount
+
+
+async def _has_live_sessions(
+    connection: AsyncConnection, partition_name: str, *, cutoff_time: datetime
+) -> bool:
+    result = await connection.execute(
+        text(
+            "SELECT EXISTS ("  # noqa: S608
+            f"SELECT 1 FROM auth.{partition_name} "
+            "WHERE end_time >= :cutoff_time"
+            ")"
+        ),
+        dict(cutoff_time=cutoff_time),
+    )
+
+    return bool(result.scalar())
@@ -25,7 +25,7 @@ account_name_table = Table(
     metadata,
     Column("id", Uuid, primary_key=True, nullable=False),
     Column("account_id", Uuid, nullable=False, index=True),
-    Column("text", String, nullable=False, index=True),
+    Column("text", String, nullable=False, index=True, unique=True),
     Column("is_current", Boolean, nullable=False),
     schema="auth",
 )
@@ -45,8 +45,9 @@ session_table = Table(
     Column("id", Uuid, primary_key=True, nullable=False),
     Column("account_id", Uuid, nullable=False, index=True),
     Column("start_time", DateTime(timezone=True), nullable=True),
-    Column("end_time", DateTime(timezone=True), nullable=False),
+    Column("end_time", DateTime(timezone=True), nullable=False, index=True),
     Column("is_cancelled", Boolean, nullable=True),
     Column("leader_session_id", Uuid, nullable=True),
     schema="auth",
+    postgresql_partition_by="RANGE (id)",
 )
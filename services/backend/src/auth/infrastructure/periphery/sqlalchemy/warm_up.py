@@ -0,0 +1,37 @@
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from sqlalchemy import Executable
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class HotExecution:
+    stmt: Executable
+    params: Mapping[str, Any]
+
+
+type HotExecutionRegistry = tuple[HotExecution, ...]
+
+
+async def open_connections(engine: AsyncEngine, *, count: int) -> None:
+    async with AsyncExitStack() as stack:
+        for _ in range(count):
+            await stack.enter_async_context(engine.connect())
+
+
+async def execute_hot_executions(
+    connection: AsyncConnection, *registries: HotExecutionRegistry
+) -> int:
+    execution_count = 0
+
+    async with connection.begin() as transaction:
+        for registry in registries:
+            for execution in registry:
+                await connection.execute(execution.stmt, dict(execution.params))
+                execution_count += 1
+
+        await transaction.rollback()
+
+    return execution_count
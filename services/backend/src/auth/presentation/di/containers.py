@@ -2,9 +2,12 @@ from dishka import make_async_container
 
 from auth.presentation.di.providers import (
     GatewayProvider,
+    HasherProvider,
     LoggerProvider,
     MepperProvider,
+    NameIndexProvider,
     RepoProvider,
+    SessionCacheProvider,
     SqlalchemyProvider,
     TransactionProvider,
     ViewProvider,
@@ -18,5 +21,8 @@ async_container = make_async_container(
     LoggerProvider(),
     ViewProvider(),
     GatewayProvider(),
+    HasherProvider(),
+    SessionCacheProvider(),
+    NameIndexProvider(),
     TransactionProvider(),
 )
@@ -1,19 +1,36 @@
-from typing import Annotated, AsyncIterable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from datetime import timedelta
+from typing import Annotated, AsyncIterable, Iterable
 
 from dishka import FromComponent, Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncConnection as SAConnection
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from auth.application import ports
+from auth.domain.models.access.aggregates.account.ports.hashers import (
+    password_hasher,
+)
 from auth.infrastructure.adapters import (
     gateways,
+    hashers,
     loggers,
     mappers,
+    name_indexes,
     repos,
+    session_caches,
     transactions,
     views,
 )
-from auth.infrastructure.periphery import envs
-from auth.infrastructure.periphery.sqlalchemy.engines import postgres_engine
+from auth.infrastructure.periphery import envs, logs
+from auth.infrastructure.periphery.executors import BoundedExecutor
+from auth.infrastructure.periphery.sqlalchemy.engines import (
+    postgres_engine_with,
+)
+from auth.infrastructure.periphery.structlog import dev_logger, prod_logger
 
 
 class SqlalchemyProvider(Provider):
@@ -27,9 +44,18 @@ class SqlalchemyProvider(Provider):
 
     component = "sqlalchemy"
 
+    @provide(scope=Scope.APP)
+    async def get_engine(self) -> AsyncIterable[AsyncEngine]:
+        engine = postgres_engine_with()
+
+        yield engine
+        await engine.dispose()
+
     @provide(scope=Scope.REQUEST)
-    async def get_connection(self) -> AsyncIterable[SAConnection]:
-        async with postgres_engine.connect() as connection:
+    async def get_connection(
+        self, engine: AsyncEngine
+    ) -> AsyncIterable[SAConnection]:
+        async with engine.connect() as connection:
             yield connection
 
 
@@ -86,6 +112,80 @@ class GatewayProvider(Provider):
         return gateways.db.DBGatewayFactory()
 
 
+class HasherProvider(Provider):
+    component = "hashers"
+
+    @provide(scope=Scope.APP)
+    def get_executor(self) -> Iterable[BoundedExecutor]:
+        worker_count = envs.password_hashing_worker_count
+        executor: Executor
+
+        if envs.password_hashing_uses_processes:
+            executor = ProcessPoolExecutor(worker_count)
+        else:
+            executor = ThreadPoolExecutor(worker_count)
+
+        bounded_executor = BoundedExecutor(executor, worker_count=worker_count)
+        yield bounded_executor
+
+        logger = dev_logger if envs.is_dev else prod_logger
+        logger.info(
+            logs.password_hashing_report_log,
+            queue_depth=bounded_executor.queue_depth,
+            peak_queue_depth=bounded_executor.peak_queue_depth,
+            running_count=bounded_executor.running_count,
+            completed_count=bounded_executor.completed_count,
+        )
+        bounded_executor.shutdown()
+
+    @provide(scope=Scope.APP)
+    def get_a(
+        self, executor: BoundedExecutor
+    ) -> password_hasher.PasswordHasher:
+        return hashers.scrypt.ScryptPasswordHasher(
+            executor,
+            params=hashers.scrypt.ScryptParams(
+                n=envs.password_scrypt_n, r=8, p=1, key_size=32
+            ),
+        )
+
+
+class SessionCacheProvider(Provider):
+    component = "session_caches"
+
+    @provide(scope=Scope.APP)
+    def get_a(
+        self,
+    ) -> Iterable[session_caches.in_memory.InMemorySessionCache]:
+        session_cache = session_caches.in_memory.InMemorySessionCache(
+            max_size=envs.session_cache_max_size,
+            ttl=timedelta(seconds=envs.session_cache_ttl_seconds),
+        )
+        yield session_cache
+
+        logger = dev_logger if envs.is_dev else prod_logger
+        logger.info(
+            logs.session_cache_report_log,
+            hit_count=session_cache.hit_count,
+            miss_count=session_cache.miss_count,
+            size=len(session_cache),
+        )
+
+
+class NameIndexProvider(Provider):
+    component = "name_indexes"
+
+    @provide(scope=Scope.APP)
+    def get_a(self) -> name_indexes.bloom.BloomAccountNameIndex:
+        return name_indexes.bloom.BloomAccountNameIndex(
+            capacity=envs.account_name_index_capacity,
+            false_positive_rate=envs.account_name_index_false_positive_rate,
+            refresh_interval=timedelta(
+                seconds=envs.account_name_index_refresh_seconds
+            ),
+        )
+
+
 class TransactionProvider(Provider):
     component = "transactions"
 
@@ -1 +1,2 @@
 from auth.presentation.periphery import facade as facade
+from auth.presentation.periphery import jobs as jobs
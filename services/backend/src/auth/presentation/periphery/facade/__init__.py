@@ -7,6 +7,10 @@ from auth.presentation.periphery.facade import (
 )
 from auth.presentation.periphery.facade import close as close
 from auth.presentation.periphery.facade import read_user as read_user
+from auth.presentation.periphery.facade import (
+    refresh_account_name_index as refresh_account_name_index,
+)
 from auth.presentation.periphery.facade import register_user as register_user
 from auth.presentation.periphery.facade import rename_user as rename_user
 from auth.presentation.periphery.facade import user_exists as user_exists
+from auth.presentation.periphery.facade import warm_up as warm_up
@@ -8,12 +8,17 @@ from result import is_ok
 from auth.application import ports
 from auth.application.usecases.authenticate import authenticate as _authenticate
 from auth.infrastructure.adapters import (
-    mappers,
+    gateways,
     repos,
+    session_caches,
+)
+from auth.infrastructure.adapters.session_caches.in_memory import (
+    CachedSession,
 )
 from auth.infrastructure.adapters.transactions import (
     DBConnectionTransactionFactory,
 )
+from auth.infrastructure.periphery import envs
 from auth.presentation.di.containers import async_container
 
 
@@ -40,40 +45,56 @@ class ReplacedSessionError(Error): ...
 
 @asynccontextmanager
 async def perform(session_id: UUID) -> AsyncIterator[Output]:
-    async with async_container() as container, _authenticate(
-        session_id,
-        accounts=await container.get(repos.db.DBAccounts, "repos"),
-        account_mapper_in=await container.get(
-            mappers.db.account.DBAccountMapperFactory, "mappers"
-        ),
-        account_name_mapper_in=await container.get(
-            mappers.db.account_name.DBAccountNameMapperFactory, "mappers"
-        ),
-        session_mapper_in=await container.get(
-            mappers.db.session.DBSessionMapperFactory, "mappers"
-        ),
-        transaction_for=await container.get(
-            DBConnectionTransactionFactory, "transactions"
-        ),
-        logger=await container.get(ports.loggers.Logger, "loggers"),
-    ) as result:
-        if is_ok(result):
-            value = result.ok()
-            yield Output(user_id=value.account_id, session_id=value.session_id)
+    async with async_container() as container:
+        session_cache = await container.get(
+            session_caches.in_memory.InMemorySessionCache, "session_caches"
+        )
+        cached_session = session_cache.session_with_id(session_id)
+
+        if cached_session is not None:
+            yield Output(
+                user_id=cached_session.account_id, session_id=session_id
+            )
             return
 
-        error = result.err()
-
-        if error in {"no_account", "no_session_for_secondary_authentication"}:
-            raise NoSessionError
-
-        if error == "expired_session_for_secondary_authentication":
-            raise ExpiredSessionError
-
-        if error == "cancelled_session_for_secondary_authentication":
-            raise CancelledSessionError
-
-        if error == "replaced_session_for_secondary_authentication":
-            raise ReplacedSessionError
-
-        raise Error
+        async with _authenticate(
+            session_id,
+            accounts=await container.get(repos.db.DBAccounts, "repos"),
+            gateway_to=await container.get(
+                gateways.db.DBGatewayFactory, "gateways"
+            ),
+            transaction_for=await container.get(
+                DBConnectionTransactionFactory, "transactions"
+            ),
+            logger=await container.get(ports.loggers.Logger, "loggers"),
+            session_extension_threshold=envs.session_extension_threshold,
+        ) as result:
+            if is_ok(result):
+                value = result.ok()
+                yield Output(
+                    user_id=value.account_id, session_id=value.session_id
+                )
+            else:
+                error = result.err()
+
+                if error == "no_session_for_secondary_authentication":
+                    raise NoSessionError
+
+                if error == "expired_session_for_secondary_authentication":
+                    raise ExpiredSessionError
+
+                if error == "cancelled_session_for_secondary_authentication":
+                    raise CancelledSessionError
+
+                if error == "replaced_session_for_secondary_authentication":
+                    raise ReplacedSessionError
+
+                raise Error
+
+        session_cache.put(
+            session_id,
+            CachedSession(
+                account_id=value.account_id,
+                end_time=value.session_end_time,
+            ),
+        )
@@ -7,10 +7,14 @@ from result import Err, Ok
 
 from auth.application import ports
 from auth.application.usecases import login_to_account as _login
+from auth.domain.models.access.aggregates.account.ports.hashers import (
+    password_hasher,
+)
 from auth.infrastructure.adapters import (
     gateways,
     mappers,
     repos,
+    session_caches,
 )
 from auth.infrastructure.adapters.transactions import (
     DBConnectionTransactionFactory,
@@ -61,6 +65,12 @@ async def perform(
             gateways.db.DBGatewayFactory, "gateways"
         ),
         logger=await container.get(ports.loggers.Logger, "loggers"),
+        password_hasher=await container.get(
+            password_hasher.PasswordHasher, "hashers"
+        ),
+        session_cache=await container.get(
+            session_caches.in_memory.InMemorySessionCache, "session_caches"
+        ),
     ) as result:
         match result:
             case Ok(output):
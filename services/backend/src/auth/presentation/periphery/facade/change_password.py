@@ -9,9 +9,13 @@ from auth.application import ports
 from auth.application.usecases.change_account_password import (
     change_account_password as _change_account_password,
 )
+from auth.domain.models.access.aggregates.account.ports.hashers import (
+    password_hasher,
+)
 from auth.infrastructure.adapters import (
     mappers,
     repos,
+    session_caches,
 )
 from auth.infrastructure.adapters.transactions import (
     DBConnectionTransactionFactory,
@@ -62,6 +66,12 @@ async def perform(
             DBConnectionTransactionFactory, "transactions"
         ),
         logger=await container.get(ports.loggers.Logger, "loggers"),
+        password_hasher=await container.get(
+            password_hasher.PasswordHasher, "hashers"
+        ),
+        session_cache=await container.get(
+            session_caches.in_memory.InMemorySessionCache, "session_caches"
+        ),
     ) as result:
         match result:
             case Ok(output):
@@ -0,0 +1,20 @@
+import asyncio
+
+from auth.infrastructure.adapters import name_indexes, repos
+from auth.infrastructure.periphery import envs
+from auth.presentation.di.containers import async_container
+
+
+async def perform() -> None:
+    await asyncio.sleep(envs.account_name_index_refresh_seconds)
+
+    if not envs.uses_account_name_index:
+        return
+
+    async with async_container() as container:
+        accounts = await container.get(repos.db.DBAccounts, "repos")
+        account_name_index = await container.get(
+            name_indexes.bloom.BloomAccountNameIndex, "name_indexes"
+        )
+
+        await account_name_index.refresh_from(accounts)
@@ -10,10 +10,15 @@ from auth.application.usecases.create_account import (
     create_account as _create_account,
 )
 from auth.domain.models.access.aggregates import account as _account
+from auth.domain.models.access.aggregates.account.ports.hashers import (
+    password_hasher,
+)
 from auth.infrastructure.adapters import (
     gateways,
     mappers,
+    name_indexes,
     repos,
+    session_caches,
 )
 from auth.infrastructure.adapters.transactions import (
     DBConnectionTransactionFactory,
@@ -71,6 +76,15 @@ async def perform(
             gateways.db.DBGatewayFactory, "gateways"
         ),
         logger=await container.get(ports.loggers.Logger, "loggers"),
+        password_hasher=await container.get(
+            password_hasher.PasswordHasher, "hashers"
+        ),
+        account_name_index=await container.get(
+            name_indexes.bloom.BloomAccountNameIndex, "name_indexes"
+        ),
+        session_cache=await container.get(
+            session_caches.in_memory.InMemorySessionCache, "session_caches"
+        ),
     ) as result:
         match result:
             case Ok(output):
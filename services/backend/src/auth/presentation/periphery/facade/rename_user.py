@@ -11,8 +11,8 @@ from auth.application.usecases.change_account_name import (
 )
 from auth.domain.models.access.aggregates import account as _account
 from auth.infrastructure.adapters import (
-    gateways,
     mappers,
+    name_indexes,
     repos,
 )
 from auth.infrastructure.adapters.transactions import (
@@ -62,10 +62,10 @@ async def perform(user_id: UUID, new_username: str) -> AsyncIterator[Output]:
         transaction_for=await container.get(
             DBConnectionTransactionFactory, "transactions"
         ),
-        gateway_to=await container.get(
-            gateways.db.DBGatewayFactory, "gateways"
-        ),
         logger=await container.get(ports.loggers.Logger, "loggers"),
+        account_name_index=await container.get(
+            name_indexes.bloom.BloomAccountNameIndex, "name_indexes"
+        ),
     ) as result:
         match result:
             case Ok(output):
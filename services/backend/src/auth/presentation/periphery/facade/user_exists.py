@@ -1,7 +1,7 @@
 from auth.application.usecases import (
     view_account_with_name_exists as _view_account,
 )
-from auth.infrastructure.adapters import repos
+from auth.infrastructure.adapters import name_indexes, repos
 from auth.presentation.di.containers import async_container
 
 
@@ -10,4 +10,7 @@ async def perform(username: str) -> bool:
         return await _view_account.view_account_with_name_exists(
             username,
             accounts=await container.get(repos.db.DBAccounts, "repos"),
+            account_name_index=await container.get(
+                name_indexes.bloom.BloomAccountNameIndex, "name_indexes"
+            ),
         )
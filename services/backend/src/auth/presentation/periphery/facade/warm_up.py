@@ -0,0 +1,64 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from auth.application import ports
+from auth.domain.models.access.aggregates.account.ports.hashers import (
+    password_hasher,
+)
+from auth.infrastructure.adapters import (
+    gateways,
+    mappers,
+    name_indexes,
+    repos,
+    session_caches,
+    views,
+)
+from auth.infrastructure.adapters.transactions import (
+    DBConnectionTransactionFactory,
+)
+from auth.infrastructure.periphery import envs
+from auth.infrastructure.periphery.sqlalchemy.warm_up import (
+    execute_hot_executions,
+    open_connections,
+)
+from auth.presentation.di.containers import async_container
+
+
+async def perform() -> None:
+    async with async_container() as container:
+        await container.get(
+            mappers.db.account.DBAccountMapperFactory, "mappers"
+        )
+        await container.get(
+            mappers.db.account_name.DBAccountNameMapperFactory, "mappers"
+        )
+        await container.get(
+            mappers.db.session.DBSessionMapperFactory, "mappers"
+        )
+        await container.get(DBConnectionTransactionFactory, "transactions")
+        await container.get(gateways.db.DBGatewayFactory, "gateways")
+        await container.get(ports.loggers.Logger, "loggers")
+        await container.get(password_hasher.PasswordHasher, "hashers")
+        await container.get(
+            session_caches.in_memory.InMemorySessionCache, "session_caches"
+        )
+        await container.get(views.db.DBAccountViewFrom, "views")
+
+        engine = await container.get(AsyncEngine, "sqlalchemy")
+        await open_connections(
+            engine, count=envs.postgres_warm_connection_count
+        )
+
+        accounts = await container.get(repos.db.DBAccounts, "repos")
+        await execute_hot_executions(
+            accounts.connection,
+            repos.db.hot_executions,
+            gateways.db.hot_executions,
+            views.db.hot_executions,
+        )
+
+        account_name_index = await container.get(
+            name_indexes.bloom.BloomAccountNameIndex, "name_indexes"
+        )
+
+        if envs.uses_account_name_index:
+            await account_name_index.refresh_from(accounts)
@@ -0,0 +1,3 @@
+from auth.presentation.periphery.jobs import (
+    reclaim_sessions as reclaim_sessions,
+)
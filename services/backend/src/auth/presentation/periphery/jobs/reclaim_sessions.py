@@ -0,0 +1,57 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from auth.infrastructure.periphery import envs, logs
+from auth.infrastructure.periphery.sqlalchemy.engines import (
+    postgres_engine_with,
+)
+from auth.infrastructure.periphery.sqlalchemy.retention import (
+    RetentionReport,
+    reclaim_sessions,
+)
+from auth.infrastructure.periphery.structlog import dev_logger, prod_logger
+
+
+async def perform(engine: AsyncEngine) -> RetentionReport:
+    current_time = datetime.now(UTC)
+    cutoff_time = current_time - timedelta(
+        days=envs.session_retention_grace_days
+    )
+    start_time = perf_counter()
+
+    report = await reclaim_sessions(
+        engine,
+        cutoff_time=cutoff_time,
+        batch_size=envs.session_retention_batch_size,
+        max_batch_count=envs.session_retention_max_batch_count,
+        partition_month_count=envs.session_partition_month_count,
+        current_time=current_time,
+    )
+
+    logger = dev_logger if envs.is_dev else prod_logger
+    await logger.ainfo(
+        logs.session_reclamation_log,
+        cutoff_time=cutoff_time,
+        deleted_session_count=report.deleted_session_count,
+        batch_count=report.batch_count,
+        created_partitions=report.created_partition_names,
+        moved_session_count=report.moved_session_count,
+        dropped_partitions=report.dropped_partition_names,
+        duration_seconds=perf_counter() - start_time,
+    )
+
+    return report
+
+
+async def main() -> None:
+    engine = postgres_engine_with()
+
+    await perform(engine)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
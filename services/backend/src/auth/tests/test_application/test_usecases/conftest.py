@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Iterator, Self, Type
+
+from pytest import fixture
+
+from auth.application.ports.transactions import (
+    Transaction,
+    TransactionFactory,
+)
+from auth.domain.models.access.vos.password import Password, PasswordHash
+from auth.infrastructure.adapters.hashers.scrypt import (
+    ScryptParams,
+    ScryptPasswordHasher,
+)
+from auth.infrastructure.adapters.repos.in_memory import InMemoryAccounts
+from auth.infrastructure.adapters.transactions import (
+    TransactionalContainerTransactionFactory,
+)
+from auth.infrastructure.periphery.executors import BoundedExecutor
+
+
+@dataclass(kw_only=True)
+class TransactionTracker:
+    open_transaction_count: int = 0
+    open_transaction_counts_when_hashing: list[int] = field(
+        default_factory=list
+    )
+
+
+class TrackedTransaction(Transaction):
+    def __init__(
+        self, transaction: Transaction, *, tracker: TransactionTracker
+    ) -> None:
+        self.__transaction = transaction
+        self.__tracker = tracker
+
+    async def rollback(self) -> None:
+        await self.__transaction.rollback()
+
+    async def __aenter__(self) -> Self:
+        await self.__transaction.__aenter__()
+        self.__tracker.open_transaction_count += 1
+        return self
+
+    async def __aexit__(
+        self,
+        error_type: Type[BaseException] | None,
+        error: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool | None:
+        self.__tracker.open_transaction_count -= 1
+        return await self.__transaction.__aexit__(error_type, error, traceback)
+
+
+class TrackedTransactionFactory(TransactionFactory[InMemoryAccounts]):
+    def __init__(self, *, tracker: TransactionTracker) -> None:
+        self.__tracker = tracker
+        self.__factory = TransactionalContainerTransactionFactory()
+
+    def __call__(self, accounts: InMemoryAccounts) -> TrackedTransaction:
+        return TrackedTransaction(
+            self.__factory(accounts), tracker=self.__tracker
+        )
+
+
+class TrackedPasswordHasher(ScryptPasswordHasher):
+    def __init__(
+        self,
+        executor: BoundedExecutor,
+        *,
+        params: ScryptParams,
+        tracker: TransactionTracker,
+    ) -> None:
+        super().__init__(executor, params=params)
+        self.__tracker = tracker
+
+    async def hash_of(self, password: Password) -> PasswordHash:
+        self.__track()
+        return await super().hash_of(password)
+
+    async def is_hash_of(
+        self, password: Password, password_hash: PasswordHash
+    ) -> bool:
+        self.__track()
+        return await super().is_hash_of(password, password_hash)
+
+    def __track(self) -> None:
+        counts = self.__tracker.open_transaction_counts_when_hashing
+        counts.append(self.__tracker.open_transaction_count)
+
+
+@fixture
+def tracker() -> TransactionTracker:
+    return TransactionTracker()
+
+
+@fixture
+def password_hasher(
+    tracker: TransactionTracker,
+) -> Iterator[TrackedPasswordHasher]:
+    with ThreadPoolExecutor(1) as executor:
+        yield TrackedPasswordHasher(
+            BoundedExecutor(executor, worker_count=1),
+            params=ScryptParams(n=2**4, r=8, p=1, key_size=16),
+            tracker=tracker,
+        )
@@ -0,0 +1,130 @@
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from uuid import UUID
+
+from pytest import fixture, mark
+
+from auth.application.ports.transactions import TransactionFactory
+from auth.application.usecases.authenticate import authenticate as usecase
+from auth.domain.models.access.aggregates import account as _account
+from auth.domain.models.access.vos.session_lifetime import SessionLifetime
+from auth.domain.models.access.vos.time import Time
+from auth.infrastructure.adapters.gateways.in_memory import (
+    InMemoryGateway,
+    InMemoryGatewayFactory,
+)
+from auth.infrastructure.adapters.loggers.in_memory import InMemoryLogger
+from auth.infrastructure.adapters.repos.in_memory import InMemoryAccounts
+from auth.infrastructure.adapters.transactions import (
+    TransactionalContainerTransactionFactory,
+)
+
+
+_Session = _account.internal.entities.session.Session
+
+
+start_time = Time.with_(
+    datetime_=datetime.now(UTC) - timedelta(days=50)
+).unwrap()
+concurrent_end_time = Time.with_(
+    datetime_=datetime.now(UTC) + timedelta(days=60)
+).unwrap()
+
+
+class RacingGateway(InMemoryGateway):
+    def __init__(
+        self, accounts: InMemoryAccounts, *, concurrent_session: _Session
+    ) -> None:
+        super().__init__(accounts)
+        self.__accounts = accounts
+        self.__concurrent_session = concurrent_session
+
+    async def extend_session(
+        self, session: _Session, *, previous_lifetime: SessionLifetime
+    ) -> bool:
+        self.__accounts.update_by_session(self.__concurrent_session)
+        return await super().extend_session(
+            session, previous_lifetime=previous_lifetime
+        )
+
+
+class RacingGatewayFactory(InMemoryGatewayFactory):
+    def __init__(self, *, concurrent_session: _Session) -> None:
+        self.__concurrent_session = concurrent_session
+
+    def __call__(self, in_memory_accounts: InMemoryAccounts) -> RacingGateway:
+        return RacingGateway(
+            in_memory_accounts, concurrent_session=self.__concurrent_session
+        )
+
+
+@fixture
+def session() -> _Session:
+    return _Session(
+        id=UUID(int=3),
+        account_id=UUID(int=1),
+        lifetime=SessionLifetime.starting_from(start_time),
+        events=list(),
+    )
+
+
+@fixture
+def accounts(session: _Session) -> InMemoryAccounts:
+    accounts = InMemoryAccounts()
+    accounts.add_session(session)
+
+    return accounts
+
+
+@mark.asyncio
+async def test_with_concurrent_extension(
+    accounts: InMemoryAccounts, session: _Session
+) -> None:
+    concurrent_lifetime = replace(
+        session.lifetime, end_time=concurrent_end_time
+    )
+    concurrent_session = replace(session, lifetime=concurrent_lifetime)
+    logger = InMemoryLogger()
+
+    async with usecase(
+        session.id,
+        accounts=accounts,
+        gateway_to=RacingGatewayFactory(concurrent_session=concurrent_session),
+        transaction_for=cast(
+            TransactionFactory[InMemoryAccounts],
+            TransactionalContainerTransactionFactory(),
+        ),
+        logger=logger,
+        session_extension_threshold=0.5,
+    ) as result:
+        output = result.unwrap()
+
+    stored_session = accounts.storage.sessions_with_id(session.id)
+
+    assert output.session_end_time == concurrent_end_time.datetime_
+    assert stored_session is not None
+    assert stored_session.lifetime == concurrent_lifetime
+    assert not logger.session_extension_logs
+
+
+@mark.asyncio
+async def test_with_concurrent_cancellation(
+    accounts: InMemoryAccounts, session: _Session
+) -> None:
+    concurrent_session = replace(session, is_cancelled=True)
+
+    async with usecase(
+        session.id,
+        accounts=accounts,
+        gateway_to=RacingGatewayFactory(concurrent_session=concurrent_session),
+        transaction_for=cast(
+            TransactionFactory[InMemoryAccounts],
+            TransactionalContainerTransactionFactory(),
+        ),
+        logger=InMemoryLogger(),
+        session_extension_threshold=0.5,
+    ) as result:
+        error = result.unwrap_err()
+
+    assert error == "no_session_for_secondary_authentication"
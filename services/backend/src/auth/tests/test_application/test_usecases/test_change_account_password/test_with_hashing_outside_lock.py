@@ -0,0 +1,138 @@
+import hashlib
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from pytest import fixture, mark
+
+from auth.application.usecases.change_account_password import (
+    change_account_password as usecase,
+)
+from auth.domain.models.access.aggregates import account as _account
+from auth.domain.models.access.vos.password import Password, PasswordHash
+from auth.domain.models.access.vos.session_lifetime import SessionLifetime
+from auth.domain.models.access.vos.time import Time
+from auth.infrastructure.adapters.loggers.in_memory import InMemoryLogger
+from auth.infrastructure.adapters.mappers.in_memory.account import (
+    InMemoryAccountMapperFactory,
+)
+from auth.infrastructure.adapters.mappers.in_memory.account_name import (
+    InMemoryAccountNameMapperFactory,
+)
+from auth.infrastructure.adapters.mappers.in_memory.session import (
+    InMemorySessionMapperFactory,
+)
+from auth.infrastructure.adapters.repos.in_memory import InMemoryAccounts
+from auth.infrastructure.adapters.session_caches.in_memory import (
+    InMemorySessionCache,
+)
+from auth.tests.test_application.test_usecases.conftest import (
+    TrackedPasswordHasher,
+    TrackedTransactionFactory,
+    TransactionTracker,
+)
+
+
+@fixture
+def accounts() -> InMemoryAccounts:
+    current_time = Time.with_(datetime_=datetime.now(UTC)).unwrap()
+    accounts = InMemoryAccounts()
+
+    account_name = _account.internal.entities.account_name.AccountName.with_(
+        id=UUID(int=2),
+        account_id=UUID(int=1),
+        text="username",
+        taking_times={current_time},
+        is_current=True,
+        events=list(),
+    ).unwrap()
+    session = _account.internal.entities.session.Session(
+        id=UUID(int=3),
+        account_id=UUID(int=1),
+        lifetime=SessionLifetime.starting_from(current_time),
+        events=list(),
+    )
+    account = _account.root.Account(
+        id=UUID(int=1),
+        current_name=account_name,
+        previous_names=set(),
+        sessions={session},
+        password_hash=PasswordHash(
+            text=hashlib.sha256(b"Ab345678").hexdigest()
+        ),
+        events=list(),
+    )
+
+    accounts.add_account(account)
+    accounts.add_account_name(account_name)
+    accounts.add_session(session)
+
+    return accounts
+
+
+async def change_password(
+    password_text: str,
+    *,
+    accounts: InMemoryAccounts,
+    tracker: TransactionTracker,
+    password_hasher: TrackedPasswordHasher,
+) -> None:
+    async with usecase(
+        UUID(int=1),
+        password_text,
+        UUID(int=3),
+        accounts=accounts,
+        account_mapper_in=InMemoryAccountMapperFactory(),
+        account_name_mapper_in=InMemoryAccountNameMapperFactory(),
+        session_mapper_in=InMemorySessionMapperFactory(),
+        transaction_for=TrackedTransactionFactory(tracker=tracker),
+        logger=InMemoryLogger(),
+        password_hasher=password_hasher,
+        session_cache=InMemorySessionCache(
+            max_size=16, ttl=timedelta(seconds=30)
+        ),
+    ) as result:
+        result.unwrap()
+
+
+@mark.asyncio
+async def test_with_new_password(
+    accounts: InMemoryAccounts,
+    tracker: TransactionTracker,
+    password_hasher: TrackedPasswordHasher,
+) -> None:
+    await change_password(
+        "Bc456789",
+        accounts=accounts,
+        tracker=tracker,
+        password_hasher=password_hasher,
+    )
+
+    counts = list(tracker.open_transaction_counts_when_hashing)
+    account = await accounts.account_with_id(UUID(int=1))
+    new_password = Password.with_(text="Bc456789").unwrap()
+
+    assert counts == [0, 0]
+    assert account is not None
+    assert await password_hasher.is_hash_of(new_password, account.password_hash)
+
+
+@mark.asyncio
+async def test_with_same_password(
+    accounts: InMemoryAccounts,
+    tracker: TransactionTracker,
+    password_hasher: TrackedPasswordHasher,
+) -> None:
+    await change_password(
+        "Ab345678",
+        accounts=accounts,
+        tracker=tracker,
+        password_hasher=password_hasher,
+    )
+
+    account = await accounts.account_with_id(UUID(int=1))
+
+    assert tracker.open_transaction_counts_when_hashing == [0]
+    assert account is not None
+    assert account.password_hash == PasswordHash(
+        text=hashlib.sha256(b"Ab345678").hexdigest()
+    )
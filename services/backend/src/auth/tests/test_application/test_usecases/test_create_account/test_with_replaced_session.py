@@ -0,0 +1,125 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import Iterator, cast
+from uuid import UUID
+
+from pytest import fixture, mark
+
+from auth.application.ports.transactions import TransactionFactory
+from auth.application.usecases.create_account import (
+    create_account as usecase,
+)
+from auth.domain.models.access.aggregates import account as _account
+from auth.domain.models.access.vos.session_lifetime import SessionLifetime
+from auth.domain.models.access.vos.time import Time
+from auth.infrastructure.adapters.gateways.in_memory import (
+    InMemoryGatewayFactory,
+)
+from auth.infrastructure.adapters.hashers.scrypt import (
+    ScryptParams,
+    ScryptPasswordHasher,
+)
+from auth.infrastructure.adapters.loggers.in_memory import InMemoryLogger
+from auth.infrastructure.adapters.mappers.in_memory.account import (
+    InMemoryAccountMapperFactory,
+)
+from auth.infrastructure.adapters.mappers.in_memory.account_name import (
+    InMemoryAccountNameMapperFactory,
+)
+from auth.infrastructure.adapters.mappers.in_memory.session import (
+    InMemorySessionMapperFactory,
+)
+from auth.infrastructure.adapters.name_indexes.bloom import (
+    BloomAccountNameIndex,
+)
+from auth.infrastructure.adapters.repos.in_memory import InMemoryAccounts
+from auth.infrastructure.adapters.session_caches.in_memory import (
+    CachedSession,
+    InMemorySessionCache,
+)
+from auth.infrastructure.adapters.transactions import (
+    TransactionalContainerTransactionFactory,
+)
+from auth.infrastructure.periphery.executors import BoundedExecutor
+
+
+@fixture
+def session() -> _account.internal.entities.session.Session:
+    current_time = Time.with_(datetime_=datetime.now(UTC)).unwrap()
+
+    return _account.internal.entities.session.Session(
+        id=UUID(int=1),
+        account_id=UUID(int=2),
+        lifetime=SessionLifetime.starting_from(current_time),
+        events=list(),
+    )
+
+
+@fixture
+def accounts(
+    session: _account.internal.entities.session.Session,
+) -> InMemoryAccounts:
+    accounts = InMemoryAccounts()
+    accounts.add_session(session)
+
+    return accounts
+
+
+@fixture
+def session_cache(
+    session: _account.internal.entities.session.Session,
+) -> InMemorySessionCache:
+    session_cache = InMemorySessionCache(max_size=16, ttl=timedelta(seconds=30))
+    session_cache.put(
+        session.id,
+        CachedSession(
+            account_id=session.account_id,
+            end_time=session.lifetime.end_time.datetime_,
+        ),
+    )
+
+    return session_cache
+
+
+@fixture
+def password_hasher() -> Iterator[ScryptPasswordHasher]:
+    with ThreadPoolExecutor(1) as executor:
+        yield ScryptPasswordHasher(
+            BoundedExecutor(executor, worker_count=1),
+            params=ScryptParams(n=2**4, r=8, p=1, key_size=16),
+        )
+
+
+@mark.asyncio
+async def test_cached_replaced_session(
+    session: _account.internal.entities.session.Session,
+    accounts: InMemoryAccounts,
+    session_cache: InMemorySessionCache,
+    password_hasher: ScryptPasswordHasher,
+) -> None:
+    async with usecase(
+        session.id,
+        "username",
+        "Ab345678",
+        accounts=accounts,
+        account_mapper_in=InMemoryAccountMapperFactory(),
+        account_name_mapper_in=InMemoryAccountNameMapperFactory(),
+        session_mapper_in=InMemorySessionMapperFactory(),
+        transaction_for=cast(
+            TransactionFactory[InMemoryAccounts],
+            TransactionalContainerTransactionFactory(),
+        ),
+        gateway_to=InMemoryGatewayFactory(),
+        logger=InMemoryLogger(),
+        password_hasher=password_hasher,
+        account_name_index=BloomAccountNameIndex(
+            capacity=16,
+            false_positive_rate=0.01,
+            refresh_interval=timedelta(seconds=60),
+        ),
+        session_cache=session_cache,
+    ) as result:
+        output = result.unwrap()
+
+    assert output.session.id != session.id
+    assert session_cache.session_with_id(session.id) is None
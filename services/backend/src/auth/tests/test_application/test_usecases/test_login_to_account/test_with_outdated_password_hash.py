@@ -0,0 +1,121 @@
+import hashlib
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from pytest import fixture, mark
+
+from auth.application.usecases.login_to_account import (
+    login_to_account as usecase,
+)
+from auth.domain.models.access.aggregates import account as _account
+from auth.domain.models.access.vos.password import PasswordHash
+from auth.domain.models.access.vos.time import Time
+from auth.infrastructure.adapters.gateways.in_memory import (
+    InMemoryGatewayFactory,
+)
+from auth.infrastructure.adapters.loggers.in_memory import InMemoryLogger
+from auth.infrastructure.adapters.mappers.in_memory.account import (
+    InMemoryAccountMapperFactory,
+)
+from auth.infrastructure.adapters.mappers.in_memory.account_name import (
+    InMemoryAccountNameMapperFactory,
+)
+from auth.infrastructure.adapters.mappers.in_memory.session import (
+    InMemorySessionMapperFactory,
+)
+from auth.infrastructure.adapters.repos.in_memory import InMemoryAccounts
+from auth.infrastructure.adapters.session_caches.in_memory import (
+    InMemorySessionCache,
+)
+from auth.tests.test_application.test_usecases.conftest import (
+    TrackedPasswordHasher,
+    TrackedTransactionFactory,
+    TransactionTracker,
+)
+
+
+@fixture
+def accounts() -> InMemoryAccounts:
+    current_time = Time.with_(datetime_=datetime.now(UTC)).unwrap()
+    accounts = InMemoryAccounts()
+
+    account_name = _account.internal.entities.account_name.AccountName.with_(
+        id=UUID(int=2),
+        account_id=UUID(int=1),
+        text="username",
+        taking_times={current_time},
+        is_current=True,
+        events=list(),
+    ).unwrap()
+    account = _account.root.Account(
+        id=UUID(int=1),
+        current_name=account_name,
+        previous_names=set(),
+        sessions=set(),
+        password_hash=PasswordHash(
+            text=hashlib.sha256(b"Ab345678").hexdigest()
+        ),
+        events=list(),
+    )
+
+    accounts.add_account(account)
+    accounts.add_account_name(account_name)
+
+    return accounts
+
+
+@mark.asyncio
+async def test_hashing_outside_transactions(
+    accounts: InMemoryAccounts,
+    tracker: TransactionTracker,
+    password_hasher: TrackedPasswordHasher,
+) -> None:
+    async with usecase(
+        None,
+        "username",
+        "Ab345678",
+        accounts=accounts,
+        account_mapper_in=InMemoryAccountMapperFactory(),
+        account_name_mapper_in=InMemoryAccountNameMapperFactory(),
+        session_mapper_in=InMemorySessionMapperFactory(),
+        transaction_for=TrackedTransactionFactory(tracker=tracker),
+        gateway_to=InMemoryGatewayFactory(),
+        logger=InMemoryLogger(),
+        password_hasher=password_hasher,
+        session_cache=InMemorySessionCache(
+            max_size=16, ttl=timedelta(seconds=30)
+        ),
+    ) as result:
+        result.unwrap()
+
+    assert tracker.open_transaction_counts_when_hashing == [0, 0]
+
+
+@mark.asyncio
+async def test_rehashing(
+    accounts: InMemoryAccounts,
+    tracker: TransactionTracker,
+    password_hasher: TrackedPasswordHasher,
+) -> None:
+    async with usecase(
+        None,
+        "username",
+        "Ab345678",
+        accounts=accounts,
+        account_mapper_in=InMemoryAccountMapperFactory(),
+        account_name_mapper_in=InMemoryAccountNameMapperFactory(),
+        session_mapper_in=InMemorySessionMapperFactory(),
+        transaction_for=TrackedTransactionFactory(tracker=tracker),
+        gateway_to=InMemoryGatewayFactory(),
+        logger=InMemoryLogger(),
+        password_hasher=password_hasher,
+        session_cache=InMemorySessionCache(
+            max_size=16, ttl=timedelta(seconds=30)
+        ),
+    ) as result:
+        result.unwrap()
+
+    account = await accounts.account_with_id(UUID(int=1))
+
+    assert account is not None
+    assert not password_hasher.is_outdated(account.password_hash)
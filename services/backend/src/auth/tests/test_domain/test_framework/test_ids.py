@@ -0,0 +1,37 @@
+from datetime import UTC, datetime, timedelta
+
+from auth.domain.framework.ids import (
+    first_time_ordered_uuid_of,
+    time_ordered_uuid_of,
+)
+
+
+def test_version() -> None:
+    id_ = time_ordered_uuid_of(datetime.now(UTC))
+
+    assert id_.version == 7
+
+
+def test_variant() -> None:
+    id_ = time_ordered_uuid_of(datetime.now(UTC))
+
+    assert id_.variant == "specified in RFC 4122"
+
+
+def test_order() -> None:
+    time = datetime(2000, 1, 1, tzinfo=UTC)
+
+    first_id = time_ordered_uuid_of(time)
+    second_id = time_ordered_uuid_of(time + timedelta(milliseconds=1))
+
+    assert first_id < second_id
+
+
+def test_first_id() -> None:
+    time = datetime(2000, 1, 1, tzinfo=UTC)
+
+    first_id = first_time_ordered_uuid_of(time)
+    id_ = time_ordered_uuid_of(time)
+    next_first_id = first_time_ordered_uuid_of(time + timedelta(milliseconds=1))
+
+    assert first_id <= id_ < next_first_id
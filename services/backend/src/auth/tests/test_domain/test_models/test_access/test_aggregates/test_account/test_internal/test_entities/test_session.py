@@ -0,0 +1,103 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from pytest import fixture
+
+from auth.domain.framework.effects.searchable import SearchableEffect
+from auth.domain.models.access.aggregates.account.internal.entities.session import (  # noqa: E501
+    Extended,
+    Session,
+    secondarily_authenticate,
+)
+from auth.domain.models.access.vos.session_lifetime import SessionLifetime
+from auth.domain.models.access.vos.time import Time
+
+
+start_time = Time.with_(datetime_=datetime(2000, 1, 1, tzinfo=UTC)).unwrap()
+threshold = 0.5
+threshold_time = start_time.map(
+    lambda time: time + SessionLifetime.chunk * (1 - threshold)
+)
+
+
+@fixture
+def session() -> Session:
+    return Session(
+        id=UUID(int=0),
+        account_id=UUID(int=1),
+        lifetime=SessionLifetime.starting_from(start_time),
+        events=[],
+    )
+
+
+def test_above_threshold(session: Session) -> None:
+    effect = SearchableEffect()
+    lifetime = session.lifetime
+
+    result = secondarily_authenticate(
+        session,
+        current_time=start_time.map(lambda time: time + timedelta(days=1)),
+        extension_threshold=threshold,
+        effect=effect,
+    )
+
+    assert result.unwrap() is session
+    assert session.lifetime == lifetime
+    assert not session.events_with_type(Extended)
+    assert not list(effect.entities_that(Session))
+
+
+def test_on_threshold(session: Session) -> None:
+    effect = SearchableEffect()
+    lifetime = session.lifetime
+
+    result = secondarily_authenticate(
+        session,
+        current_time=threshold_time,
+        extension_threshold=threshold,
+        effect=effect,
+    )
+
+    assert result.unwrap() is session
+    assert session.lifetime == lifetime
+    assert not session.events_with_type(Extended)
+    assert not list(effect.entities_that(Session))
+
+
+def test_below_threshold(session: Session) -> None:
+    effect = SearchableEffect()
+    current_time = threshold_time.map(lambda time: time + timedelta(seconds=1))
+
+    result = secondarily_authenticate(
+        session,
+        current_time=current_time,
+        extension_threshold=threshold,
+        effect=effect,
+    )
+
+    new_lifetime = SessionLifetime(
+        start_time=start_time,
+        end_time=current_time.map(lambda time: time + SessionLifetime.chunk),
+    )
+    assert result.unwrap() is session
+    assert session.lifetime == new_lifetime
+    assert session.events == [
+        Extended(entity=session, new_lifetime=new_lifetime)
+    ]
+    assert list(effect.entities_that(Session)) == [session]
+
+
+def test_after_expiration(session: Session) -> None:
+    effect = SearchableEffect()
+
+    result = secondarily_authenticate(
+        session,
+        current_time=session.lifetime.end_time.map(
+            lambda time: time + timedelta(seconds=1)
+        ),
+        extension_threshold=threshold,
+        effect=effect,
+    )
+
+    assert result.unwrap_err() == "expired_session_for_secondary_authentication"
+    assert not session.events_with_type(Extended)
@@ -0,0 +1,55 @@
+from datetime import UTC, datetime
+
+from auth.domain.models.access.vos.session_lifetime import SessionLifetime
+from auth.domain.models.access.vos.time import Time
+
+
+start_time = Time.with_(datetime_=datetime(2000, 1, 1, tzinfo=UTC)).unwrap()
+lifetime = SessionLifetime.starting_from(start_time)
+threshold = 0.5
+threshold_time = start_time.map(
+    lambda time: time + SessionLifetime.chunk * (1 - threshold)
+)
+
+
+def test_above_threshold() -> None:
+    current_time = start_time
+
+    assert not lifetime.is_due_for_extension_when(
+        current_time=current_time, extension_threshold=threshold
+    )
+
+
+def test_on_threshold() -> None:
+    assert not lifetime.is_due_for_extension_when(
+        current_time=threshold_time, extension_threshold=threshold
+    )
+
+
+def test_below_threshold() -> None:
+    current_time = lifetime.end_time
+
+    assert lifetime.is_due_for_extension_when(
+        current_time=current_time, extension_threshold=threshold
+    )
+
+
+def test_just_below_threshold() -> None:
+    current_time = threshold_time.map(lambda time: time.replace(microsecond=1))
+
+    assert lifetime.is_due_for_extension_when(
+        current_time=current_time, extension_threshold=threshold
+    )
+
+
+def test_with_zero_threshold() -> None:
+    assert not lifetime.is_due_for_extension_when(
+        current_time=lifetime.end_time, extension_threshold=0
+    )
+
+
+def test_with_full_threshold() -> None:
+    assert lifetime.is_due_for_extension_when(
+        current_time=start_time.map(lambda time: time.replace(microsecond=1)),
+        extension_threshold=1,
+    )
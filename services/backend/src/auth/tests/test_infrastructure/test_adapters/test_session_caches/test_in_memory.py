@@ -0,0 +1,139 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from pytest import fixture
+
+from auth.infrastructure.adapters.session_caches.in_memory import (
+    CachedSession,
+    InMemorySessionCache,
+)
+
+
+current_time = datetime(2000, 1, 1, tzinfo=UTC)
+
+
+@fixture
+def session_cache() -> InMemorySessionCache:
+    return InMemorySessionCache(max_size=2, ttl=timedelta(seconds=30))
+
+
+def cached_session_with(
+    *, end_time: datetime = current_time + timedelta(days=1)
+) -> CachedSession:
+    return CachedSession(account_id=UUID(int=1), end_time=end_time)
+
+
+def test_put(session_cache: InMemorySessionCache) -> None:
+    cached_session = cached_session_with()
+
+    session_cache.put(UUID(int=0), cached_session, current_time=current_time)
+    result = session_cache.session_with_id(
+        UUID(int=0), current_time=current_time
+    )
+
+    assert result == cached_session
+    assert session_cache.hit_count == 1
+    assert session_cache.miss_count == 0
+
+
+def test_without_session(session_cache: InMemorySessionCache) -> None:
+    result = session_cache.session_with_id(
+        UUID(int=0), current_time=current_time
+    )
+
+    assert result is None
+    assert session_cache.hit_count == 0
+    assert session_cache.miss_count == 1
+
+
+def test_ttl_expiration(session_cache: InMemorySessionCache) -> None:
+    session_cache.put(
+        UUID(int=0), cached_session_with(), current_time=current_time
+    )
+
+    result = session_cache.session_with_id(
+        UUID(int=0), current_time=current_time + timedelta(seconds=30)
+    )
+
+    assert result is None
+    assert len(session_cache) == 0
+    assert session_cache.miss_count == 1
+
+
+def test_end_time_expiration(session_cache: InMemorySessionCache) -> None:
+    end_time = current_time + timedelta(seconds=10)
+    session_cache.put(
+        UUID(int=0),
+        cached_session_with(end_time=end_time),
+        current_time=current_time,
+    )
+
+    result_before_end = session_cache.session_with_id(
+        UUID(int=0), current_time=end_time - timedelta(seconds=1)
+    )
+    result_after_end = session_cache.session_with_id(
+        UUID(int=0), current_time=end_time
+    )
+
+    assert result_before_end is not None
+    assert result_after_end is None
+
+
+def test_put_of_ended_session(session_cache: InMemorySessionCache) -> None:
+    session_cache.put(
+        UUID(int=0), cached_session_with(), current_time=current_time
+    )
+
+    session_cache.put(
+        UUID(int=0),
+        cached_session_with(end_time=current_time),
+        current_time=current_time,
+    )
+
+    assert len(session_cache) == 0
+
+
+def test_lru_eviction(session_cache: InMemorySessionCache) -> None:
+    for number in range(2):
+        session_cache.put(
+            UUID(int=number), cached_session_with(), current_time=current_time
+        )
+
+    session_cache.session_with_id(UUID(int=0), current_time=current_time)
+    session_cache.put(
+        UUID(int=2), cached_session_with(), current_time=current_time
+    )
+
+    assert len(session_cache) == 2
+    assert session_cache.session_with_id(UUID(int=0), current_time=current_time)
+    assert not session_cache.session_with_id(
+        UUID(int=1), current_time=current_time
+    )
+    assert session_cache.session_with_id(UUID(int=2), current_time=current_time)
+
+
+def test_disabled_cache() -> None:
+    session_cache = InMemorySessionCache(max_size=0, ttl=timedelta(seconds=30))
+
+    session_cache.put(
+        UUID(int=0), cached_session_with(), current_time=current_time
+    )
+    result = session_cache.session_with_id(
+        UUID(int=0), current_time=current_time
+    )
+
+    assert result is None
+    assert len(session_cache) == 0
+
+
+async def test_invalidate(session_cache: InMemorySessionCache) -> None:
+    session_cache.put(
+        UUID(int=0), cached_session_with(), current_time=current_time
+    )
+
+    await session_cache.invalidate(UUID(int=0))
+    result = session_cache.session_with_id(
+        UUID(int=0), current_time=current_time
+    )
+
+    assert result is None
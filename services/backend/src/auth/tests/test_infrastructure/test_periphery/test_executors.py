@@ -0,0 +1,78 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from threading import Event
+from typing import Iterator
+
+from pytest import fixture
+
+from auth.infrastructure.periphery.executors import BoundedExecutor
+
+
+@fixture
+def thread_pool() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor(2) as thread_pool:
+        yield thread_pool
+
+
+async def test_result(thread_pool: ThreadPoolExecutor) -> None:
+    executor = BoundedExecutor(thread_pool, worker_count=1)
+
+    result = await executor.run(lambda: 4)
+
+    assert result == 4
+    assert executor.running_count == 0
+    assert executor.completed_count == 1
+
+
+async def test_queue_depth(thread_pool: ThreadPoolExecutor) -> None:
+    executor = BoundedExecutor(thread_pool, worker_count=1)
+    is_released = Event()
+
+    tasks = [
+        asyncio.create_task(executor.run(is_released.wait)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    queue_depth = executor.queue_depth
+    running_count = executor.running_count
+
+    is_released.set()
+    await asyncio.gather(*tasks)
+
+    assert queue_depth == 2
+    assert running_count == 1
+    assert executor.peak_queue_depth == 2
+    assert executor.queue_depth == 0
+    assert executor.completed_count == 3
+
+
+async def test_with_cancelled_running_job(
+    thread_pool: ThreadPoolExecutor,
+) -> None:
+    executor = BoundedExecutor(thread_pool, worker_count=1)
+    is_first_job_started = Event()
+    is_first_job_released = Event()
+
+    def first_job() -> int:
+        is_first_job_started.set()
+        is_first_job_released.wait()
+        return 1
+
+    first_task = asyncio.create_task(executor.run(first_job))
+    await asyncio.to_thread(is_first_job_started.wait)
+    first_task.cancel()
+
+    with suppress(asyncio.CancelledError):
+        await first_task
+
+    second_task = asyncio.create_task(executor.run(lambda: 2))
+    await asyncio.sleep(0.05)
+    is_second_job_waiting = not second_task.done()
+    running_count = executor.running_count
+
+    is_first_job_released.set()
+
+    assert await second_task == 2
+    assert is_second_job_waiting
+    assert running_count == 1
+    assert executor.running_count == 0
@@ -0,0 +1,25 @@
+from datetime import UTC, datetime
+
+from auth.domain.framework.ids import time_ordered_uuid_of
+from auth.infrastructure.periphery.sqlalchemy.retention import (
+    partition_bounds_of,
+)
+
+
+def test_partition_bounds() -> None:
+    lower_id, upper_id = partition_bounds_of(datetime(2000, 12, 1, tzinfo=UTC))
+
+    first_id = time_ordered_uuid_of(datetime(2000, 12, 1, tzinfo=UTC))
+    last_id = time_ordered_uuid_of(
+        datetime(2000, 12, 31, 23, 59, 59, 999000, tzinfo=UTC)
+    )
+    next_id = time_ordered_uuid_of(datetime(2001, 1, 1, tzinfo=UTC))
+
+    assert lower_id <= first_id < last_id < upper_id <= next_id
+
+
+def test_adjacent_partition_bounds() -> None:
+    _, upper_id = partition_bounds_of(datetime(2000, 12, 1, tzinfo=UTC))
+    next_lower_id, _ = partition_bounds_of(datetime(2001, 1, 1, tzinfo=UTC))
+
+    assert upper_id == next_lower_id
@@ -24,6 +24,15 @@ async def close() -> None:
     await aqua.close.perform()
 
 
+async def warm_up() -> Error | None:
+    try:
+        await aqua.warm_up.perform()
+    except Exception as error:
+        return Error(unexpected_error=error)
+
+    return None
+
+
 @dataclass(kw_only=True, frozen=True, slots=True)
 class RegisterUserOutputData:
     user_id: UUID
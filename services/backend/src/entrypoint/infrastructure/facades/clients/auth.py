@@ -16,6 +16,24 @@ async def close() -> None:
     await auth.close.perform()
 
 
+async def warm_up() -> Error | None:
+    try:
+        await auth.warm_up.perform()
+    except Exception as error:
+        return Error(unexpected_error=error)
+
+    return None
+
+
+async def refresh_account_name_index() -> Error | None:
+    try:
+        await auth.refresh_account_name_index.perform()
+    except Exception as error:
+        return Error(unexpected_error=error)
+
+    return None
+
+
 @dataclass(kw_only=True, frozen=True, slots=True)
 class RegisterUserOutputData:
     user_id: UUID
@@ -6,3 +6,13 @@ _env.read_env(".env")
 
 
 is_dev = _env.bool("ENTRYPOINT_DEV")
+
+worker_count = _env.int("ENTRYPOINT_WORKER_COUNT", default=1)
+uses_uvloop = _env.bool("ENTRYPOINT_USES_UVLOOP", default=True)
+uses_httptools = _env.bool("ENTRYPOINT_USES_HTTPTOOLS", default=True)
+graceful_shutdown_seconds = _env.int(
+    "ENTRYPOINT_GRACEFUL_SHUTDOWN_SECONDS", default=30
+)
+warm_up_retry_seconds = _env.float(
+    "ENTRYPOINT_WARM_UP_RETRY_SECONDS", default=5
+)
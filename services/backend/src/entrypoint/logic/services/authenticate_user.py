@@ -0,0 +1,25 @@
+from typing import Literal
+from uuid import UUID
+
+from entrypoint.infrastructure.facades.clients import auth
+from entrypoint.infrastructure.facades.loggers import auth_logger
+
+
+type Output = (
+    auth.AuthenticateUserOutputData
+    | Literal["error"]
+    | Literal["not_authenticated"]
+)
+
+
+async def authenticate_user(session_id: UUID) -> Output:
+    async with auth.authenticate_user(session_id) as authentication_result:
+        ...
+
+    if isinstance(authentication_result, auth.Error):
+        await auth_logger.log_error(authentication_result)
+        return "error"
+    if not isinstance(authentication_result, auth.AuthenticateUserOutputData):
+        return "not_authenticated"
+
+    return authentication_result
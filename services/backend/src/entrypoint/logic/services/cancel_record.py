@@ -3,7 +3,10 @@ from typing import Literal
 from uuid import UUID
 
 from entrypoint.infrastructure.facades.clients import aqua, auth
-from entrypoint.infrastructure.facades.loggers import aqua_logger, auth_logger
+from entrypoint.infrastructure.facades.loggers import aqua_logger
+from entrypoint.logic.services.authenticate_user import (
+    Output as AuthenticationOutput,
+)
 
 
 type AquaOutput = (
@@ -20,15 +23,11 @@ class OutputData:
 type Output = OutputData | Literal["error"] | Literal["not_authenticated"]
 
 
-async def cancel_record(session_id: UUID, record_id: UUID) -> Output:
-    async with auth.authenticate_user(session_id) as auth_result:
-        ...
-
-    if isinstance(auth_result, auth.Error):
-        await auth_logger.log_error(auth_result)
-        return "error"
+async def cancel_record(
+    auth_result: AuthenticationOutput, record_id: UUID
+) -> Output:
     if not isinstance(auth_result, auth.AuthenticateUserOutputData):
-        return "not_authenticated"
+        return auth_result
 
     user_id = auth_result.user_id
 
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from typing import Literal
-from uuid import UUID
 
 from entrypoint.infrastructure.facades.clients import auth
 from entrypoint.infrastructure.facades.loggers import auth_logger
+from entrypoint.logic.services.authenticate_user import (
+    Output as AuthenticationOutput,
+)
 
 
 type AuthOutput = (
@@ -20,17 +22,14 @@ class OutputData:
 type Output = OutputData | Literal["error"] | Literal["not_authenticated"]
 
 
-async def change_password(session_id: UUID, new_password: str) -> Output:
-    async with auth.authenticate_user(session_id) as authentication_result:
-        ...
-
-    if isinstance(authentication_result, auth.Error):
-        await auth_logger.log_error(authentication_result)
-        return "error"
+async def change_password(
+    authentication_result: AuthenticationOutput, new_password: str
+) -> Output:
     if not isinstance(authentication_result, auth.AuthenticateUserOutputData):
-        return "not_authenticated"
+        return authentication_result
 
     user_id = authentication_result.user_id
+    session_id = authentication_result.session_id
 
     change_password = auth.change_password(session_id, user_id, new_password)
     async with change_password as auth_result:
@@ -1,6 +1,6 @@
 from entrypoint.infrastructure.facades.clients import aqua, auth
+from entrypoint.logic.tools.fan_out import fan_out
 
 
 async def close() -> None:
-    await aqua.close()
-    await auth.close()
+    await fan_out(aqua.close(), auth.close())
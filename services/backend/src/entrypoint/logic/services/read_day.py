@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from datetime import date
 from typing import Literal
-from uuid import UUID
 
 from entrypoint.infrastructure.facades.clients import aqua, auth
-from entrypoint.infrastructure.facades.loggers import aqua_logger, auth_logger
+from entrypoint.infrastructure.facades.loggers import aqua_logger
+from entrypoint.logic.services.authenticate_user import (
+    Output as AuthenticationOutput,
+)
 
 
 type AquaOutput = aqua.ReadDayOutputData | None
@@ -19,15 +21,9 @@ class OutputData:
 type Output = OutputData | Literal["error"] | Literal["not_authenticated"]
 
 
-async def read_day(session_id: UUID, date_: date) -> Output:
-    async with auth.authenticate_user(session_id) as auth_result:
-        ...
-
-    if isinstance(auth_result, auth.Error):
-        await auth_logger.log_error(auth_result)
-        return "error"
+async def read_day(auth_result: AuthenticationOutput, date_: date) -> Output:
     if not isinstance(auth_result, auth.AuthenticateUserOutputData):
-        return "not_authenticated"
+        return auth_result
 
     aqua_result = await aqua.read_day(auth_result.user_id, date_)
 
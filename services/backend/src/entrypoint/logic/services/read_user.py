@@ -4,6 +4,10 @@ from uuid import UUID
 
 from entrypoint.infrastructure.facades.clients import aqua, auth
 from entrypoint.infrastructure.facades.loggers import aqua_logger, auth_logger
+from entrypoint.logic.services.authenticate_user import (
+    Output as AuthenticationOutput,
+)
+from entrypoint.logic.tools.fan_out import fan_out
 
 
 @dataclass(kw_only=True, frozen=True)
@@ -16,25 +20,17 @@ class OutputData:
 type Output = OutputData | Literal["error"] | Literal["not_authenticated"]
 
 
-async def read_user(session_id: UUID) -> Output:
-    async with auth.authenticate_user(session_id) as authentication_result:
-        ...
-
-    if isinstance(authentication_result, auth.Error):
-        await auth_logger.log_error(authentication_result)
-        return "error"
+async def read_user(
+    authentication_result: AuthenticationOutput,
+) -> Output:
     if not isinstance(authentication_result, auth.AuthenticateUserOutputData):
-        return "not_authenticated"
+        return authentication_result
 
     user_id = authentication_result.user_id
 
-    aqua_result = await aqua.read_user(user_id)
-    if isinstance(aqua_result, aqua.Error):
-        await aqua_logger.log_error(aqua_result)
-
-    auth_result = await auth.read_user(user_id)
-    if isinstance(auth_result, auth.Error):
-        await auth_logger.log_error(auth_result)
+    aqua_result, auth_result = await fan_out(
+        _read_aqua_user(user_id), _read_auth_user(user_id)
+    )
 
     aqua_has_no_user = aqua_result == "no_user"
     auth_has_no_user = auth_result == "no_user"
@@ -59,3 +55,23 @@ async def read_user(session_id: UUID) -> Output:
         auth_output=auth_output,
         aqua_output=aqua_output,
     )
+
+
+async def _read_aqua_user(
+    user_id: UUID,
+) -> aqua.ReadUserOutputData | aqua.Error | Literal["no_user"]:
+    aqua_result = await aqua.read_user(user_id)
+    if isinstance(aqua_result, aqua.Error):
+        await aqua_logger.log_error(aqua_result)
+
+    return aqua_result
+
+
+async def _read_auth_user(
+    user_id: UUID,
+) -> auth.ReadUserOutputData | auth.Error | Literal["no_user"]:
+    auth_result = await auth.read_user(user_id)
+    if isinstance(auth_result, auth.Error):
+        await auth_logger.log_error(auth_result)
+
+    return auth_result
@@ -0,0 +1,10 @@
+from entrypoint.infrastructure.facades.clients import auth
+from entrypoint.infrastructure.facades.loggers import auth_logger
+
+
+async def refresh_account_name_index() -> None:
+    while True:
+        result = await auth.refresh_account_name_index()
+
+        if isinstance(result, auth.Error):
+            await auth_logger.log_error(result)
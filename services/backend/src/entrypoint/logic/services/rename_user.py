@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from typing import Literal
-from uuid import UUID
 
 from entrypoint.infrastructure.facades.clients import auth
 from entrypoint.infrastructure.facades.loggers import auth_logger
+from entrypoint.logic.services.authenticate_user import (
+    Output as AuthenticationOutput,
+)
 
 
 type AuthOutput = (
@@ -23,17 +25,14 @@ class OutputData:
 type Output = OutputData | Literal["error"] | Literal["not_authenticated"]
 
 
-async def rename_user(session_id: UUID, new_username: str) -> Output:
-    async with auth.authenticate_user(session_id) as authentication_result:
-        ...
-
-    if isinstance(authentication_result, auth.Error):
-        await auth_logger.log_error(authentication_result)
-        return "error"
+async def rename_user(
+    authentication_result: AuthenticationOutput, new_username: str
+) -> Output:
     if not isinstance(authentication_result, auth.AuthenticateUserOutputData):
-        return "not_authenticated"
+        return authentication_result
 
     user_id = authentication_result.user_id
+    session_id = authentication_result.session_id
 
     async with auth.rename_user(user_id, new_username) as auth_result:
         auth_output: AuthOutput = "error"
@@ -0,0 +1,27 @@
+from entrypoint.infrastructure.facades.clients import aqua, auth
+from entrypoint.infrastructure.facades.loggers import aqua_logger, auth_logger
+from entrypoint.logic.tools.fan_out import fan_out
+
+
+async def warm_up() -> bool:
+    is_aqua_warm, is_auth_warm = await fan_out(_warm_up_aqua(), _warm_up_auth())
+
+    return is_aqua_warm and is_auth_warm
+
+
+async def _warm_up_aqua() -> bool:
+    result = await aqua.warm_up()
+    if isinstance(result, aqua.Error):
+        await aqua_logger.log_error(result)
+        return False
+
+    return True
+
+
+async def _warm_up_auth() -> bool:
+    result = await auth.warm_up()
+    if isinstance(result, auth.Error):
+        await auth_logger.log_error(result)
+        return False
+
+    return True
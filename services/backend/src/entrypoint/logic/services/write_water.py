@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from typing import Literal
-from uuid import UUID
 
 from entrypoint.infrastructure.facades.clients import aqua, auth
-from entrypoint.infrastructure.facades.loggers import aqua_logger, auth_logger
+from entrypoint.infrastructure.facades.loggers import aqua_logger
+from entrypoint.logic.services.authenticate_user import (
+    Output as AuthenticationOutput,
+)
 
 
 type AquaOutput = (
@@ -22,15 +24,11 @@ class OutputData:
 type Output = OutputData | Literal["error"] | Literal["not_authenticated"]
 
 
-async def write_water(session_id: UUID, milliliters: int | None) -> Output:
-    async with auth.authenticate_user(session_id) as auth_result:
-        ...
-
-    if isinstance(auth_result, auth.Error):
-        await auth_logger.log_error(auth_result)
-        return "error"
+async def write_water(
+    auth_result: AuthenticationOutput, milliliters: int | None
+) -> Output:
     if not isinstance(auth_result, auth.AuthenticateUserOutputData):
-        return "not_authenticated"
+        return auth_result
 
     user_id = auth_result.user_id
 
@@ -0,0 +1,17 @@
+from asyncio import TaskGroup
+from collections.abc import Coroutine
+from typing import Any
+
+
+async def fan_out[FirstT, SecondT](
+    first: Coroutine[Any, Any, FirstT],
+    second: Coroutine[Any, Any, SecondT],
+) -> tuple[FirstT, SecondT]:
+    try:
+        async with TaskGroup() as task_group:
+            first_task = task_group.create_task(first)
+            second_task = task_group.create_task(second)
+    except* Exception as error_group:
+        raise error_group.exceptions[0] from None
+
+    return first_task.result(), second_task.result()
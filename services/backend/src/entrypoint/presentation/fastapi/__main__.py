@@ -1,10 +1,38 @@
+import os
+from importlib.util import find_spec
+from typing import Literal
+
 import uvicorn
 
-from entrypoint.presentation.fastapi.app import app
+from entrypoint.infrastructure.periphery import envs
 
 
 def main() -> None:
-    uvicorn.run(app, host="0.0.0.0", port=8000)  # noqa: S104
+    os.environ["AUTH_PROCESS_COUNT"] = str(envs.worker_count)
+
+    uvicorn.run(
+        "entrypoint.presentation.fastapi.app:app",
+        host="0.0.0.0",  # noqa: S104
+        port=8000,
+        workers=envs.worker_count,
+        loop=_loop(),
+        http=_http(),
+        timeout_graceful_shutdown=envs.graceful_shutdown_seconds,
+    )
+
+
+def _loop() -> Literal["uvloop", "asyncio"]:
+    if envs.uses_uvloop and find_spec("uvloop") is not None:
+        return "uvloop"
+
+    return "asyncio"
+
+
+def _http() -> Literal["httptools", "h11"]:
+    if envs.uses_httptools and find_spec("httptools") is not None:
+        return "httptools"
+
+    return "h11"
 
 
 if __name__ == "__main__":
@@ -1,15 +1,28 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncIterator
 
 from fastapi import FastAPI
 
 from entrypoint.logic.services.close import close
+from entrypoint.logic.services.refresh_account_name_index import (
+    refresh_account_name_index,
+)
 from entrypoint.presentation.fastapi.controllers.routers import router
+from entrypoint.presentation.fastapi.readiness import readiness
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: ARG001
+    await readiness.warm_up()
+    refreshing = asyncio.create_task(refresh_account_name_index())
     yield
+    refreshing.cancel()
+
+    with suppress(asyncio.CancelledError):
+        await refreshing
+
+    await readiness.stop()
     await close()
 
 
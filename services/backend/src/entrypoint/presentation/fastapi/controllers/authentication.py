@@ -0,0 +1,41 @@
+from typing import Annotated, TypeAlias, cast
+
+from fastapi import Depends, Request
+
+from entrypoint.logic.services.authenticate_user import (
+    Output as AuthenticationOutput,
+)
+from entrypoint.logic.services.authenticate_user import (
+    authenticate_user as service,
+)
+from entrypoint.presentation.fastapi.controllers import cookies
+from entrypoint.presentation.fastapi.controllers.parsers import (
+    InvalidHexError,
+    valid_id_of,
+)
+
+
+type Authentication = AuthenticationOutput | InvalidHexError
+
+
+async def authentication_of(
+    request: Request, session_id_hex: cookies.session_id_cookie
+) -> Authentication:
+    if hasattr(request.state, "authentication"):
+        return cast(Authentication, request.state.authentication)
+
+    session_id = valid_id_of(session_id_hex)
+
+    authentication: Authentication
+    if session_id is None:
+        authentication = InvalidHexError()
+    else:
+        authentication = await service(session_id)
+
+    request.state.authentication = authentication
+    return authentication
+
+
+current_authentication: TypeAlias = Annotated[
+    Authentication, Depends(authentication_of)
+]
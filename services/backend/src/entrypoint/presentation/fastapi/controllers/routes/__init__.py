@@ -16,6 +16,9 @@ from entrypoint.presentation.fastapi.controllers.routes import (
 from entrypoint.presentation.fastapi.controllers.routes import (
     read_user as read_user,
 )
+from entrypoint.presentation.fastapi.controllers.routes import (
+    readiness as readiness,
+)
 from entrypoint.presentation.fastapi.controllers.routes import (
     register_user as register_user,
 )
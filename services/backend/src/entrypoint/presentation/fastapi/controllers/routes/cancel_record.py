@@ -4,8 +4,10 @@ from fastapi import Response
 from pydantic import BaseModel
 
 from entrypoint.logic.services.cancel_record import cancel_record as service
-from entrypoint.presentation.fastapi.controllers import cookies
-from entrypoint.presentation.fastapi.controllers.parsers import valid_id_of
+from entrypoint.presentation.fastapi.controllers.authentication import (
+    current_authentication,
+)
+from entrypoint.presentation.fastapi.controllers.parsers import InvalidHexError
 from entrypoint.presentation.fastapi.controllers.routers import router
 from entrypoint.presentation.fastapi.controllers.tags import Tag
 from entrypoint.presentation.fastapi.views.responses.bad.fault import (
@@ -50,14 +52,12 @@ class CancelRecordRequestModel(BaseModel):
 )
 async def cancel_record(
     request_model: CancelRecordRequestModel,
-    session_id_hex: cookies.session_id_cookie,
+    authentication: current_authentication,
 ) -> Response:
-    session_id = valid_id_of(session_id_hex)
-
-    if session_id is None:
+    if isinstance(authentication, InvalidHexError):
         return invalid_session_id_hex_response_model.to_response()
 
-    result = await service(session_id, request_model.record_id)
+    result = await service(authentication, request_model.record_id)
 
     if result == "error":
         return fault_response_model.to_response()
@@ -2,8 +2,10 @@ from fastapi import Response
 from pydantic import BaseModel
 
 from entrypoint.logic.services.change_password import change_password as service
-from entrypoint.presentation.fastapi.controllers import cookies
-from entrypoint.presentation.fastapi.controllers.parsers import valid_id_of
+from entrypoint.presentation.fastapi.controllers.authentication import (
+    current_authentication,
+)
+from entrypoint.presentation.fastapi.controllers.parsers import InvalidHexError
 from entrypoint.presentation.fastapi.controllers.routers import router
 from entrypoint.presentation.fastapi.controllers.tags import Tag
 from entrypoint.presentation.fastapi.views.responses.bad.fault import (
@@ -47,14 +49,12 @@ class ChangePasswordRequestModel(BaseModel):
 )
 async def change_password(
     request_model: ChangePasswordRequestModel,
-    session_id_hex: cookies.session_id_cookie,
+    authentication: current_authentication,
 ) -> Response:
-    session_id = valid_id_of(session_id_hex)
-
-    if session_id is None:
+    if isinstance(authentication, InvalidHexError):
         return invalid_session_id_hex_response_model.to_response()
 
-    result = await service(session_id, request_model.new_password)
+    result = await service(authentication, request_model.new_password)
 
     if result == "error":
         return fault_response_model.to_response()
@@ -3,8 +3,10 @@ from datetime import date
 from fastapi import Response
 
 from entrypoint.logic.services.read_day import read_day as service
-from entrypoint.presentation.fastapi.controllers import cookies
-from entrypoint.presentation.fastapi.controllers.parsers import valid_id_of
+from entrypoint.presentation.fastapi.controllers.authentication import (
+    current_authentication,
+)
+from entrypoint.presentation.fastapi.controllers.parsers import InvalidHexError
 from entrypoint.presentation.fastapi.controllers.routers import router
 from entrypoint.presentation.fastapi.controllers.tags import Tag
 from entrypoint.presentation.fastapi.views.responses.bad.fault import (
@@ -40,15 +42,13 @@ from entrypoint.presentation.fastapi.views.responses.ok.day.day import (
     ),
 )
 async def read_day(
-    session_id_hex: cookies.session_id_cookie,
+    authentication: current_authentication,
     date_: date,
 ) -> Response:
-    session_id = valid_id_of(session_id_hex)
-
-    if session_id is None:
+    if isinstance(authentication, InvalidHexError):
         return invalid_session_id_hex_response_model.to_response()
 
-    result = await service(session_id, date_)
+    result = await service(authentication, date_)
 
     if result == "error":
         return fault_response_model.to_response()
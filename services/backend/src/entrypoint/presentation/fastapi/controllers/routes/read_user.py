@@ -1,8 +1,10 @@
 from fastapi import Response
 
 from entrypoint.logic.services.read_user import read_user as service
-from entrypoint.presentation.fastapi.controllers import cookies
-from entrypoint.presentation.fastapi.controllers.parsers import valid_id_of
+from entrypoint.presentation.fastapi.controllers.authentication import (
+    current_authentication,
+)
+from entrypoint.presentation.fastapi.controllers.parsers import InvalidHexError
 from entrypoint.presentation.fastapi.controllers.routers import router
 from entrypoint.presentation.fastapi.controllers.tags import Tag
 from entrypoint.presentation.fastapi.views.responses.bad.fault import (
@@ -39,13 +41,11 @@ from entrypoint.presentation.fastapi.views.responses.ok.user.user import (
         user_response_model,
     ),
 )
-async def read_user(session_id_hex: cookies.session_id_cookie) -> Response:
-    session_id = valid_id_of(session_id_hex)
-
-    if session_id is None:
+async def read_user(authentication: current_authentication) -> Response:
+    if isinstance(authentication, InvalidHexError):
         return invalid_session_id_hex_response_model.to_response()
 
-    result = await service(session_id)
+    result = await service(authentication)
 
     if result == "error":
         return fault_response_model.to_response()
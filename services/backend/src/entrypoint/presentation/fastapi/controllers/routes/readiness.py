@@ -0,0 +1,27 @@
+from fastapi import Response
+
+from entrypoint.presentation.fastapi.controllers.routers import router
+from entrypoint.presentation.fastapi.controllers.tags import Tag
+from entrypoint.presentation.fastapi.readiness import readiness as _readiness
+from entrypoint.presentation.fastapi.views.responses.bad.not_ready import (
+    not_ready_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    to_doc,
+)
+from entrypoint.presentation.fastapi.views.responses.ok.service.readiness import (  # noqa: E501
+    readiness_response_model,
+)
+
+
+@router.get(
+    "/readiness",
+    tags=[Tag.service_endpoints],
+    status_code=readiness_response_model.status_code,
+    responses=to_doc(not_ready_response_model, readiness_response_model),
+)
+async def readiness() -> Response:  # noqa: RUF029
+    if not _readiness.is_ready:
+        return not_ready_response_model.to_response()
+
+    return readiness_response_model.to_response()
@@ -5,3 +5,4 @@ class Tag(Enum):
     current_user_endpoints = "me"
     other_users_endpoints = "others"
     access_endpoints = "access"
+    service_endpoints = "service"
@@ -0,0 +1,48 @@
+import asyncio
+from contextlib import suppress
+
+from entrypoint.infrastructure.periphery import envs
+from entrypoint.logic.services.warm_up import warm_up
+
+
+class Readiness:
+    def __init__(self, *, retry_seconds: float) -> None:
+        self.__retry_seconds = retry_seconds
+        self.__is_ready = False
+        self.__warm_up_task: asyncio.Task[None] | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.__is_ready
+
+    async def warm_up(self) -> None:
+        if self.__is_ready or self.__warm_up_task is not None:
+            return
+
+        self.__is_ready = await warm_up()
+
+        if not self.__is_ready:
+            self.__warm_up_task = asyncio.create_task(self.__retry_warm_up())
+
+    async def stop(self) -> None:
+        self.__is_ready = False
+
+        if self.__warm_up_task is None:
+            return
+
+        self.__warm_up_task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self.__warm_up_task
+
+        self.__warm_up_task = None
+
+    async def __retry_warm_up(self) -> None:
+        await asyncio.sleep(self.__retry_seconds)
+        self.__is_ready = await warm_up()
+
+        if not self.__is_ready:
+            self.__warm_up_task = asyncio.create_task(self.__retry_warm_up())
+
+
+readiness = Readiness(retry_seconds=envs.warm_up_retry_seconds)
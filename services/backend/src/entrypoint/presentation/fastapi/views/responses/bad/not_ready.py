@@ -0,0 +1,21 @@
+from fastapi import status
+from pydantic import BaseModel
+
+from entrypoint.presentation.fastapi.views.responses.common.detail import (
+    Detail,
+    DetailPartSchema,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    ResponseModel,
+)
+
+
+class NotReadySchema(BaseModel):
+    detail: Detail = [
+        DetailPartSchema(type="NotReadyError", msg="warm-up is not done")
+    ]
+
+
+not_ready_response_model = ResponseModel(
+    NotReadySchema, status.HTTP_503_SERVICE_UNAVAILABLE
+)
@@ -0,0 +1,13 @@
+from fastapi import status
+from pydantic import BaseModel
+
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    ResponseModel,
+)
+
+
+class ReadinessSchema(BaseModel):
+    ready: bool = True
+
+
+readiness_response_model = ResponseModel(ReadinessSchema, status.HTTP_200_OK)
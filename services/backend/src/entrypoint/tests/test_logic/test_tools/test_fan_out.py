@@ -0,0 +1,71 @@
+import asyncio
+
+from pytest import raises
+
+from entrypoint.logic.tools.fan_out import fan_out
+
+
+class FirstError(Exception): ...
+
+
+class SecondError(Exception): ...
+
+
+async def test_with_results() -> None:
+    async def first() -> int:
+        await asyncio.sleep(0)
+        return 1
+
+    async def second() -> str:
+        await asyncio.sleep(0)
+        return "2"
+
+    assert await fan_out(first(), second()) == (1, "2")
+
+
+async def test_with_first_error() -> None:
+    async def first() -> None:
+        await asyncio.sleep(0)
+        raise FirstError
+
+    async def second() -> None:
+        await asyncio.sleep(0)
+
+    with raises(FirstError):
+        await fan_out(first(), second())
+
+
+async def test_with_both_errors() -> None:
+    async def first() -> None:
+        await asyncio.sleep(0)
+        raise FirstError
+
+    async def second() -> None:
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        raise SecondError
+
+    with raises(FirstError):
+        await fan_out(first(), second())
+
+
+async def test_with_cancelled_sibling() -> None:
+    is_second_cancelled = False
+
+    async def first() -> None:
+        await asyncio.sleep(0)
+        raise FirstError
+
+    async def second() -> None:
+        nonlocal is_second_cancelled
+
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            is_second_cancelled = True
+            raise
+
+    with raises(FirstError):
+        await asyncio.wait_for(fan_out(first(), second()), 1)
+
+    assert is_second_cancelled
@@ -0,0 +1,60 @@
+from uuid import UUID, uuid4
+
+from fastapi import Request
+from pytest import MonkeyPatch, fixture
+
+from entrypoint.logic.services.authenticate_user import Output
+from entrypoint.presentation.fastapi.controllers import authentication
+from entrypoint.presentation.fastapi.controllers.parsers import InvalidHexError
+
+
+@fixture
+def authenticated_session_ids(monkeypatch: MonkeyPatch) -> list[UUID]:
+    session_ids = list[UUID]()
+
+    async def authenticate_user(session_id: UUID) -> Output:  # noqa: RUF029
+        session_ids.append(session_id)
+        return "not_authenticated"
+
+    monkeypatch.setattr(authentication, "service", authenticate_user)
+    return session_ids
+
+
+async def test_with_reused_request(
+    authenticated_session_ids: list[UUID],
+) -> None:
+    session_id = uuid4()
+    request = Request({"type": "http", "headers": []})
+
+    first_result = await authentication.authentication_of(
+        request, session_id.hex
+    )
+    second_result = await authentication.authentication_of(
+        request, session_id.hex
+    )
+
+    assert first_result == second_result == "not_authenticated"
+    assert authenticated_session_ids == [session_id]
+
+
+async def test_with_different_requests(
+    authenticated_session_ids: list[UUID],
+) -> None:
+    session_id = uuid4()
+
+    for _ in range(2):
+        request = Request({"type": "http", "headers": []})
+        await authentication.authentication_of(request, session_id.hex)
+
+    assert authenticated_session_ids == [session_id, session_id]
+
+
+async def test_with_invalid_hex(
+    authenticated_session_ids: list[UUID],
+) -> None:
+    request = Request({"type": "http", "headers": []})
+
+    result = await authentication.authentication_of(request, "invalid")
+
+    assert isinstance(result, InvalidHexError)
+    assert not authenticated_session_ids
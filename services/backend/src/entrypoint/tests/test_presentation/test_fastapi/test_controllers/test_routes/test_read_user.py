@@ -0,0 +1,27 @@
+from uuid import UUID, uuid4
+
+from httpx import AsyncClient
+from pytest import MonkeyPatch
+
+from entrypoint.logic.services.authenticate_user import Output
+from entrypoint.presentation.fastapi.controllers import authentication
+
+
+async def test_with_single_authentication(
+    client: AsyncClient, monkeypatch: MonkeyPatch
+) -> None:
+    session_ids = list[UUID]()
+
+    async def authenticate_user(session_id: UUID) -> Output:  # noqa: RUF029
+        session_ids.append(session_id)
+        return "not_authenticated"
+
+    monkeypatch.setattr(authentication, "service", authenticate_user)
+    session_id = uuid4()
+
+    response = await client.get(
+        "/api/0.1v/user", headers={"Cookie": f"session_id={session_id}"}
+    )
+
+    assert response.status_code == 401
+    assert session_ids == [session_id]
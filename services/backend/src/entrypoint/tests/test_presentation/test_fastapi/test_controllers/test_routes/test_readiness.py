@@ -0,0 +1,55 @@
+from collections.abc import AsyncIterator
+
+from httpx import AsyncClient
+from pytest import MonkeyPatch, fixture, mark
+
+from entrypoint.presentation.fastapi import readiness as readiness_module
+from entrypoint.presentation.fastapi.readiness import readiness
+
+
+@fixture(autouse=True)
+async def warm_up_results(monkeypatch: MonkeyPatch) -> AsyncIterator[None]:
+    async def warm_up() -> bool:  # noqa: RUF029
+        return True
+
+    monkeypatch.setattr(readiness_module, "warm_up", warm_up)
+    await readiness.stop()
+    yield
+    await readiness.stop()
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_before_warm_up(stage: str, client: AsyncClient) -> None:
+    output_json = {
+        "detail": [{"type": "NotReadyError", "msg": "warm-up is not done"}]
+    }
+
+    response = await client.get("/api/0.1v/readiness")
+
+    if stage == "json":
+        assert response.json() == output_json
+
+    if stage == "status_code":
+        assert response.status_code == 503
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_after_warm_up(stage: str, client: AsyncClient) -> None:
+    await readiness.warm_up()
+
+    response = await client.get("/api/0.1v/readiness")
+
+    if stage == "json":
+        assert response.json() == {"ready": True}
+
+    if stage == "status_code":
+        assert response.status_code == 200
+
+
+async def test_after_stop(client: AsyncClient) -> None:
+    await readiness.warm_up()
+    await readiness.stop()
+
+    response = await client.get("/api/0.1v/readiness")
+
+    assert response.status_code == 503
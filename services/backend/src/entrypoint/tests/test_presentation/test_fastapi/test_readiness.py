@@ -0,0 +1,55 @@
+import asyncio
+
+from pytest import MonkeyPatch
+
+from entrypoint.presentation.fastapi import readiness as readiness_module
+from entrypoint.presentation.fastapi.readiness import Readiness
+
+
+async def test_with_failed_first_warm_up(monkeypatch: MonkeyPatch) -> None:
+    results = [False, False, True]
+    is_ready_after_retry = asyncio.Event()
+
+    async def warm_up() -> bool:  # noqa: RUF029
+        result = results.pop(0)
+
+        if result:
+            is_ready_after_retry.set()
+
+        return result
+
+    monkeypatch.setattr(readiness_module, "warm_up", warm_up)
+    readiness = Readiness(retry_seconds=0)
+
+    await readiness.warm_up()
+    is_ready_after_first_warm_up = readiness.is_ready
+
+    await asyncio.wait_for(is_ready_after_retry.wait(), 1)
+    await asyncio.sleep(0)
+    is_ready_after_last_warm_up = readiness.is_ready
+
+    await readiness.stop()
+
+    assert not is_ready_after_first_warm_up
+    assert is_ready_after_last_warm_up
+    assert not results
+    assert not readiness.is_ready
+
+
+async def test_with_repeated_warm_up(monkeypatch: MonkeyPatch) -> None:
+    warm_up_count = 0
+
+    async def warm_up() -> bool:  # noqa: RUF029
+        nonlocal warm_up_count
+
+        warm_up_count += 1
+        return True
+
+    monkeypatch.setattr(readiness_module, "warm_up", warm_up)
+    readiness = Readiness(retry_seconds=0)
+
+    await readiness.warm_up()
+    await readiness.warm_up()
+
+    assert readiness.is_ready
+    assert warm_up_count == 1